@@ -73,6 +73,15 @@ async def cleanup_all_resources():
     except Exception as e:
         logger.warning(f"Error closing broker: {e}")
     
+    # Close shared data source HTTP clients and background refreshes
+    try:
+        from src.data_sources.ainvest import close_http_clients
+        from src.data_sources.commodities import get_commodity_source
+        await close_http_clients()
+        await get_commodity_source().disconnect()
+    except Exception as e:
+        logger.warning(f"Error closing data source clients: {e}")
+    
     logger.info("All resources cleaned up")
 
 
@@ -4,6 +4,7 @@ API routes for commodity and resource trading.
 
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -181,7 +182,8 @@ async def get_commodity_symbols() -> dict:
         from src.data_sources.commodities import get_commodity_source
         
         source = get_commodity_source()
-        return source.get_supported_commodities()
+        # The tables are read-only views; encode them into plain JSON types
+        return jsonable_encoder(source.get_supported_commodities())
         
     except Exception as e:
         logger.error(f"Error fetching commodity symbols: {e}")
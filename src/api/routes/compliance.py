@@ -6,7 +6,7 @@ and violation history.
 """
 
 from typing import Dict, Any, Optional, List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from src.compliance import (
@@ -62,7 +62,7 @@ class ComplianceSettingsRequest(BaseModel):
 # =========================================================================
 
 @router.get("/status")
-async def get_compliance_status() -> Dict[str, Any]:
+async def get_compliance_status() -> Response:
     """
     Get current compliance status.
     
@@ -70,7 +70,7 @@ async def get_compliance_status() -> Dict[str, Any]:
         Current PDT status, restrictions, and trading status.
     """
     compliance = get_compliance_manager()
-    return compliance.get_status()
+    return Response(content=compliance.get_status_json(), media_type="application/json")
 
 
 @router.get("/day-trades")
@@ -118,11 +118,10 @@ async def get_violations(limit: int = 20) -> Dict[str, Any]:
         List of recent violations and warnings.
     """
     compliance = get_compliance_manager()
-    violations = compliance._violations[-limit:]
     
     return {
-        "violations": [v.to_dict() for v in violations],
-        "total_count": len(compliance._violations),
+        "violations": compliance.get_violations(limit),
+        "total_count": compliance.violation_count,
     }
 
 
@@ -605,21 +605,7 @@ async def get_ainvest_recommendations(
     
     return {
         "count": len(recommendations),
-        "recommendations": [
-            {
-                "symbol": r.symbol,
-                "company": r.company,
-                "ai_score": r.ai_score,
-                "recommendation": r.recommendation,
-                "target_price": r.target_price,
-                "current_price": r.current_price,
-                "upside_pct": r.upside_pct,
-                "signals": r.signals,
-                "confidence": r.confidence,
-                "analysis_date": r.analysis_date.isoformat(),
-            }
-            for r in recommendations
-        ]
+        "recommendations": [r.to_dict() for r in recommendations]
     }
 
 
@@ -634,15 +620,7 @@ async def get_ainvest_sentiment(symbol: str) -> Dict[str, Any]:
     sentiment = await ainvest.get_sentiment(symbol.upper())
     
     if sentiment:
-        return {
-            "symbol": sentiment.symbol,
-            "overall_sentiment": sentiment.overall_sentiment,
-            "news_sentiment": sentiment.news_sentiment,
-            "social_sentiment": sentiment.social_sentiment,
-            "analyst_sentiment": sentiment.analyst_sentiment,
-            "volume_sentiment": sentiment.volume_sentiment,
-            "last_updated": sentiment.last_updated.isoformat(),
-        }
+        return sentiment.to_dict()
     else:
         raise HTTPException(404, f"No sentiment data for {symbol}")
 
@@ -694,21 +672,7 @@ async def get_ainvest_insider_trades(limit: int = 100) -> Dict[str, Any]:
     
     return {
         "count": len(trades),
-        "trades": [
-            {
-                "symbol": t.symbol,
-                "insider_name": t.insider_name,
-                "title": t.title,
-                "transaction_type": t.transaction_type,
-                "value": t.value,
-                "shares": t.shares,
-                "price": t.price,
-                "shares_owned_after": t.shares_owned_after,
-                "transaction_date": t.transaction_date.isoformat(),
-                "filing_date": t.filing_date.isoformat(),
-            }
-            for t in trades
-        ]
+        "trades": [t.to_dict() for t in trades]
     }
 
 
@@ -11,6 +11,7 @@ from src.compliance.compliance_manager import (
     ComplianceAction,
     ViolationType,
     AccountType,
+    Side,
     DayTrade,
     get_compliance_manager,
     reset_compliance_manager,
@@ -23,6 +24,7 @@ __all__ = [
     "ComplianceAction",
     "ViolationType",
     "AccountType",
+    "Side",
     "DayTrade",
     "get_compliance_manager",
     "reset_compliance_manager",
@@ -16,13 +16,23 @@ Regulations Covered:
 - Enhanced monitoring requirements
 """
 
+import bisect
+import heapq
+import threading
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-from enum import Enum
-from typing import Optional, List, Dict, Any
-from collections import defaultdict
+from enum import Enum, IntEnum
+from itertools import count as _counter, islice
+from operator import attrgetter
+from typing import Optional, List, Dict, Any, Tuple, Callable, Sequence, TYPE_CHECKING
+from collections import defaultdict, deque
 
-from loguru import logger
+import numpy as np
+import orjson
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ViolationType(str, Enum):
@@ -53,7 +63,48 @@ class ComplianceAction(str, Enum):
     STOP_DAY = "stop_day"  # Stop trading for the day
 
 
-@dataclass
+# Severity order of violation actions, used to pick the overall result
+_ACTION_RANK: Dict[ComplianceAction, int] = {
+    ComplianceAction.WARN: 0,
+    ComplianceAction.CONFIRM: 1,
+    ComplianceAction.STOP_DAY: 2,
+    ComplianceAction.BLOCK: 3,
+}
+
+# Regulation references shared by every violation of the same kind
+_REG_INTERNAL = "Internal Risk Control"
+_REG_ACCOUNT_RESTRICTION = "FINRA Rule 4210 / Reg T"
+_REG_PDT = "FINRA Rule 4210 (Pattern Day Trader)"
+_REG_FINRA_4210 = "FINRA Rule 4210"
+_REG_GOOD_FAITH = "Regulation T / FINRA"
+_REG_T = "Regulation T"
+_REG_MARGIN = "FINRA Margin Rules"
+_REG_WASH_SALE = "IRS Wash Sale Rule (Section 1091)"
+
+
+class Side(IntEnum):
+    """Order side, normalized once at the public entry points."""
+    BUY = 0
+    SELL = 1
+
+
+_SIDES: Dict[str, Side] = {
+    "buy": Side.BUY,
+    "sell": Side.SELL,
+    "BUY": Side.BUY,
+    "SELL": Side.SELL,
+}
+
+
+def _parse_side(side: str) -> Optional[Side]:
+    """Map a 'buy'/'sell' string (any case) to a Side; None if unknown."""
+    parsed = _SIDES.get(side)
+    if parsed is None:
+        parsed = _SIDES.get(side.lower())
+    return parsed
+
+
+@dataclass(slots=True)
 class DayTrade:
     """Record of a day trade (open and close same day)."""
     symbol: str
@@ -69,7 +120,7 @@ class DayTrade:
         self.pnl = (self.sell_price - self.buy_price) * self.quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class UnsettledPosition:
     """Track unsettled securities."""
     symbol: str
@@ -80,7 +131,11 @@ class UnsettledPosition:
     
     @property
     def is_settled(self) -> bool:
-        return date.today() >= self.settlement_date
+        return self.is_settled_on(date.today())
+    
+    def is_settled_on(self, today: date) -> bool:
+        """Whether the position has settled as of ``today``."""
+        return today >= self.settlement_date
 
 
 @dataclass
@@ -96,6 +151,7 @@ class ComplianceViolation:
     timestamp: datetime = field(default_factory=datetime.now)
     
     def to_dict(self) -> Dict[str, Any]:
+        # Built fresh each call so callers can't mutate the record through it
         return {
             "type": self.type.value,
             "severity": self.severity,
@@ -103,18 +159,91 @@ class ComplianceViolation:
             "title": self.title,
             "description": self.description,
             "regulation": self.regulation,
-            "details": self.details,
+            "details": dict(self.details),
             "timestamp": self.timestamp.isoformat(),
         }
 
 
+class _TradeWindow:
+    """
+    Time-sorted trades for one symbol and side, with prefix sums.
+    
+    ``cum_qty[i]`` / ``cum_notional[i]`` hold the totals of every trade
+    before index ``i``, so the totals for any time window are a bisect and
+    two subtractions instead of a scan.
+    """
+    
+    __slots__ = ("times", "cum_qty", "cum_notional")
+    
+    def __init__(self) -> None:
+        self.times: List[datetime] = []
+        # Unboxed doubles: per-trade quantities/notionals are recoverable
+        # as differences of adjacent prefix sums, so only the sums are kept
+        self.cum_qty = array("d", (0.0,))
+        self.cum_notional = array("d", (0.0,))
+    
+    def __len__(self) -> int:
+        return len(self.times)
+    
+    def add(self, timestamp: datetime, quantity: float, price: float) -> None:
+        notional = quantity * price
+        times = self.times
+        cum_qty, cum_notional = self.cum_qty, self.cum_notional
+        if not times or timestamp >= times[-1]:
+            times.append(timestamp)
+            cum_qty.append(cum_qty[-1] + quantity)
+            cum_notional.append(cum_notional[-1] + notional)
+            return
+        
+        # Back-dated trade: insert in order and shift the sums after it
+        idx = bisect.bisect_right(times, timestamp)
+        times.insert(idx, timestamp)
+        cum_qty.insert(idx + 1, cum_qty[idx])
+        cum_notional.insert(idx + 1, cum_notional[idx])
+        for j in range(idx + 1, len(cum_qty)):
+            cum_qty[j] += quantity
+            cum_notional[j] += notional
+    
+    def trim(self, cutoff: datetime) -> None:
+        """Drop trades older than ``cutoff``."""
+        times = self.times
+        if not times or times[0] >= cutoff:
+            return
+        k = bisect.bisect_left(times, cutoff)
+        del times[:k], self.cum_qty[:k], self.cum_notional[:k]
+    
+    def totals_since(self, start: datetime) -> Optional[Tuple[float, float]]:
+        """(quantity, notional) of trades at or after ``start``; None if none."""
+        lo = bisect.bisect_left(self.times, start)
+        if lo == len(self.times):
+            return None
+        return (
+            self.cum_qty[-1] - self.cum_qty[lo],
+            self.cum_notional[-1] - self.cum_notional[lo],
+        )
+
+
+def _compact(items: list, keep: Callable[[Any], bool]) -> None:
+    """Filter ``items`` in place, preserving order, without a new list."""
+    write = 0
+    for item in items:
+        if keep(item):
+            items[write] = item
+            write += 1
+    del items[write:]
+
+
+# Shared empty sequence for the common no-violation / no-warning results
+_EMPTY: Tuple[()] = ()
+
+
 @dataclass
 class ComplianceCheckResult:
     """Result of a pre-trade compliance check."""
     allowed: bool
     action: ComplianceAction
-    violations: List[ComplianceViolation] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    violations: Sequence[ComplianceViolation] = _EMPTY
+    warnings: Sequence[str] = _EMPTY
     requires_confirmation: bool = False
     stop_trading: bool = False
     
@@ -123,12 +252,27 @@ class ComplianceCheckResult:
             "allowed": self.allowed,
             "action": self.action.value,
             "violations": [v.to_dict() for v in self.violations],
-            "warnings": self.warnings,
+            "warnings": list(self.warnings),
             "requires_confirmation": self.requires_confirmation,
             "stop_trading": self.stop_trading,
         }
 
 
+@dataclass
+class _OrderContext:
+    """Normalized inputs shared by the pre-trade checks of one order."""
+    symbol: str
+    side: Side
+    quantity: float
+    order_value: float
+    is_closing: bool
+    now: datetime
+    today: date
+
+
+_OrderCheck = Callable[[_OrderContext], Optional[ComplianceViolation]]
+
+
 class ComplianceManager:
     """
     Manages trading compliance and regulatory requirements.
@@ -158,6 +302,13 @@ class ComplianceManager:
     STOCK_SETTLEMENT_DAYS = 1  # T+1
     OPTIONS_SETTLEMENT_DAYS = 1  # T+1
     
+    # Violation history retention
+    MAX_VIOLATION_HISTORY = 1024
+    STATUS_RECENT_VIOLATIONS = 10
+    
+    # Exchange holidays skipped in business-day arithmetic (weekends always are)
+    MARKET_HOLIDAYS: Tuple[date, ...] = ()
+    
     # Cash account restrictions
     GOOD_FAITH_RESTRICTION_DAYS = 90
     FREERIDING_RESTRICTION_DAYS = 90
@@ -165,6 +316,54 @@ class ComplianceManager:
     # Wash sale rule
     WASH_SALE_WINDOW_DAYS = 30
     
+    # Trade history kept for wash sale detection
+    TRADE_HISTORY_RETENTION_DAYS = 60
+    
+    # Violation description templates, formatted with str.format_map
+    _PDT_BLOCK_TEMPLATE = (
+        "You have made {count} day trades in the last 5 business days. "
+        "FINRA rules require $25,000 minimum equity to continue day trading. "
+        "Your equity: ${equity:,.2f}"
+    )
+    _PDT_CONFIRM_TEMPLATE = (
+        "This would be your {after}th day trade in 5 business days. "
+        "Proceeding will flag your account as a Pattern Day Trader, requiring "
+        "$25,000 minimum equity. Your equity: ${equity:,.2f}"
+    )
+    _PDT_WARN_TITLE_TEMPLATE = "PDT Alert: {remaining} Day Trade(s) Remaining"
+    _PDT_WARN_TEMPLATE = (
+        "You have made {count} day trades in the last 5 business days. "
+        "You have {remaining} day trade(s) remaining before triggering PDT rules."
+    )
+    _PDT_TRIGGERED_TEMPLATE = (
+        "You have been flagged as a Pattern Day Trader ({count} day trades "
+        "in 5 business days). Trading is stopped for today. You must maintain "
+        "$25,000 minimum equity to continue day trading."
+    )
+    _TRADING_STOPPED_TEMPLATE = "Trading has been stopped for today: {reason}"
+    _RESTRICTED_TEMPLATE = "Account is restricted until {until} due to {kind} violation."
+    _GOOD_FAITH_TEMPLATE = (
+        "You are attempting to sell {quantity} shares of {symbol} that have not "
+        "settled yet. Selling securities before settlement (T+{settlement_days}) "
+        "may result in a Good Faith Violation. Three violations in 12 months will "
+        "result in a 90-day cash-upfront restriction."
+    )
+    _FREERIDING_TEMPLATE = (
+        "This purchase of ${order_value:,.2f} uses unsettled proceeds from recent sales. "
+        "If you sell this position before your sale proceeds settle (T+{settlement_days}), "
+        "you may incur a Freeriding Violation, resulting in a 90-day restriction."
+    )
+    _DTBP_TEMPLATE = (
+        "This order of ${order_value:,.2f} exceeds your remaining Day Trading "
+        "Buying Power of ${remaining:,.2f}. Exceeding DTBP will result in "
+        "a margin call requiring immediate deposit."
+    )
+    _WASH_SALE_TEMPLATE = (
+        "You sold {symbol} at a loss within 30 days of purchasing. If you "
+        "repurchase {symbol} (or substantially identical security) within the "
+        "next 30 days, this loss may be disallowed for tax purposes (Wash Sale Rule)."
+    )
+    
     def __init__(
         self,
         account_type: str = "margin",
@@ -173,27 +372,54 @@ class ComplianceManager:
         day_trading_buying_power: float = 0.0,
         is_pattern_day_trader: bool = False,
     ):
-        self.account_type = AccountType(account_type.lower())
-        self.equity = equity
+        self._account_type = AccountType(account_type.lower())
+        self._busdaycal = np.busdaycalendar(holidays=list(self.MARKET_HOLIDAYS))
+        
+        # Day-count windows, built once rather than on every trade/check
+        self._wash_sale_window = timedelta(days=self.WASH_SALE_WINDOW_DAYS)
+        self._history_window = 2 * self._wash_sale_window
+        self._history_retention = timedelta(days=self.TRADE_HISTORY_RETENTION_DAYS)
+        self._equity = equity
         self.buying_power = buying_power
-        self.day_trading_buying_power = day_trading_buying_power
-        self.is_pattern_day_trader = is_pattern_day_trader
+        self._day_trading_buying_power = day_trading_buying_power
+        self._is_pattern_day_trader = is_pattern_day_trader
         
-        # Day trade tracking
-        self._day_trades: List[DayTrade] = []
+        # Day trade tracking (append-only by date, trimmed to the PDT window)
+        self._day_trades: deque[DayTrade] = deque()
         self._today_day_trades = 0
         
+        # Day trading buying power used, summed per trade date
+        self._dtbp_by_date: Dict[date, float] = {}
+        
+        # Memoized PDT count: bumped on every day-trade mutation and keyed
+        # by (version, today) so status polling skips the window math
+        self._day_trades_version = 0
+        self._day_trade_count_cache: Optional[Tuple[int, date, int]] = None
+        
         # Position tracking for intraday
         self._intraday_positions: Dict[str, Dict] = {}  # symbol -> {quantity, avg_price, open_time}
         
-        # Unsettled positions (cash accounts)
-        self._unsettled_positions: List[UnsettledPosition] = []
+        # Unsettled positions (cash accounts), indexed by symbol and by a
+        # min-heap of (settlement_date, seq, position) for expiry
+        self._unsettled_by_symbol: Dict[str, List[UnsettledPosition]] = defaultdict(list)
+        self._unsettled_heap: List[Tuple[date, int, UnsettledPosition]] = []
+        self._unsettled_seq = _counter()
+        self._unsettled_count = 0
         
-        # Trade history for wash sale detection
-        self._trade_history: Dict[str, List[Dict]] = defaultdict(list)  # symbol -> trades
+        # Unsettled sale proceeds (cash accounts): min-heap of
+        # (settlement_date, proceeds) plus a running total
+        self._unsettled_sale_heap: List[tuple[date, float]] = []
+        self._unsettled_proceeds_total = 0.0
         
-        # Violation history
-        self._violations: List[ComplianceViolation] = []
+        # Trade history for wash sale detection, split by side and kept
+        # sorted by time with prefix sums: symbol -> _TradeWindow
+        self._buys_by_symbol: Dict[str, _TradeWindow] = defaultdict(_TradeWindow)
+        self._sells_by_symbol: Dict[str, _TradeWindow] = defaultdict(_TradeWindow)
+        
+        # Violation history (bounded archive, plus the last few for status)
+        self._violations: deque[ComplianceViolation] = deque(maxlen=self.MAX_VIOLATION_HISTORY)
+        self._recent_violations: deque[ComplianceViolation] = deque(maxlen=self.STATUS_RECENT_VIOLATIONS)
+        self._violation_total = 0
         
         # Restrictions
         self._restricted_until: Optional[date] = None
@@ -202,6 +428,75 @@ class ComplianceManager:
         # Auto-stop flag
         self._trading_stopped = False
         self._stop_reason: Optional[str] = None
+        
+        # Pre-trade checks that apply to this account, per order side
+        self._order_checks: Dict[Side, List[_OrderCheck]] = {}
+        self._specialize_checks()
+    
+    @property
+    def account_type(self) -> AccountType:
+        return self._account_type
+    
+    @account_type.setter
+    def account_type(self, value: AccountType) -> None:
+        # Coerce once so internal checks can compare members by identity
+        self._account_type = AccountType(value)
+        self._specialize_checks()
+    
+    # Equity and PDT status decide which checks apply, so writing any of
+    # them rebuilds the pipeline
+    
+    @property
+    def equity(self) -> float:
+        return self._equity
+    
+    @equity.setter
+    def equity(self, value: float) -> None:
+        self._equity = value
+        self._specialize_checks()
+    
+    @property
+    def is_pattern_day_trader(self) -> bool:
+        return self._is_pattern_day_trader
+    
+    @is_pattern_day_trader.setter
+    def is_pattern_day_trader(self, value: bool) -> None:
+        self._is_pattern_day_trader = value
+        self._specialize_checks()
+    
+    @property
+    def day_trading_buying_power(self) -> float:
+        return self._day_trading_buying_power
+    
+    @day_trading_buying_power.setter
+    def day_trading_buying_power(self, value: float) -> None:
+        self._day_trading_buying_power = value
+        self._specialize_checks()
+    
+    def _specialize_checks(self) -> None:
+        """
+        Select the pre-trade checks that can fire for the current account.
+        
+        Rebuilt whenever the account type, equity or PDT status changes so
+        check_order only runs rules that apply instead of re-testing the
+        account type and side in every sub-check.
+        """
+        buy_checks: List[_OrderCheck] = []
+        sell_checks: List[_OrderCheck] = []
+        
+        if self._account_type is AccountType.MARGIN:
+            # PDT only applies to margin accounts under $25k
+            if self.equity < self.PDT_EQUITY_MINIMUM:
+                buy_checks.append(self._check_pdt_preorder)
+                sell_checks.append(self._check_pdt_preorder)
+            if self.is_pattern_day_trader and self.day_trading_buying_power > 0:
+                buy_checks.append(self._check_day_trading_buying_power)
+        elif self._account_type is AccountType.CASH:
+            sell_checks.append(self._check_good_faith)
+            buy_checks.append(self._check_freeriding)
+        
+        self._order_checks = {Side.BUY: buy_checks, Side.SELL: sell_checks}
+        self._get_status_fast = self._compile_status_fn()
     
     def update_account(
         self,
@@ -212,13 +507,16 @@ class ComplianceManager:
     ) -> None:
         """Update account information."""
         if equity is not None:
-            self.equity = equity
+            self._equity = equity
         if buying_power is not None:
             self.buying_power = buying_power
         if day_trading_buying_power is not None:
-            self.day_trading_buying_power = day_trading_buying_power
+            self._day_trading_buying_power = day_trading_buying_power
         if is_pattern_day_trader is not None:
-            self.is_pattern_day_trader = is_pattern_day_trader
+            self._is_pattern_day_trader = is_pattern_day_trader
+        
+        # One rebuild for the whole update rather than one per field
+        self._specialize_checks()
     
     def record_trade(
         self,
@@ -241,19 +539,89 @@ class ComplianceManager:
         Returns:
             List of any violations triggered
         """
-        timestamp = timestamp or datetime.now()
+        # Paper trading has no compliance state to maintain
+        if self._account_type is AccountType.PAPER:
+            return []
+        
+        now = self._now()
+        return self._record_trade(
+            symbol, _parse_side(side), quantity, price, timestamp or now, now,
+        )
+    
+    def record_trades_bulk(
+        self,
+        symbols: Sequence[str],
+        sides: Sequence[str],
+        quantities: Sequence[float],
+        prices: Sequence[float],
+        timestamps: Sequence[datetime],
+    ) -> List[ComplianceViolation]:
+        """
+        Record many trades at once, e.g. when replaying a persisted trade log.
+        
+        Columns are parallel sequences. Trades are applied in timestamp order;
+        ordering and settlement dates are computed with NumPy for the whole
+        batch, leaving only the stateful bookkeeping per trade.
+        
+        Args:
+            symbols: Stock symbols
+            sides: 'buy' or 'sell' for each trade
+            quantities: Number of shares for each trade
+            prices: Execution prices
+            timestamps: Trade times
+            
+        Returns:
+            List of all violations triggered, in trade order
+        """
+        n = len(timestamps)
+        if not (len(symbols) == len(sides) == len(quantities) == len(prices) == n):
+            raise ValueError("record_trades_bulk columns must have the same length")
+        if n == 0 or self._account_type is AccountType.PAPER:
+            return []
+        
+        times = np.asarray(timestamps, dtype="datetime64[us]")
+        order = np.argsort(times, kind="stable")
+        settlement_dates = self._settlement_dates(times.astype("datetime64[D]"))
+        quantities = np.asarray(quantities, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        
+        now = self._now()
+        violations: List[ComplianceViolation] = []
+        for i in order.tolist():
+            violations.extend(self._record_trade(
+                symbols[i],
+                _parse_side(sides[i]),
+                float(quantities[i]),
+                float(prices[i]),
+                timestamps[i],
+                now,
+                settlement_dates[i].item(),
+            ))
+        
+        return violations
+    
+    def _record_trade(
+        self,
+        symbol: str,
+        side: Optional[Side],
+        quantity: float,
+        price: float,
+        timestamp: datetime,
+        now: datetime,
+        settlement_date: Optional[date] = None,
+    ) -> List[ComplianceViolation]:
+        """Apply one trade to the compliance state (see record_trade)."""
+        today = now.date()
         trade_date = timestamp.date()
         violations = []
         
-        # Record in trade history for wash sale detection
-        self._trade_history[symbol].append({
-            "side": side,
-            "quantity": quantity,
-            "price": price,
-            "timestamp": timestamp,
-        })
+        if settlement_date is None and self._account_type is AccountType.CASH:
+            settlement_date = self._calculate_settlement_date(trade_date)
         
-        if side.lower() == "buy":
+        if side is Side.BUY:
+            # Record in trade history for wash sale detection
+            self._append_history(self._buys_by_symbol[symbol], timestamp, quantity, price)
+            
             # Track intraday position
             if symbol in self._intraday_positions:
                 # Add to existing position
@@ -270,17 +638,30 @@ class ComplianceManager:
                 }
             
             # For cash accounts, track unsettled position
-            if self.account_type == AccountType.CASH:
-                settlement_date = self._calculate_settlement_date(trade_date)
-                self._unsettled_positions.append(UnsettledPosition(
+            if self._account_type is AccountType.CASH:
+                position = UnsettledPosition(
                     symbol=symbol,
                     quantity=quantity,
                     purchase_date=trade_date,
                     settlement_date=settlement_date,
                     cost_basis=quantity * price,
-                ))
-        
-        elif side.lower() == "sell":
+                )
+                self._unsettled_by_symbol[symbol].append(position)
+                heapq.heappush(
+                    self._unsettled_heap,
+                    (settlement_date, next(self._unsettled_seq), position),
+                )
+                self._unsettled_count += 1
+        
+        elif side is Side.SELL:
+            self._append_history(self._sells_by_symbol[symbol], timestamp, quantity, price)
+            
+            # For cash accounts, sale proceeds are unsettled until T+1
+            if self._account_type is AccountType.CASH:
+                proceeds = quantity * price
+                heapq.heappush(self._unsettled_sale_heap, (settlement_date, proceeds))
+                self._unsettled_proceeds_total += proceeds
+            
             # Check if this closes an intraday position (day trade)
             if symbol in self._intraday_positions:
                 pos = self._intraday_positions[symbol]
@@ -296,13 +677,15 @@ class ComplianceManager:
                         buy_price=pos["avg_price"],
                         sell_price=price,
                     )
-                    self._day_trades.append(day_trade)
+                    self._add_day_trade(day_trade)
                     self._today_day_trades += 1
+                    self._evict_old_day_trades(self._pdt_window_start(today))
                     
-                    # Check PDT implications
-                    pdt_check = self._check_pdt_after_trade()
-                    if pdt_check:
-                        violations.append(pdt_check)
+                    # Check PDT implications (margin accounts only)
+                    if self._account_type is AccountType.MARGIN:
+                        pdt_check = self._check_pdt_after_trade(now)
+                        if pdt_check:
+                            violations.append(pdt_check)
                 
                 # Update or remove position
                 remaining = pos["quantity"] - quantity
@@ -312,15 +695,35 @@ class ComplianceManager:
                     pos["quantity"] = remaining
             
             # Check wash sale
-            wash_sale = self._check_wash_sale(symbol, side, quantity, price, timestamp)
+            wash_sale = self._check_wash_sale(symbol, side, quantity, price, timestamp, now)
             if wash_sale:
                 violations.append(wash_sale)
         
         # Store violations
-        self._violations.extend(violations)
+        if violations:
+            self._violations.extend(violations)
+            self._recent_violations.extend(violations)
+            self._violation_total += len(violations)
         
         return violations
     
+    def _append_history(
+        self,
+        trades: _TradeWindow,
+        timestamp: datetime,
+        quantity: float,
+        price: float,
+    ) -> None:
+        """
+        Insert a trade into a symbol's history, bounding its size.
+        
+        Trades older than twice the wash-sale window before the new trade
+        can no longer affect any check, so they are dropped here rather
+        than waiting for reset_daily.
+        """
+        trades.add(timestamp, quantity, price)
+        trades.trim(timestamp - self._history_window)
+    
     def check_order(
         self,
         symbol: str,
@@ -342,80 +745,88 @@ class ComplianceManager:
         Returns:
             ComplianceCheckResult with violations and required actions
         """
-        violations = []
-        warnings = []
-        
         # Paper trading has no compliance requirements
-        if self.account_type == AccountType.PAPER:
+        if self._account_type is AccountType.PAPER:
             return ComplianceCheckResult(
                 allowed=True,
                 action=ComplianceAction.ALLOW,
             )
         
+        # Read the clock once for every sub-check
+        now = self._now()
+        today = now.date()
+        
         # Check if trading is stopped
         if self._trading_stopped:
-            violations.append(ComplianceViolation(
+            violation = ComplianceViolation(
                 type=ViolationType.PDT_VIOLATION,
                 severity="critical",
                 action=ComplianceAction.BLOCK,
                 title="Trading Stopped",
-                description=f"Trading has been stopped for today: {self._stop_reason}",
-                regulation="Internal Risk Control",
-            ))
+                description=self._TRADING_STOPPED_TEMPLATE.format_map({"reason": self._stop_reason}),
+                regulation=_REG_INTERNAL,
+                timestamp=now,
+            )
             return ComplianceCheckResult(
                 allowed=False,
                 action=ComplianceAction.BLOCK,
-                violations=violations,
+                violations=[violation],
                 stop_trading=True,
             )
         
         # Check account restrictions
-        if self._restricted_until and date.today() < self._restricted_until:
-            violations.append(ComplianceViolation(
+        if self._restricted_until and today < self._restricted_until:
+            violation = ComplianceViolation(
                 type=ViolationType.FREERIDING if self._restriction_type == "freeriding" else ViolationType.GOOD_FAITH,
                 severity="critical",
                 action=ComplianceAction.BLOCK,
                 title=f"Account Restricted",
-                description=f"Account is restricted until {self._restricted_until} due to {self._restriction_type} violation.",
-                regulation="FINRA Rule 4210 / Reg T",
+                description=self._RESTRICTED_TEMPLATE.format_map(
+                    {"until": self._restricted_until, "kind": self._restriction_type}
+                ),
+                regulation=_REG_ACCOUNT_RESTRICTION,
                 details={"restriction_ends": self._restricted_until.isoformat()},
-            ))
+                timestamp=now,
+            )
             return ComplianceCheckResult(
                 allowed=False,
                 action=ComplianceAction.BLOCK,
-                violations=violations,
+                violations=[violation],
             )
         
-        # 1. Pattern Day Trader (PDT) Check
-        pdt_violations = self._check_pdt_preorder(symbol, side, is_closing)
-        violations.extend(pdt_violations)
-        
-        # 2. Good Faith Violation Check (Cash Accounts)
-        if self.account_type == AccountType.CASH and side.lower() == "sell":
-            gfv = self._check_good_faith(symbol, quantity)
-            if gfv:
-                violations.append(gfv)
-        
-        # 3. Freeriding Check (Cash Accounts)
-        if self.account_type == AccountType.CASH and side.lower() == "buy":
-            freeride = self._check_freeriding(quantity * estimated_price)
-            if freeride:
-                violations.append(freeride)
-        
-        # 4. Day Trading Buying Power Check (Margin Accounts)
-        if self.account_type == AccountType.MARGIN and side.lower() == "buy":
-            dtbp = self._check_day_trading_buying_power(quantity * estimated_price)
-            if dtbp:
-                violations.append(dtbp)
+        # 1-4. Account-specific checks: PDT, Good Faith, Freeriding, DTBP
+        side = _parse_side(side)
+        ctx = _OrderContext(
+            symbol=symbol,
+            side=side,
+            quantity=quantity,
+            order_value=quantity * estimated_price,
+            is_closing=is_closing,
+            now=now,
+            today=today,
+        )
+        violations: Sequence[ComplianceViolation] = _EMPTY
+        for check in self._order_checks.get(side, _EMPTY):
+            violation = check(ctx)
+            if violation:
+                violations = [*violations, violation]
         
         # 5. Wash Sale Warning
-        if side.lower() == "buy":
-            wash_sale = self._check_wash_sale_preorder(symbol)
+        warnings: Sequence[str] = _EMPTY
+        if side is Side.BUY:
+            wash_sale = self._check_wash_sale_preorder(symbol, now)
             if wash_sale:
-                warnings.append(wash_sale)
+                warnings = [wash_sale]
+        
+        # Determine action based on the most severe violation (single pass)
+        mask = 0
+        for v in violations:
+            rank = _ACTION_RANK.get(v.action)
+            if rank is not None:
+                mask |= 1 << rank
+        worst = mask.bit_length() - 1
         
-        # Determine action based on violations
-        if any(v.action == ComplianceAction.BLOCK for v in violations):
+        if worst == _ACTION_RANK[ComplianceAction.BLOCK]:
             return ComplianceCheckResult(
                 allowed=False,
                 action=ComplianceAction.BLOCK,
@@ -423,7 +834,7 @@ class ComplianceManager:
                 warnings=warnings,
             )
         
-        if any(v.action == ComplianceAction.STOP_DAY for v in violations):
+        if worst == _ACTION_RANK[ComplianceAction.STOP_DAY]:
             self._stop_trading("PDT threshold reached")
             return ComplianceCheckResult(
                 allowed=False,
@@ -433,7 +844,7 @@ class ComplianceManager:
                 stop_trading=True,
             )
         
-        if any(v.action == ComplianceAction.CONFIRM for v in violations):
+        if worst == _ACTION_RANK[ComplianceAction.CONFIRM]:
             return ComplianceCheckResult(
                 allowed=True,
                 action=ComplianceAction.CONFIRM,
@@ -442,7 +853,7 @@ class ComplianceManager:
                 requires_confirmation=True,
             )
         
-        if any(v.action == ComplianceAction.WARN for v in violations):
+        if worst == _ACTION_RANK[ComplianceAction.WARN]:
             return ComplianceCheckResult(
                 allowed=True,
                 action=ComplianceAction.WARN,
@@ -456,110 +867,96 @@ class ComplianceManager:
             warnings=warnings,
         )
     
-    def _check_pdt_preorder(
-        self,
-        symbol: str,
-        side: str,
-        is_closing: bool,
-    ) -> List[ComplianceViolation]:
-        """Check Pattern Day Trader rule before order."""
-        violations = []
-        
-        # Only applies to margin accounts with < $25k equity
-        if self.account_type != AccountType.MARGIN:
-            return violations
-        
-        if self.equity >= self.PDT_EQUITY_MINIMUM:
-            # Account meets PDT equity requirement
-            return violations
+    def _check_pdt_preorder(self, ctx: _OrderContext) -> Optional[ComplianceViolation]:
+        """
+        Check Pattern Day Trader rule before order.
         
+        Only scheduled for margin accounts with < $25k equity.
+        """
         # Check if this would be a day trade
         is_potential_day_trade = False
-        if side.lower() == "sell" and symbol in self._intraday_positions:
-            pos = self._intraday_positions[symbol]
-            if pos["open_time"].date() == date.today():
+        if ctx.side is Side.SELL and ctx.symbol in self._intraday_positions:
+            pos = self._intraday_positions[ctx.symbol]
+            if pos["open_time"].date() == ctx.today:
                 is_potential_day_trade = True
-        elif side.lower() == "buy" and is_closing:
+        elif ctx.side is Side.BUY and ctx.is_closing:
             # Short covering same day
             is_potential_day_trade = True
         
         if not is_potential_day_trade:
-            return violations
+            return None
         
         # Count day trades in last 5 business days
-        day_trades_count = self._count_recent_day_trades()
+        day_trades_count = self._count_recent_day_trades(ctx.today)
         
         if day_trades_count >= self.PDT_THRESHOLD:
             # Already PDT - block
-            violations.append(ComplianceViolation(
+            return ComplianceViolation(
                 type=ViolationType.PDT_VIOLATION,
                 severity="critical",
                 action=ComplianceAction.BLOCK,
                 title="Pattern Day Trader Threshold Exceeded",
-                description=(
-                    f"You have made {day_trades_count} day trades in the last 5 business days. "
-                    f"FINRA rules require $25,000 minimum equity to continue day trading. "
-                    f"Your equity: ${self.equity:,.2f}"
+                description=self._PDT_BLOCK_TEMPLATE.format_map(
+                    {"count": day_trades_count, "equity": self.equity}
                 ),
-                regulation="FINRA Rule 4210 (Pattern Day Trader)",
+                regulation=_REG_PDT,
                 details={
                     "day_trades_count": day_trades_count,
                     "threshold": self.PDT_THRESHOLD,
                     "equity": self.equity,
                     "required_equity": self.PDT_EQUITY_MINIMUM,
                 },
-            ))
+                timestamp=ctx.now,
+            )
         elif day_trades_count == self.PDT_THRESHOLD - 1:
             # One more day trade will trigger PDT - require confirmation
-            violations.append(ComplianceViolation(
+            return ComplianceViolation(
                 type=ViolationType.PDT_WARNING,
                 severity="warning",
                 action=ComplianceAction.CONFIRM,
                 title="PDT Warning: Final Day Trade",
-                description=(
-                    f"This would be your {day_trades_count + 1}th day trade in 5 business days. "
-                    f"Proceeding will flag your account as a Pattern Day Trader, requiring "
-                    f"$25,000 minimum equity. Your equity: ${self.equity:,.2f}"
+                description=self._PDT_CONFIRM_TEMPLATE.format_map(
+                    {"after": day_trades_count + 1, "equity": self.equity}
                 ),
-                regulation="FINRA Rule 4210 (Pattern Day Trader)",
+                regulation=_REG_PDT,
                 details={
                     "day_trades_count": day_trades_count,
                     "after_trade": day_trades_count + 1,
                     "threshold": self.PDT_THRESHOLD,
                     "equity": self.equity,
                 },
-            ))
+                timestamp=ctx.now,
+            )
         elif day_trades_count >= 2:
             # Warning - getting close
             remaining = self.PDT_THRESHOLD - day_trades_count - 1
-            violations.append(ComplianceViolation(
+            fields = {"count": day_trades_count, "remaining": remaining}
+            return ComplianceViolation(
                 type=ViolationType.PDT_WARNING,
                 severity="info",
                 action=ComplianceAction.WARN,
-                title=f"PDT Alert: {remaining} Day Trade(s) Remaining",
-                description=(
-                    f"You have made {day_trades_count} day trades in the last 5 business days. "
-                    f"You have {remaining} day trade(s) remaining before triggering PDT rules."
-                ),
-                regulation="FINRA Rule 4210 (Pattern Day Trader)",
+                title=self._PDT_WARN_TITLE_TEMPLATE.format_map(fields),
+                description=self._PDT_WARN_TEMPLATE.format_map(fields),
+                regulation=_REG_PDT,
                 details={
                     "day_trades_count": day_trades_count,
                     "remaining": remaining,
                     "threshold": self.PDT_THRESHOLD,
                 },
-            ))
+                timestamp=ctx.now,
+            )
         
-        return violations
+        return None
     
-    def _check_pdt_after_trade(self) -> Optional[ComplianceViolation]:
+    def _check_pdt_after_trade(self, now: datetime) -> Optional[ComplianceViolation]:
         """Check PDT status after a day trade is recorded."""
-        if self.account_type != AccountType.MARGIN:
+        if self._account_type is not AccountType.MARGIN:
             return None
         
         if self.equity >= self.PDT_EQUITY_MINIMUM:
             return None
         
-        day_trades_count = self._count_recent_day_trades()
+        day_trades_count = self._count_recent_day_trades(now.date())
         
         if day_trades_count >= self.PDT_THRESHOLD:
             self.is_pattern_day_trader = True
@@ -568,32 +965,28 @@ class ComplianceManager:
                 severity="critical",
                 action=ComplianceAction.STOP_DAY,
                 title="Pattern Day Trader Status Triggered",
-                description=(
-                    f"You have been flagged as a Pattern Day Trader ({day_trades_count} day trades "
-                    f"in 5 business days). Trading is stopped for today. You must maintain "
-                    f"$25,000 minimum equity to continue day trading."
-                ),
-                regulation="FINRA Rule 4210",
+                description=self._PDT_TRIGGERED_TEMPLATE.format_map({"count": day_trades_count}),
+                regulation=_REG_FINRA_4210,
                 details={
                     "day_trades_count": day_trades_count,
                     "equity": self.equity,
                     "required_equity": self.PDT_EQUITY_MINIMUM,
                 },
+                timestamp=now,
             )
         
         return None
     
-    def _check_good_faith(
-        self,
-        symbol: str,
-        quantity: float,
-    ) -> Optional[ComplianceViolation]:
+    def _check_good_faith(self, ctx: _OrderContext) -> Optional[ComplianceViolation]:
         """Check for Good Faith Violation (selling unsettled securities)."""
+        symbol, quantity, today = ctx.symbol, ctx.quantity, ctx.today
+        
         # Find unsettled positions for this symbol
-        unsettled = [
-            p for p in self._unsettled_positions
-            if p.symbol == symbol and not p.is_settled
-        ]
+        positions = self._unsettled_by_symbol.get(symbol)
+        if not positions:
+            return None
+        
+        unsettled = [p for p in positions if not p.is_settled_on(today)]
         
         if not unsettled:
             return None
@@ -610,25 +1003,27 @@ class ComplianceManager:
             severity="warning",
             action=ComplianceAction.CONFIRM,
             title="Good Faith Violation Warning",
-            description=(
-                f"You are attempting to sell {quantity} shares of {symbol} that have not "
-                f"settled yet. Selling securities before settlement (T+{self.STOCK_SETTLEMENT_DAYS}) "
-                f"may result in a Good Faith Violation. Three violations in 12 months will "
-                f"result in a 90-day cash-upfront restriction."
-            ),
-            regulation="Regulation T / FINRA",
+            description=self._GOOD_FAITH_TEMPLATE.format_map({
+                "quantity": quantity,
+                "symbol": symbol,
+                "settlement_days": self.STOCK_SETTLEMENT_DAYS,
+            }),
+            regulation=_REG_GOOD_FAITH,
             details={
                 "symbol": symbol,
                 "quantity": quantity,
                 "unsettled_quantity": unsettled_qty,
                 "settlement_dates": [p.settlement_date.isoformat() for p in unsettled],
             },
+            timestamp=ctx.now,
         )
     
-    def _check_freeriding(self, order_value: float) -> Optional[ComplianceViolation]:
+    def _check_freeriding(self, ctx: _OrderContext) -> Optional[ComplianceViolation]:
         """Check for Freeriding Violation (buying with unsettled proceeds)."""
+        order_value = ctx.order_value
+        
         # Calculate unsettled proceeds from recent sales
-        unsettled_proceeds = self._calculate_unsettled_proceeds()
+        unsettled_proceeds = self._calculate_unsettled_proceeds(ctx.today)
         
         if unsettled_proceeds <= 0:
             return None
@@ -642,34 +1037,33 @@ class ComplianceManager:
                 severity="warning",
                 action=ComplianceAction.CONFIRM,
                 title="Freeriding Risk Warning",
-                description=(
-                    f"This purchase of ${order_value:,.2f} uses unsettled proceeds from recent sales. "
-                    f"If you sell this position before your sale proceeds settle (T+{self.STOCK_SETTLEMENT_DAYS}), "
-                    f"you may incur a Freeriding Violation, resulting in a 90-day restriction."
+                description=self._FREERIDING_TEMPLATE.format_map(
+                    {"order_value": order_value, "settlement_days": self.STOCK_SETTLEMENT_DAYS}
                 ),
-                regulation="Regulation T",
+                regulation=_REG_T,
                 details={
                     "order_value": order_value,
                     "unsettled_proceeds": unsettled_proceeds,
                     "settled_buying_power": max(0, settled_buying_power),
                 },
+                timestamp=ctx.now,
             )
         
         return None
     
     def _check_day_trading_buying_power(
         self,
-        order_value: float,
+        ctx: _OrderContext,
     ) -> Optional[ComplianceViolation]:
-        """Check Day Trading Buying Power limits (margin accounts)."""
-        if not self.is_pattern_day_trader:
-            return None
+        """
+        Check Day Trading Buying Power limits (margin accounts).
         
-        if self.day_trading_buying_power <= 0:
-            return None
+        Only scheduled for pattern day traders with DTBP available.
+        """
+        order_value = ctx.order_value
         
         # Calculate used DTBP today
-        used_dtbp = self._calculate_used_dtbp()
+        used_dtbp = self._calculate_used_dtbp(ctx.today)
         remaining_dtbp = self.day_trading_buying_power - used_dtbp
         
         if order_value > remaining_dtbp:
@@ -678,18 +1072,17 @@ class ComplianceManager:
                 severity="critical",
                 action=ComplianceAction.BLOCK,
                 title="Day Trading Buying Power Exceeded",
-                description=(
-                    f"This order of ${order_value:,.2f} exceeds your remaining Day Trading "
-                    f"Buying Power of ${remaining_dtbp:,.2f}. Exceeding DTBP will result in "
-                    f"a margin call requiring immediate deposit."
+                description=self._DTBP_TEMPLATE.format_map(
+                    {"order_value": order_value, "remaining": remaining_dtbp}
                 ),
-                regulation="FINRA Margin Rules",
+                regulation=_REG_MARGIN,
                 details={
                     "order_value": order_value,
                     "day_trading_buying_power": self.day_trading_buying_power,
                     "used_dtbp": used_dtbp,
                     "remaining_dtbp": remaining_dtbp,
                 },
+                timestamp=ctx.now,
             )
         
         return None
@@ -697,30 +1090,29 @@ class ComplianceManager:
     def _check_wash_sale(
         self,
         symbol: str,
-        side: str,
+        side: Side,
         quantity: float,
         price: float,
         timestamp: datetime,
+        now: datetime,
     ) -> Optional[ComplianceViolation]:
         """Check for Wash Sale after a loss sale."""
-        if side.lower() != "sell":
+        if side is not Side.SELL:
             return None
         
-        # Get recent trades for this symbol
-        recent_trades = self._trade_history.get(symbol, [])
-        
         # Check for recent buys (within wash sale window before this sell)
-        window_start = timestamp - timedelta(days=self.WASH_SALE_WINDOW_DAYS)
-        recent_buys = [
-            t for t in recent_trades
-            if t["side"].lower() == "buy" and t["timestamp"] >= window_start
-        ]
+        buys = self._buys_by_symbol.get(symbol)
+        if not buys:
+            return None
         
-        if not recent_buys:
+        window_start = timestamp - self._wash_sale_window
+        totals = buys.totals_since(window_start)
+        if totals is None:
             return None
         
         # Check if this sell is at a loss
-        avg_buy_price = sum(t["price"] * t["quantity"] for t in recent_buys) / sum(t["quantity"] for t in recent_buys)
+        total_qty, total_notional = totals
+        avg_buy_price = total_notional / total_qty
         
         if price >= avg_buy_price:
             return None  # Not a loss sale
@@ -730,33 +1122,28 @@ class ComplianceManager:
             severity="info",
             action=ComplianceAction.WARN,
             title="Potential Wash Sale",
-            description=(
-                f"You sold {symbol} at a loss within 30 days of purchasing. If you "
-                f"repurchase {symbol} (or substantially identical security) within the "
-                f"next 30 days, this loss may be disallowed for tax purposes (Wash Sale Rule)."
-            ),
-            regulation="IRS Wash Sale Rule (Section 1091)",
+            description=self._WASH_SALE_TEMPLATE.format_map({"symbol": symbol}),
+            regulation=_REG_WASH_SALE,
             details={
                 "symbol": symbol,
                 "sale_price": price,
                 "avg_buy_price": avg_buy_price,
                 "loss_per_share": avg_buy_price - price,
-                "wash_sale_window_ends": (timestamp + timedelta(days=30)).date().isoformat(),
+                "wash_sale_window_ends": (timestamp + self._wash_sale_window).date().isoformat(),
             },
+            timestamp=now,
         )
     
-    def _check_wash_sale_preorder(self, symbol: str) -> Optional[str]:
+    def _check_wash_sale_preorder(self, symbol: str, now: datetime) -> Optional[str]:
         """Check if buying would trigger wash sale on previous loss."""
         # Look for recent loss sales
-        recent_trades = self._trade_history.get(symbol, [])
-        window_start = datetime.now() - timedelta(days=self.WASH_SALE_WINDOW_DAYS)
+        sells = self._sells_by_symbol.get(symbol)
+        if not sells:
+            return None
         
-        recent_sells = [
-            t for t in recent_trades
-            if t["side"].lower() == "sell" and t["timestamp"] >= window_start
-        ]
+        window_start = now - self._wash_sale_window
         
-        if recent_sells:
+        if sells.times[-1] >= window_start:
             return (
                 f"Buying {symbol} may trigger wash sale rule if you sold at a loss "
                 f"in the last 30 days. The loss may be disallowed for tax purposes."
@@ -764,57 +1151,102 @@ class ComplianceManager:
         
         return None
     
-    def _count_recent_day_trades(self) -> int:
-        """Count day trades in the last 5 business days."""
-        today = date.today()
-        cutoff = today - timedelta(days=7)  # Extra days to account for weekends
-        
-        # Get business days
-        business_days = []
-        current = today
-        while len(business_days) < self.PDT_LOOKBACK_DAYS:
-            if current.weekday() < 5:  # Monday = 0, Friday = 4
-                business_days.append(current)
-            current -= timedelta(days=1)
-        
-        oldest_date = business_days[-1] if business_days else cutoff
-        
-        return sum(
-            1 for dt in self._day_trades
-            if dt.trade_date >= oldest_date
+    def _pdt_window_start(self, today: date) -> date:
+        """Oldest date inside the rolling PDT window of 5 business days."""
+        return np.busday_offset(
+            today, -(self.PDT_LOOKBACK_DAYS - 1), roll="backward", busdaycal=self._busdaycal,
+        ).item()
+    
+    def _add_day_trade(self, day_trade: DayTrade) -> None:
+        """Record a day trade, keeping the deque ordered by date."""
+        trade_date = day_trade.trade_date
+        if self._day_trades and trade_date < self._day_trades[-1].trade_date:
+            # Back-dated trade
+            bisect.insort(self._day_trades, day_trade, key=attrgetter("trade_date"))
+        else:
+            self._day_trades.append(day_trade)
+        
+        self._dtbp_by_date[trade_date] = (
+            self._dtbp_by_date.get(trade_date, 0.0) + day_trade.buy_price * day_trade.quantity
         )
+        self._day_trades_version += 1
+    
+    def _evict_old_day_trades(self, oldest_date: date) -> None:
+        """Drop day trades that have aged out of the PDT window."""
+        day_trades = self._day_trades
+        while day_trades and day_trades[0].trade_date < oldest_date:
+            self._dtbp_by_date.pop(day_trades.popleft().trade_date, None)
+            self._day_trades_version += 1
+    
+    def _count_recent_day_trades(self, today: date) -> int:
+        """Count day trades in the last 5 business days."""
+        cached = self._day_trade_count_cache
+        if cached is not None and cached[0] == self._day_trades_version and cached[1] == today:
+            return cached[2]
+        
+        self._evict_old_day_trades(self._pdt_window_start(today))
+        count = len(self._day_trades)
+        self._day_trade_count_cache = (self._day_trades_version, today, count)
+        return count
+    
+    def _now(self) -> datetime:
+        """Current time; the single clock read for an order check or trade."""
+        return datetime.now()
     
     def _calculate_settlement_date(self, trade_date: date) -> date:
-        """Calculate settlement date (T+1)."""
-        settlement = trade_date + timedelta(days=self.STOCK_SETTLEMENT_DAYS)
+        """Calculate settlement date (T+1 business days)."""
+        return np.busday_offset(
+            trade_date, self.STOCK_SETTLEMENT_DAYS, roll="forward", busdaycal=self._busdaycal,
+        ).item()
+    
+    def _settlement_dates(self, trade_dates: np.ndarray) -> np.ndarray:
+        """Vectorized _calculate_settlement_date over datetime64[D] trade dates."""
+        return np.busday_offset(
+            trade_dates, self.STOCK_SETTLEMENT_DAYS, roll="forward", busdaycal=self._busdaycal,
+        )
+    
+    def _calculate_unsettled_proceeds(self, today: date) -> float:
+        """Calculate total unsettled proceeds from recent sales."""
+        heap = self._unsettled_sale_heap
+        while heap and heap[0][0] <= today:
+            self._unsettled_proceeds_total -= heapq.heappop(heap)[1]
         
-        # Skip weekends
-        while settlement.weekday() >= 5:
-            settlement += timedelta(days=1)
+        if not heap:
+            # Avoid carrying float drift once everything has settled
+            self._unsettled_proceeds_total = 0.0
         
-        return settlement
+        return self._unsettled_proceeds_total
     
-    def _calculate_unsettled_proceeds(self) -> float:
-        """Calculate total unsettled proceeds from recent sales."""
-        # This would need actual sale tracking in production
-        # For now, return 0 as a placeholder
-        return 0.0
+    def _settle_positions(self, today: date) -> None:
+        """Drop unsettled positions whose settlement date has arrived."""
+        heap = self._unsettled_heap
+        if not heap or heap[0][0] > today:
+            return
+        
+        symbols = set()
+        while heap and heap[0][0] <= today:
+            symbols.add(heapq.heappop(heap)[2].symbol)
+            self._unsettled_count -= 1
+        
+        # Filter each affected symbol's list once, in place
+        by_symbol = self._unsettled_by_symbol
+        for symbol in symbols:
+            positions = by_symbol[symbol]
+            _compact(positions, lambda p: not p.is_settled_on(today))
+            if not positions:
+                del by_symbol[symbol]
     
-    def _calculate_used_dtbp(self) -> float:
+    def _calculate_used_dtbp(self, today: date) -> float:
         """Calculate used Day Trading Buying Power today."""
-        today = date.today()
-        today_trades = [
-            dt for dt in self._day_trades
-            if dt.trade_date == today
-        ]
-        
-        return sum(dt.buy_price * dt.quantity for dt in today_trades)
+        return self._dtbp_by_date.get(today, 0.0)
     
     def _stop_trading(self, reason: str) -> None:
         """Stop all trading for the day."""
+        from loguru import logger
+        
         self._trading_stopped = True
         self._stop_reason = reason
-        logger.warning(f"Trading stopped: {reason}")
+        logger.warning("Trading stopped: {}", reason)
     
     def reset_daily(self) -> None:
         """Reset daily counters (call at market open)."""
@@ -823,58 +1255,104 @@ class ComplianceManager:
         self._today_day_trades = 0
         self._intraday_positions.clear()
         
-        # Clean up old unsettled positions
-        self._unsettled_positions = [
-            p for p in self._unsettled_positions
-            if not p.is_settled
-        ]
-        
-        # Clean up old day trades (keep last 7 days)
-        cutoff = date.today() - timedelta(days=7)
-        self._day_trades = [
-            dt for dt in self._day_trades
-            if dt.trade_date >= cutoff
-        ]
-        
-        # Clean up old trade history (keep last 60 days for wash sale)
-        history_cutoff = datetime.now() - timedelta(days=60)
-        for symbol in self._trade_history:
-            self._trade_history[symbol] = [
-                t for t in self._trade_history[symbol]
-                if t["timestamp"] >= history_cutoff
-            ]
+        now = self._now()
+        today = now.date()
+        
+        # Clean up settled positions
+        self._settle_positions(today)
+        
+        # Clean up day trades that have left the PDT window
+        self._evict_old_day_trades(self._pdt_window_start(today))
+        
+        # Clean up old trade history (retention window for wash sale)
+        history_cutoff = now - self._history_retention
+        for history in (self._buys_by_symbol, self._sells_by_symbol):
+            expired = []
+            for symbol, trades in history.items():
+                trades.trim(history_cutoff)
+                if not trades:
+                    expired.append(symbol)
+            for symbol in expired:
+                del history[symbol]
     
     def get_status(self) -> Dict[str, Any]:
         """Get current compliance status."""
-        day_trades_count = self._count_recent_day_trades()
-        remaining_day_trades = max(0, self.PDT_THRESHOLD - day_trades_count - 1) if self.equity < self.PDT_EQUITY_MINIMUM else None
+        return self._get_status_fast()
+    
+    def get_status_json(self) -> bytes:
+        """Get current compliance status encoded as JSON, for polling endpoints."""
+        return orjson.dumps(self._get_status_fast())
+    
+    def _compile_status_fn(self) -> Callable[[], Dict[str, Any]]:
+        """
+        Build a get_status implementation specialized for this instance.
         
-        return {
-            "account_type": self.account_type.value,
-            "equity": self.equity,
-            "pdt_status": {
-                "is_pattern_day_trader": self.is_pattern_day_trader,
-                "day_trades_last_5_days": day_trades_count,
-                "remaining_day_trades": remaining_day_trades,
-                "pdt_threshold": self.PDT_THRESHOLD,
-                "equity_requirement": self.PDT_EQUITY_MINIMUM,
-                "meets_equity_requirement": self.equity >= self.PDT_EQUITY_MINIMUM,
-            },
-            "trading_status": {
-                "trading_allowed": not self._trading_stopped,
-                "stop_reason": self._stop_reason,
-            },
-            "restrictions": {
-                "restricted": self._restricted_until is not None and date.today() < self._restricted_until,
-                "restriction_type": self._restriction_type,
-                "restriction_ends": self._restricted_until.isoformat() if self._restricted_until else None,
-            },
-            "settlement": {
-                "settlement_days": self.STOCK_SETTLEMENT_DAYS,
-                "unsettled_positions": len([p for p in self._unsettled_positions if not p.is_settled]),
-            },
-            "recent_violations": [v.to_dict() for v in self._violations[-10:]],
-        }
+        The account type and regulatory constants are bound as closure
+        locals; only the fields that change between calls are read from
+        the instance. Rebuilt by _specialize_checks when the account type
+        changes.
+        """
+        account_type_value = self._account_type.value
+        pdt_threshold = self.PDT_THRESHOLD
+        equity_minimum = self.PDT_EQUITY_MINIMUM
+        settlement_days = self.STOCK_SETTLEMENT_DAYS
+        settle_positions = self._settle_positions
+        count_recent_day_trades = self._count_recent_day_trades
+        recent_violations = self._recent_violations
+        
+        def get_status() -> Dict[str, Any]:
+            # Read through the instance so a replaced _now clock applies here too
+            today = self._now().date()
+            settle_positions(today)
+            day_trades_count = count_recent_day_trades(today)
+            equity = self.equity
+            meets_equity_requirement = equity >= equity_minimum
+            restricted_until = self._restricted_until
+            
+            return {
+                "account_type": account_type_value,
+                "equity": equity,
+                "pdt_status": {
+                    "is_pattern_day_trader": self.is_pattern_day_trader,
+                    "day_trades_last_5_days": day_trades_count,
+                    "remaining_day_trades": (
+                        None if meets_equity_requirement
+                        else max(0, pdt_threshold - day_trades_count - 1)
+                    ),
+                    "pdt_threshold": pdt_threshold,
+                    "equity_requirement": equity_minimum,
+                    "meets_equity_requirement": meets_equity_requirement,
+                },
+                "trading_status": {
+                    "trading_allowed": not self._trading_stopped,
+                    "stop_reason": self._stop_reason,
+                },
+                "restrictions": {
+                    "restricted": restricted_until is not None and today < restricted_until,
+                    "restriction_type": self._restriction_type,
+                    "restriction_ends": restricted_until.isoformat() if restricted_until else None,
+                },
+                "settlement": {
+                    "settlement_days": settlement_days,
+                    "unsettled_positions": self._unsettled_count,
+                },
+                "recent_violations": [v.to_dict() for v in recent_violations],
+            }
+        
+        return get_status
+    
+    @property
+    def violation_count(self) -> int:
+        """Total violations recorded, including ones rotated out of history."""
+        return self._violation_total
+    
+    def get_violations(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get the most recent violations, oldest first."""
+        if limit <= 0:
+            return []
+        history = self._violations
+        start = max(0, len(history) - limit)
+        return [v.to_dict() for v in islice(history, start, None)]
     
     def get_day_trades(self) -> List[Dict[str, Any]]:
         """Get recent day trades."""
@@ -889,22 +1367,40 @@ class ComplianceManager:
             }
             for dt in self._day_trades
         ]
+    
+    def get_day_trades_df(self) -> "pd.DataFrame":
+        """
+        Get recent day trades as a DataFrame, one row per trade.
+        
+        Columns are built in a single pass over the day-trade history so
+        bulk consumers can serialize with DataFrame.to_json instead of
+        going through a list of per-trade dicts.
+        """
+        import pandas as pd
+        
+        day_trades = self._day_trades
+        return pd.DataFrame({
+            "symbol": [dt.symbol for dt in day_trades],
+            "trade_date": pd.to_datetime([dt.trade_date for dt in day_trades]),
+            "quantity": np.fromiter((dt.quantity for dt in day_trades), float, len(day_trades)),
+            "buy_price": np.fromiter((dt.buy_price for dt in day_trades), float, len(day_trades)),
+            "sell_price": np.fromiter((dt.sell_price for dt in day_trades), float, len(day_trades)),
+            "pnl": np.fromiter((dt.pnl for dt in day_trades), float, len(day_trades)),
+        })
 
 
-# Singleton instance
-_compliance_manager: Optional[ComplianceManager] = None
+# Singleton instance, created at import so access needs no None check
+_compliance_manager: ComplianceManager = ComplianceManager()
+_compliance_manager_lock = threading.Lock()
 
 
 def get_compliance_manager() -> ComplianceManager:
-    """Get or create the compliance manager singleton."""
-    global _compliance_manager
-    if _compliance_manager is None:
-        _compliance_manager = ComplianceManager()
+    """Get the compliance manager singleton."""
     return _compliance_manager
 
 
 def reset_compliance_manager() -> None:
     """Reset the compliance manager (for testing)."""
     global _compliance_manager
-    _compliance_manager = None
-
+    with _compliance_manager_lock:
+        _compliance_manager = ComplianceManager()
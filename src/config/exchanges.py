@@ -14,7 +14,8 @@ This module supports dynamic symbol lookup for ANY stock on these exchanges.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, Dict, List
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Final, Tuple, Sequence
 import logging
 
 logger = logging.getLogger(__name__)
@@ -60,9 +61,9 @@ class Currency(str, Enum):
     RUB = "RUB"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Exchange:
-    """Stock exchange configuration."""
+    """Stock exchange configuration (immutable, hashable)."""
     code: str  # Exchange code (e.g., "NYSE", "LSE")
     name: str  # Full name
     country: str
@@ -73,12 +74,30 @@ class Exchange:
     mic: str = ""  # Market Identifier Code (ISO 10383)
     trading_hours: str = ""  # Local trading hours
     is_supported: bool = True
+    _suffix_upper: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Canonicalize to the enum members so region/currency can be
+        # compared by identity even if constructed from raw strings
+        object.__setattr__(self, "region", ExchangeRegion(self.region))
+        object.__setattr__(self, "currency", Currency(self.currency))
+        object.__setattr__(self, "_suffix_upper", self.suffix.upper())
     
     def format_symbol(self, symbol: str) -> str:
         """Format a symbol for this exchange (e.g., add suffix for Yahoo Finance)."""
-        if self.suffix and not symbol.endswith(self.suffix):
-            return f"{symbol}{self.suffix}"
-        return symbol
+        if not self.suffix or symbol.upper().endswith(self._suffix_upper):
+            return symbol
+        return symbol + self.suffix
+    
+    def format_symbols(self, symbols: Sequence[str]) -> List[str]:
+        """Format many symbols for this exchange in one pass."""
+        if not self.suffix:
+            return list(symbols)
+        suffix, suffix_upper = self.suffix, self._suffix_upper
+        return [
+            symbol if symbol.upper().endswith(suffix_upper) else symbol + suffix
+            for symbol in symbols
+        ]
 
 
 # ============================================================================
@@ -686,7 +705,7 @@ JSE = Exchange(
 # ============================================================================
 # EXCHANGE REGISTRY
 # ============================================================================
-ALL_EXCHANGES: Dict[str, Exchange] = {
+_ALL_EXCHANGES: Dict[str, Exchange] = {
     # United States
     "NYSE": NYSE,
     "NASDAQ": NASDAQ,
@@ -752,20 +771,41 @@ ALL_EXCHANGES: Dict[str, Exchange] = {
     "JSE": JSE,
 }
 
+# Read-only view so the registry can be shared freely across threads
+ALL_EXCHANGES: Mapping[str, Exchange] = MappingProxyType(_ALL_EXCHANGES)
+
+
+# Uppercase Yahoo Finance suffix -> exchange (first registered wins)
+_UPPER_SUFFIX_TO_EXCHANGE: Dict[str, Exchange] = {}
+for _exchange in ALL_EXCHANGES.values():
+    if _exchange.suffix:
+        _UPPER_SUFFIX_TO_EXCHANGE.setdefault(_exchange.suffix.upper(), _exchange)
+del _exchange
+
+# Region -> exchanges, and the supported subset, in registry order
+_BY_REGION: Dict[ExchangeRegion, Tuple[Exchange, ...]] = {
+    region: tuple(ex for ex in ALL_EXCHANGES.values() if ex.region is region)
+    for region in ExchangeRegion
+}
+_SUPPORTED: Tuple[Exchange, ...] = tuple(ex for ex in ALL_EXCHANGES.values() if ex.is_supported)
+
+# Distinct suffix lengths, longest first, for O(#lengths) suffix lookup
+_SUFFIX_LENGTHS: List[int] = sorted({len(s) for s in _UPPER_SUFFIX_TO_EXCHANGE}, reverse=True)
+
 
 def get_exchange(code: str) -> Optional[Exchange]:
     """Get exchange by code."""
     return ALL_EXCHANGES.get(code.upper())
 
 
-def get_exchanges_by_region(region: ExchangeRegion) -> List[Exchange]:
+def get_exchanges_by_region(region: ExchangeRegion) -> Tuple[Exchange, ...]:
     """Get all exchanges in a region."""
-    return [ex for ex in ALL_EXCHANGES.values() if ex.region == region]
+    return _BY_REGION.get(region, ())
 
 
-def get_all_supported_exchanges() -> List[Exchange]:
+def get_all_supported_exchanges() -> Tuple[Exchange, ...]:
     """Get all supported (tradeable) exchanges."""
-    return [ex for ex in ALL_EXCHANGES.values() if ex.is_supported]
+    return _SUPPORTED
 
 
 def format_symbol_for_exchange(symbol: str, exchange_code: str) -> str:
@@ -778,13 +818,40 @@ def format_symbol_for_exchange(symbol: str, exchange_code: str) -> str:
 
 def detect_exchange_from_symbol(symbol: str) -> Optional[Exchange]:
     """Detect exchange from symbol suffix."""
-    for exchange in ALL_EXCHANGES.values():
-        if exchange.suffix and symbol.upper().endswith(exchange.suffix.upper()):
+    upper = symbol.upper()
+    for length in _SUFFIX_LENGTHS:
+        exchange = _UPPER_SUFFIX_TO_EXCHANGE.get(upper[-length:])
+        if exchange is not None:
             return exchange
     # Default to US exchanges for symbols without suffix
     return NYSE
 
 
+def detect_exchanges_batch(symbols: Sequence[str]) -> List[Exchange]:
+    """
+    Detect exchanges for many symbols at once (e.g. a universe import).
+    
+    Same result as calling detect_exchange_from_symbol per symbol, with the
+    suffix table and lengths bound once for the whole batch.
+    """
+    suffix_map = _UPPER_SUFFIX_TO_EXCHANGE
+    lengths = _SUFFIX_LENGTHS
+    default = NYSE
+    
+    result: List[Exchange] = []
+    append = result.append
+    for symbol in symbols:
+        upper = symbol.upper()
+        for length in lengths:
+            exchange = suffix_map.get(upper[-length:])
+            if exchange is not None:
+                append(exchange)
+                break
+        else:
+            append(default)
+    return result
+
+
 # Common stock indices for each exchange
 MAJOR_INDICES = {
     # US
@@ -858,11 +925,18 @@ EXCHANGE_STOCK_COUNTS = {
 }
 
 
+TOTAL_AVAILABLE_STOCKS: Final[int] = sum(EXCHANGE_STOCK_COUNTS.values())
+
+
 def get_total_available_stocks() -> int:
     """Get approximate total number of stocks available across all exchanges."""
-    return sum(EXCHANGE_STOCK_COUNTS.values())
+    return TOTAL_AVAILABLE_STOCKS
 
 
 # Logging total
-logger.info(f"Global exchange configuration loaded: {len(ALL_EXCHANGES)} exchanges, ~{get_total_available_stocks():,} stocks available")
+if logger.isEnabledFor(logging.INFO):
+    logger.info(
+        "Global exchange configuration loaded: %d exchanges, ~%s stocks available",
+        len(ALL_EXCHANGES), f"{TOTAL_AVAILABLE_STOCKS:,}",
+    )
 
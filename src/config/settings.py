@@ -6,13 +6,37 @@ XFactor Bot - AI-Powered Automated Trading System
 Supports multiple brokers, data sources, and banking integrations.
 """
 
-from functools import lru_cache
-from typing import Literal, List
+from functools import cached_property, lru_cache
+from typing import Any, Literal, List, Optional
 
-from pydantic import Field, field_validator
+import orjson
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Broker -> settings that indicate it is configured (any one suffices)
+_BROKER_CREDENTIALS = (
+    ("ibkr", ("ibkr_account", "ibkr_host")),
+    ("alpaca", ("alpaca_api_key",)),
+    ("schwab", ("schwab_client_id",)),
+    ("tradier", ("tradier_access_token",)),
+    ("etrade", ("etrade_consumer_key",)),
+    ("coinbase", ("coinbase_api_key",)),
+    ("binance", ("binance_api_key",)),
+)
+
+# Data source -> setting that enables it
+_DATA_SOURCE_KEYS = (
+    ("polygon", "polygon_api_key"),
+    ("alpha_vantage", "alpha_vantage_api_key"),
+    ("iex_cloud", "iex_cloud_api_key"),
+    ("tiingo", "tiingo_api_key"),
+    ("barchart", "barchart_api_key"),
+    ("finnhub", "finnhub_api_key"),
+    ("yahoo_finance", "yahoo_finance_enabled"),
+)
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -21,6 +45,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
     
     # =========================================================================
@@ -270,66 +295,50 @@ class Settings(BaseSettings):
     environment: Literal["development", "staging", "production"] = Field(default="development")
     admin_password_hash: str = Field(default="", description="Admin panel password hash")
     
+    _database_url: str = PrivateAttr(default="")
+    _json_snapshot: Optional[bytes] = PrivateAttr(default=None)
+    
     @field_validator("trading_mode")
     @classmethod
     def validate_trading_mode(cls, v: str) -> str:
         """Ensure trading mode is always lowercase."""
         return v.lower()
     
-    @property
-    def database_url(self) -> str:
-        """Construct database URL if not provided."""
-        if self.timescale_url:
-            return self.timescale_url
-        return (
+    def model_post_init(self, __context: Any) -> None:
+        # Construct database URL once if not provided
+        self._database_url = self.timescale_url or (
             f"postgresql://{self.timescale_user}:{self.timescale_password}"
             f"@{self.timescale_host}:{self.timescale_port}/{self.timescale_db}"
         )
     
+    @property
+    def database_url(self) -> str:
+        """Database URL (timescale_url, or built from the timescale_* settings)."""
+        return self._database_url
+    
+    def to_json_bytes(self) -> bytes:
+        """Settings serialized as JSON, encoded once and reused (e.g. for worker config)."""
+        if self._json_snapshot is None:
+            self._json_snapshot = orjson.dumps(self.model_dump(mode="json"))
+        return self._json_snapshot
+    
     @property
     def is_paper_trading(self) -> bool:
         """Check if running in paper trading mode."""
         return self.trading_mode == "paper"
     
-    @property
+    @cached_property
     def enabled_brokers(self) -> List[str]:
         """Get list of brokers with configured credentials."""
-        brokers = []
-        if self.ibkr_account or self.ibkr_host:
-            brokers.append("ibkr")
-        if self.alpaca_api_key:
-            brokers.append("alpaca")
-        if self.schwab_client_id:
-            brokers.append("schwab")
-        if self.tradier_access_token:
-            brokers.append("tradier")
-        if self.etrade_consumer_key:
-            brokers.append("etrade")
-        if self.coinbase_api_key:
-            brokers.append("coinbase")
-        if self.binance_api_key:
-            brokers.append("binance")
-        return brokers
+        return [
+            name for name, attrs in _BROKER_CREDENTIALS
+            if any(getattr(self, attr) for attr in attrs)
+        ]
     
-    @property
+    @cached_property
     def enabled_data_sources(self) -> List[str]:
         """Get list of data sources with configured API keys."""
-        sources = []
-        if self.polygon_api_key:
-            sources.append("polygon")
-        if self.alpha_vantage_api_key:
-            sources.append("alpha_vantage")
-        if self.iex_cloud_api_key:
-            sources.append("iex_cloud")
-        if self.tiingo_api_key:
-            sources.append("tiingo")
-        if self.barchart_api_key:
-            sources.append("barchart")
-        if self.finnhub_api_key:
-            sources.append("finnhub")
-        if self.yahoo_finance_enabled:
-            sources.append("yahoo_finance")
-        return sources
+        return [name for name, attr in _DATA_SOURCE_KEYS if getattr(self, attr)]
 
 
 @lru_cache
@@ -235,10 +235,14 @@ class MarketDataManager:
         
         # Check Redis cache
         if use_cache:
-            cached = await self.cache.get_ohlcv(symbol, timeframe)
+            cached = await self.cache.get_ohlcv_columns(symbol, timeframe)
             if cached:
                 logger.debug(f"Using cached bars for {symbol}")
-                return pd.DataFrame(cached)
+                # Same shape as a fresh fetch: indexed by time as datetimes
+                df = pd.DataFrame(cached)
+                df["time"] = pd.to_datetime(df["time"])
+                df.set_index("time", inplace=True)
+                return df
         
         # Fetch from IBKR
         contract = self.ibkr.create_stock_contract(symbol)
@@ -2,17 +2,113 @@
 Redis cache for real-time data and pub/sub messaging.
 """
 
-import json
 from datetime import timedelta
+from time import monotonic
+import math
+import struct
+import zlib
 from typing import Optional, Any, Callable
 import asyncio
 
+import orjson
 import redis.asyncio as redis
 from loguru import logger
 
 from src.config.settings import get_settings
 
 
+# Market prices are a fixed numeric record, stored packed rather than as
+# JSON: price, bid, ask, volume, monotonic timestamp (40 bytes). Missing
+# bid/ask are stored as NaN and a missing volume as -1.
+_PRICE_RECORD = struct.Struct("<dddqd")
+PRICE_TTL_SECONDS = 60
+
+
+def _pack_price(
+    price: float,
+    bid: Optional[float],
+    ask: Optional[float],
+    volume: Optional[int],
+    timestamp: float,
+) -> bytes:
+    return _PRICE_RECORD.pack(
+        price,
+        math.nan if bid is None else bid,
+        math.nan if ask is None else ask,
+        -1 if volume is None else int(volume),
+        timestamp,
+    )
+
+
+def _unpack_price(raw: Optional[bytes]) -> Optional[dict]:
+    # Anything but a packed record reads as a miss, including JSON prices
+    # written before records were packed (live until their TTL lapses)
+    if not raw or len(raw) != _PRICE_RECORD.size:
+        return None
+    price, bid, ask, volume, timestamp = _PRICE_RECORD.unpack(raw)
+    return {
+        "price": price,
+        "bid": None if math.isnan(bid) else bid,
+        "ask": None if math.isnan(ask) else ask,
+        "volume": None if volume < 0 else volume,
+        "timestamp": timestamp,
+    }
+
+
+# Trading state flags, packed as bits of a single key so a pre-trade
+# guard can read both in one round-trip
+_TRADING_FLAGS_KEY = "trading:flags"
+_PAUSED_BIT = 0
+_KILL_SWITCH_BIT = 1
+
+# INCR a counter, setting its expiry (seconds) only when it is created
+_INCR_WITH_EXPIRY_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+
+def _json_default(value: Any) -> Any:
+    # Timestamps (e.g. pandas.Timestamp) are not datetime types orjson knows
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _pack_columns(rows: list[dict]) -> bytes:
+    """
+    Encode records column-wise as compressed JSON.
+    
+    Storing each field name once instead of once per row, then compressing
+    the repetitive numeric text, makes bar payloads several times smaller.
+    """
+    columns = {key: [row.get(key) for row in rows] for key in rows[0]} if rows else {}
+    encoded = orjson.dumps(
+        columns,
+        default=_json_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+    )
+    return zlib.compress(encoded, 1)
+
+
+def _unpack_columns(raw: Optional[bytes]) -> Optional[dict[str, list]]:
+    """Decode _pack_columns output; anything else (e.g. legacy row JSON) is a miss."""
+    if not raw:
+        return None
+    try:
+        return orjson.loads(zlib.decompress(raw))
+    except (zlib.error, orjson.JSONDecodeError):
+        return None
+
+
+def _dumps(value: Any) -> bytes:
+    """Encode a value as JSON (non-str dict keys allowed, as with json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
 class RedisCache:
     """
     Redis client for caching and real-time messaging.
@@ -24,21 +120,35 @@ class RedisCache:
     - Session state management
     """
     
+    # Connection pool bounds: callers wait up to POOL_TIMEOUT for a free
+    # connection instead of opening new sockets under bursts
+    POOL_MAX_CONNECTIONS = 32
+    POOL_TIMEOUT = 1.0
+    HEALTH_CHECK_INTERVAL = 30
+    
     def __init__(self):
         """Initialize Redis client."""
         self.settings = get_settings()
+        self._pool: Optional[redis.BlockingConnectionPool] = None
         self._client: Optional[redis.Redis] = None
+        # Separate client without response decoding, for packed binary values
+        self._binary_pool: Optional[redis.BlockingConnectionPool] = None
+        self._binary_client: Optional[redis.Redis] = None
         self._pubsub: Optional[redis.client.PubSub] = None
-        self._subscriptions: dict[str, Callable] = {}
+        self._incr_with_expiry = None
+        # channel -> (callback, whether the callback is a coroutine function).
+        # Replaced wholesale on (un)subscribe, never mutated in place, so the
+        # listener can read it without guarding against concurrent changes.
+        self._subscriptions: dict[str, tuple[Callable, bool]] = {}
     
     async def connect(self) -> bool:
         """Connect to Redis."""
         try:
-            self._client = redis.from_url(
-                self.settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+            self._pool = self._create_pool(encoding="utf-8", decode_responses=True)
+            self._client = redis.Redis(connection_pool=self._pool)
+            self._binary_pool = self._create_pool()
+            self._binary_client = redis.Redis(connection_pool=self._binary_pool)
+            self._incr_with_expiry = self._client.register_script(_INCR_WITH_EXPIRY_SCRIPT)
             # Test connection
             await self._client.ping()
             logger.info("Connected to Redis")
@@ -52,10 +162,26 @@ class RedisCache:
         if self._pubsub:
             await self._pubsub.unsubscribe()
             await self._pubsub.close()
+        if self._binary_client:
+            await self._binary_client.close()
+        if self._binary_pool:
+            await self._binary_pool.disconnect()
         if self._client:
             await self._client.close()
+        if self._pool:
+            await self._pool.disconnect()
             logger.info("Disconnected from Redis")
     
+    def _create_pool(self, **kwargs: Any) -> redis.BlockingConnectionPool:
+        """Create a bounded, health-checked connection pool for the configured URL."""
+        return redis.BlockingConnectionPool.from_url(
+            self.settings.redis_url,
+            max_connections=self.POOL_MAX_CONNECTIONS,
+            timeout=self.POOL_TIMEOUT,
+            health_check_interval=self.HEALTH_CHECK_INTERVAL,
+            **kwargs,
+        )
+    
     # =========================================================================
     # Basic Cache Operations
     # =========================================================================
@@ -69,7 +195,7 @@ class RedisCache:
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         expire_seconds: int = None,
     ) -> bool:
         """Set a value in cache."""
@@ -89,13 +215,13 @@ class RedisCache:
         """Check if a key exists."""
         if not self._client:
             return False
-        return await self._client.exists(key) > 0
+        return bool(await self._client.exists(key))
     
     async def get_json(self, key: str) -> Optional[Any]:
         """Get a JSON value from cache."""
         value = await self.get(key)
         if value:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
     
     async def set_json(
@@ -105,7 +231,30 @@ class RedisCache:
         expire_seconds: int = None,
     ) -> bool:
         """Set a JSON value in cache."""
-        return await self.set(key, json.dumps(value), expire_seconds)
+        return await self.set(key, _dumps(value), expire_seconds)
+    
+    async def mget_json(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get many JSON values in one round-trip (None for missing keys)."""
+        if not self._client or not keys:
+            return [None] * len(keys)
+        values = await self._client.mget(keys)
+        return [orjson.loads(value) if value else None for value in values]
+    
+    async def mset_json(
+        self,
+        items: dict[str, Any],
+        expire_seconds: int = None,
+    ) -> bool:
+        """Set many JSON values in one pipelined round-trip."""
+        if not self._client:
+            return False
+        if not items:
+            return True
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, _dumps(value), ex=expire_seconds)
+            await pipe.execute()
+        return True
     
     # =========================================================================
     # Market Data Cache
@@ -120,18 +269,49 @@ class RedisCache:
         volume: int = None,
     ) -> None:
         """Cache real-time market price."""
-        data = {
-            "price": price,
-            "bid": bid,
-            "ask": ask,
-            "volume": volume,
-            "timestamp": asyncio.get_event_loop().time(),
-        }
-        await self.set_json(f"price:{symbol}", data, expire_seconds=60)
+        if not self._binary_client:
+            return
+        await self._binary_client.set(
+            f"price:{symbol}",
+            _pack_price(price, bid, ask, volume, monotonic()),
+            ex=PRICE_TTL_SECONDS,
+        )
+    
+    async def cache_market_prices_batch(
+        self,
+        quotes: list[tuple[str, float, Optional[float], Optional[float], Optional[int]]],
+    ) -> None:
+        """
+        Cache many market prices in one pipelined round-trip.
+        
+        Args:
+            quotes: (symbol, price, bid, ask, volume) tuples
+        """
+        if not self._binary_client or not quotes:
+            return
+        timestamp = monotonic()
+        async with self._binary_client.pipeline(transaction=False) as pipe:
+            for symbol, price, bid, ask, volume in quotes:
+                pipe.set(
+                    f"price:{symbol}",
+                    _pack_price(price, bid, ask, volume, timestamp),
+                    ex=PRICE_TTL_SECONDS,
+                )
+            await pipe.execute()
     
     async def get_market_price(self, symbol: str) -> Optional[dict]:
         """Get cached market price."""
-        return await self.get_json(f"price:{symbol}")
+        if not self._binary_client:
+            return None
+        raw = await self._binary_client.get(f"price:{symbol}")
+        return _unpack_price(raw)
+    
+    async def get_market_prices(self, symbols: list[str]) -> dict[str, Optional[dict]]:
+        """Get cached market prices for many symbols in one round-trip."""
+        if not self._binary_client or not symbols:
+            return dict.fromkeys(symbols)
+        values = await self._binary_client.mget([f"price:{symbol}" for symbol in symbols])
+        return {symbol: _unpack_price(raw) for symbol, raw in zip(symbols, values)}
     
     async def cache_ohlcv(
         self,
@@ -139,16 +319,29 @@ class RedisCache:
         timeframe: str,
         bars: list[dict],
     ) -> None:
-        """Cache OHLCV bars."""
-        await self.set_json(
+        """Cache OHLCV bars (stored column-wise and compressed)."""
+        if not self._binary_client:
+            return
+        await self._binary_client.set(
             f"ohlcv:{symbol}:{timeframe}",
-            bars,
-            expire_seconds=300,  # 5 minutes
+            _pack_columns(bars),
+            ex=300,  # 5 minutes
         )
     
+    async def get_ohlcv_columns(self, symbol: str, timeframe: str) -> Optional[dict[str, list]]:
+        """Get cached OHLCV bars as columns (column name -> values)."""
+        if not self._binary_client:
+            return None
+        raw = await self._binary_client.get(f"ohlcv:{symbol}:{timeframe}")
+        return _unpack_columns(raw)
+    
     async def get_ohlcv(self, symbol: str, timeframe: str) -> Optional[list[dict]]:
         """Get cached OHLCV bars."""
-        return await self.get_json(f"ohlcv:{symbol}:{timeframe}")
+        columns = await self.get_ohlcv_columns(symbol, timeframe)
+        if not columns:
+            return None
+        names = list(columns)
+        return [dict(zip(names, row)) for row in zip(*columns.values())]
     
     # =========================================================================
     # News Deduplication
@@ -170,38 +363,94 @@ class RedisCache:
             expire_seconds=expire_hours * 3600,
         )
     
+    async def try_mark_article_seen(
+        self,
+        article_id: str,
+        expire_hours: int = 24,
+    ) -> bool:
+        """
+        Atomically mark an article as seen (SET NX EX).
+        
+        Returns True if this call marked it, i.e. the article is new and
+        should be processed; False if it had already been seen. Without a
+        connection every article is treated as new.
+        """
+        if not self._client:
+            return True
+        return bool(await self._client.set(
+            f"news:seen:{article_id}",
+            "1",
+            ex=expire_hours * 3600,
+            nx=True,
+        ))
+    
+    async def seen_and_mark_batch(
+        self,
+        article_ids: list[str],
+        expire_hours: int = 24,
+    ) -> list[bool]:
+        """
+        Mark many articles as seen in one pipelined round-trip.
+        
+        Returns, per article, whether it had already been seen. Each mark
+        is a SET NX, so only the first caller to see an article gets False.
+        """
+        if not self._client:
+            return [False] * len(article_ids)
+        if not article_ids:
+            return []
+        expire_seconds = expire_hours * 3600
+        async with self._client.pipeline(transaction=False) as pipe:
+            for article_id in article_ids:
+                pipe.set(f"news:seen:{article_id}", "1", ex=expire_seconds, nx=True)
+            results = await pipe.execute()
+        return [not inserted for inserted in results]
+    
     # =========================================================================
     # Trading State
     # =========================================================================
     
     async def set_trading_paused(self, paused: bool) -> None:
         """Set trading pause state."""
-        await self.set("trading:paused", "1" if paused else "0")
+        await self._set_trading_flag(_PAUSED_BIT, paused)
     
     async def is_trading_paused(self) -> bool:
         """Check if trading is paused."""
-        value = await self.get("trading:paused")
-        return value == "1"
+        return await self._get_trading_flag(_PAUSED_BIT)
     
     async def set_kill_switch_active(self, active: bool) -> None:
         """Set kill switch state."""
-        await self.set("trading:kill_switch", "1" if active else "0")
+        await self._set_trading_flag(_KILL_SWITCH_BIT, active)
     
     async def is_kill_switch_active(self) -> bool:
         """Check if kill switch is active."""
-        value = await self.get("trading:kill_switch")
-        return value == "1"
+        return await self._get_trading_flag(_KILL_SWITCH_BIT)
+    
+    async def trading_gate(self) -> tuple[bool, bool]:
+        """Get (trading paused, kill switch active) in one round-trip."""
+        if not self._client:
+            return False, False
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.getbit(_TRADING_FLAGS_KEY, _PAUSED_BIT)
+            pipe.getbit(_TRADING_FLAGS_KEY, _KILL_SWITCH_BIT)
+            paused, killed = await pipe.execute()
+        return bool(paused), bool(killed)
+    
+    async def _set_trading_flag(self, bit: int, value: bool) -> None:
+        if self._client:
+            await self._client.setbit(_TRADING_FLAGS_KEY, bit, int(value))
+    
+    async def _get_trading_flag(self, bit: int) -> bool:
+        if not self._client:
+            return False
+        return bool(await self._client.getbit(_TRADING_FLAGS_KEY, bit))
     
     async def increment_order_count(self) -> int:
         """Increment and get today's order count."""
-        if not self._client:
+        if not self._incr_with_expiry:
             return 0
-        key = "trading:order_count"
-        count = await self._client.incr(key)
-        # Set expiry to end of day if this is the first order
-        if count == 1:
-            await self._client.expire(key, 86400)  # 24 hours
-        return count
+        # Atomic INCR, setting a 24 hour expiry on the first order
+        return int(await self._incr_with_expiry(keys=["trading:order_count"], args=[86400]))
     
     # =========================================================================
     # Pub/Sub Messaging
@@ -212,9 +461,15 @@ class RedisCache:
         if not self._client:
             return
         if isinstance(message, dict):
-            message = json.dumps(message)
+            message = _dumps(message)
         await self._client.publish(channel, message)
     
+    async def publish_dict(self, channel: str, message: dict) -> None:
+        """Publish a dict message to a channel as JSON."""
+        if not self._client:
+            return
+        await self._client.publish(channel, _dumps(message))
+    
     async def subscribe(self, channel: str, callback: Callable) -> None:
         """Subscribe to a channel with a callback."""
         if not self._client:
@@ -224,9 +479,23 @@ class RedisCache:
             self._pubsub = self._client.pubsub()
         
         await self._pubsub.subscribe(channel)
-        self._subscriptions[channel] = callback
+        self._subscriptions = {
+            **self._subscriptions,
+            channel: (callback, asyncio.iscoroutinefunction(callback)),
+        }
         logger.info(f"Subscribed to Redis channel: {channel}")
     
+    async def unsubscribe(self, channel: str) -> None:
+        """Unsubscribe from a channel."""
+        if not self._pubsub or channel not in self._subscriptions:
+            return
+        
+        await self._pubsub.unsubscribe(channel)
+        subscriptions = dict(self._subscriptions)
+        del subscriptions[channel]
+        self._subscriptions = subscriptions
+        logger.info(f"Unsubscribed from Redis channel: {channel}")
+    
     async def start_listening(self) -> None:
         """Start listening for pub/sub messages."""
         if not self._pubsub:
@@ -239,20 +508,22 @@ class RedisCache:
                 
                 # Try to parse as JSON
                 try:
-                    data = json.loads(data)
-                except (json.JSONDecodeError, TypeError):
+                    data = orjson.loads(data)
+                except (orjson.JSONDecodeError, TypeError):
                     pass
                 
                 # Call the callback
-                callback = self._subscriptions.get(channel)
-                if callback:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(data)
-                        else:
-                            callback(data)
-                    except Exception as e:
-                        logger.error(f"Error in pubsub callback for {channel}: {e}")
+                try:
+                    callback, is_async = self._subscriptions[channel]
+                except KeyError:
+                    continue
+                try:
+                    if is_async:
+                        await callback(data)
+                    else:
+                        callback(data)
+                except Exception as e:
+                    logger.error(f"Error in pubsub callback for {channel}: {e}")
     
     # =========================================================================
     # Strategy Signals
@@ -274,7 +545,7 @@ class RedisCache:
             "strength": strength,
             "metadata": metadata or {},
         }
-        await self.publish("signals", message)
+        await self.publish_dict("signals", message)
     
     async def publish_news_alert(
         self,
@@ -292,7 +563,7 @@ class RedisCache:
             "urgency": urgency,
             "source": source,
         }
-        await self.publish("news_alerts", message)
+        await self.publish_dict("news_alerts", message)
 
 
 # Singleton instance
@@ -12,18 +12,73 @@ This integration provides:
 - Earnings tracking
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
+import importlib.util
 import httpx
+from cachetools import TTLCache
+import numpy as np
+import orjson
 from loguru import logger
 
-from src.data_sources.base import BaseDataSource, NewsArticle, TradingSignal, InsiderTrade
+from src.data_sources.base import (
+    BaseDataSource, DataSourceType, NewsArticle, TradingSignal, InsiderTrade,
+)
 from src.data_sources.registry import DataSourceRegistry
 from src.config.settings import get_settings
 
 
-@dataclass
+# One pooled client per (base_url, api_key), shared by every AInvestDataSource
+# instance so keep-alive connections survive the per-request instances the
+# API routes create. HTTP/2 is used when the optional ``h2`` package is present.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0)
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_http_clients: Dict[Tuple[str, str], httpx.AsyncClient] = {}
+
+
+def _get_http_client(base_url: str, api_key: str) -> httpx.AsyncClient:
+    """Return the shared client for ``base_url``/``api_key``, creating it if needed."""
+    key = (base_url, api_key)
+    client = _http_clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Accept": "application/json"
+            },
+            http2=_HTTP2_AVAILABLE,
+            limits=_HTTP_LIMITS,
+            timeout=_HTTP_TIMEOUT,
+        )
+        _http_clients[key] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close every shared AInvest HTTP client (call on application shutdown)."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# Failures an API call can hit after connecting: transport errors, malformed
+# JSON or dates (ValueError, incl. orjson.JSONDecodeError) and missing or
+# mistyped fields. Any of these falls back to mock data.
+_RESPONSE_ERRORS = (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError)
+
+
+def _parse_iso_column(items: List[Dict[str, Any]], key: str) -> List[datetime]:
+    """Parse the ISO-8601 ``key`` field of every item, decoding each distinct string once."""
+    raw = [item[key] for item in items]
+    parsed = {value: datetime.fromisoformat(value) for value in set(raw)}
+    return [parsed[value] for value in raw]
+
+
+@dataclass(slots=True, frozen=True)
 class AInvestRecommendation:
     """AI-powered stock recommendation from AInvest."""
     symbol: str
@@ -37,8 +92,23 @@ class AInvestRecommendation:
     confidence: float
     analysis_date: datetime
     
-    
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "symbol": self.symbol,
+            "company": self.company,
+            "ai_score": self.ai_score,
+            "recommendation": self.recommendation,
+            "target_price": self.target_price,
+            "current_price": self.current_price,
+            "upside_pct": self.upside_pct,
+            "signals": list(self.signals),
+            "confidence": self.confidence,
+            "analysis_date": self.analysis_date.isoformat(),
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class AInvestSentiment:
     """Sentiment analysis for a stock."""
     symbol: str
@@ -49,6 +119,34 @@ class AInvestSentiment:
     volume_sentiment: float  # Based on unusual volume
     last_updated: datetime
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "symbol": self.symbol,
+            "overall_sentiment": self.overall_sentiment,
+            "news_sentiment": self.news_sentiment,
+            "social_sentiment": self.social_sentiment,
+            "analyst_sentiment": self.analyst_sentiment,
+            "volume_sentiment": self.volume_sentiment,
+            "last_updated": self.last_updated.isoformat(),
+        }
+
+
+def _build_recommendation(item: Dict[str, Any], analysis_date: datetime) -> AInvestRecommendation:
+    """Build a recommendation from an API item (positional, in field order)."""
+    return AInvestRecommendation(
+        item["symbol"],
+        item["company"],
+        item["ai_score"],
+        item["recommendation"],
+        item["target_price"],
+        item["current_price"],
+        item["upside_pct"],
+        item.get("signals", []),
+        item.get("confidence", 75),
+        analysis_date,
+    )
+
 
 class AInvestDataSource(BaseDataSource):
     """
@@ -64,51 +162,123 @@ class AInvestDataSource(BaseDataSource):
     
     BASE_URL = "https://api.ainvest.com/v1"  # Placeholder - actual API endpoint TBD
     
-    def __init__(self):
-        settings = get_settings()
-        self.api_key = settings.ainvest_api_key if hasattr(settings, 'ainvest_api_key') else ""
-        self.connected = False
+    # Endpoint paths, parsed once (relative to BASE_URL)
+    _URL_HEALTH = httpx.URL("/health")
+    _URL_RECOMMENDATIONS = httpx.URL("/recommendations")
+    _URL_NEWS = httpx.URL("/news")
+    _URL_SIGNALS = httpx.URL("/signals")
+    _URL_INSIDER_TRADES = httpx.URL("/insider-trades")
+    _URL_EARNINGS = httpx.URL("/earnings")
+    
+    # API responses are cached per class: routes create a new instance per
+    # request, and AInvest refreshes this data on a scale of minutes. Keys
+    # start with _cache_scope so sources with different endpoints or
+    # credentials never serve each other's data.
+    _sentiment_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+    _recommendation_cache: TTLCache = TTLCache(maxsize=64, ttl=900)
+    _earnings_cache: TTLCache = TTLCache(maxsize=32, ttl=3600)
+    
+    # Pools the mock data generators draw from
+    _MOCK_SYMBOLS: Tuple[str, ...] = (
+        "NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD", 
+        "PLTR", "SMCI", "CRM", "ORCL", "NFLX", "ADBE", "INTC", "MU",
+        "AVGO", "QCOM", "AMAT", "LRCX", "KLAC", "MRVL", "ON", "MCHP"
+    )
+    _MOCK_RECOMMENDATIONS: Tuple[str, ...] = ("Strong Buy", "Buy", "Hold", "Sell", "Strong Sell")
+    _MOCK_RECOMMENDATION_SIGNALS: Tuple[str, ...] = (
+        "Momentum Surge", "Value Play", "Breakout Imminent", "Oversold Bounce",
+        "Earnings Catalyst", "Insider Buying", "Institutional Accumulation",
+        "Technical Breakout", "RSI Divergence", "MACD Crossover",
+        "Volume Spike", "Price Gap Fill", "Support Bounce", "Channel Breakout"
+    )
+    _MOCK_NEWS_TICKERS: Tuple[str, ...] = ("NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD")
+    _MOCK_HEADLINES: Tuple[str, ...] = (  # %s is the ticker
+        "%s Beats Earnings Expectations",
+        "%s Announces New Product Launch",
+        "Analysts Upgrade %s Rating",
+        "%s Expands Into New Markets",
+        "%s Partners with Major Tech Company",
+        "%s Stock Rises on Strong Guidance",
+        "Institutional Investors Increase %s Holdings",
+        "%s CEO Discusses Growth Strategy"
+    )
+    _MOCK_SIGNAL_TICKERS: Tuple[str, ...] = (
+        "NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD", "SPY", "QQQ"
+    )
+    _MOCK_SIGNAL_TYPES: Tuple[str, ...] = (
+        "AI Buy Signal", "Momentum Alert", "Breakout Detected", 
+        "Unusual Volume", "RSI Oversold", "MACD Bullish Cross"
+    )
+    _MOCK_SIGNAL_REASONS: Tuple[str, ...] = tuple(
+        f"AI detected {signal.lower()} pattern" for signal in _MOCK_SIGNAL_TYPES
+    )
+    _MOCK_INSIDER_TICKERS: Tuple[str, ...] = ("NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD")
+    _MOCK_INSIDER_TITLES: Tuple[str, ...] = ("CEO", "CFO", "Director", "VP Sales", "COO", "CTO", "Board Member")
+    _MOCK_FIRST_NAMES: Tuple[str, ...] = ("John", "Jane", "Robert", "Sarah")
+    _MOCK_LAST_NAMES: Tuple[str, ...] = ("Smith", "Johnson", "Williams", "Brown")
+    _MOCK_EARNINGS_TICKERS: Tuple[str, ...] = (
+        "NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD", "CRM", "ORCL"
+    )
+    _MOCK_REPORT_TIMES: Tuple[str, ...] = ("BMO", "AMC")
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Optional seed for the mock data generator (reproducible mocks)
+        """
+        super().__init__(DataSourceType.AINVEST)
+        self.api_key = get_settings().ainvest_api_key
         self.http_client: Optional[httpx.AsyncClient] = None
+        self._rng = np.random.default_rng(seed)
         logger.info("AInvestDataSource initialized")
+    
+    @property
+    def connected(self) -> bool:
+        """Alias of is_connected, kept for existing callers."""
+        return self._connected
         
     async def connect(self) -> bool:
         """Establish connection to AInvest API."""
         try:
             if not self.api_key:
                 logger.warning("AInvest API key not configured. Using mock data mode.")
-                self.connected = True
+                self._connected = True
                 return True
                 
-            self.http_client = httpx.AsyncClient(
-                base_url=self.BASE_URL,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Accept": "application/json"
-                },
-                timeout=30.0
-            )
+            self.http_client = _get_http_client(self.BASE_URL, self.api_key)
             
             # Test connection
-            response = await self.http_client.get("/health")
+            response = await self.http_client.get(self._URL_HEALTH)
             if response.status_code == 200:
-                self.connected = True
+                self._connected = True
                 logger.info("Connected to AInvest API")
                 return True
             return False
             
         except Exception as e:
             logger.warning(f"Could not connect to AInvest API: {e}. Using mock data.")
-            self.connected = True  # Allow mock data
+            self._connected = True  # Allow mock data
             return True
             
     async def disconnect(self) -> None:
-        """Disconnect from AInvest API."""
-        if self.http_client:
-            await self.http_client.aclose()
-            self.http_client = None
-        self.connected = False
+        """Disconnect from AInvest API.
+        
+        The underlying HTTP client is shared and stays open; see close_http_clients().
+        """
+        self.http_client = None
+        self._connected = False
         logger.info("Disconnected from AInvest")
     
+    @property
+    def _cache_scope(self) -> Tuple[str, str]:
+        """Leading part of every response cache key."""
+        return (self.BASE_URL, self.api_key)
+    
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Decode a response body straight from bytes with orjson."""
+        return orjson.loads(response.content)
+    
     async def get_quote(self, symbol: str):
         """Get real-time quote for a symbol.
         
@@ -149,44 +319,98 @@ class AInvestDataSource(BaseDataSource):
         Returns:
             List of AInvestRecommendation objects
         """
-        if not self.connected:
+        if not self._connected:
             await self.connect()
             
         try:
             if self.http_client and self.api_key:
+                cache_key = (*self._cache_scope, tuple(sorted(symbols or ())), min_score, limit)
+                cached = self._recommendation_cache.get(cache_key)
+                if cached is not None:
+                    return list(cached)
+                    
                 params = {"limit": limit}
                 if symbols:
                     params["symbols"] = ",".join(symbols)
                 if min_score > 0:
                     params["min_score"] = min_score
                     
-                response = await self.http_client.get("/recommendations", params=params)
-                response.raise_for_status()
-                data = response.json()
+                response = await self.http_client.get(self._URL_RECOMMENDATIONS, params=params)
+                if response.status_code != 200:
+                    logger.error(f"AInvest recommendations request failed: HTTP {response.status_code}")
+                    return self._generate_mock_recommendations(symbols, limit)
+                data = self._json(response)
+                items = data.get("recommendations", [])
                 
-                return [
-                    AInvestRecommendation(
-                        symbol=item["symbol"],
-                        company=item["company"],
-                        ai_score=item["ai_score"],
-                        recommendation=item["recommendation"],
-                        target_price=item["target_price"],
-                        current_price=item["current_price"],
-                        upside_pct=item["upside_pct"],
-                        signals=item.get("signals", []),
-                        confidence=item.get("confidence", 75),
-                        analysis_date=datetime.fromisoformat(item["analysis_date"])
-                    )
-                    for item in data.get("recommendations", [])
+                recommendations = [
+                    _build_recommendation(item, analysis_date)
+                    for item, analysis_date in zip(items, _parse_iso_column(items, "analysis_date"))
                 ]
+                self._recommendation_cache[cache_key] = recommendations
+                return list(recommendations)
             else:
                 # Return mock data
                 return self._generate_mock_recommendations(symbols, limit)
                 
-        except Exception as e:
+        except _RESPONSE_ERRORS as e:
             logger.error(f"Error fetching AInvest recommendations: {e}")
             return self._generate_mock_recommendations(symbols, limit)
             
+    async def iter_ai_recommendations(
+        self,
+        symbols: Optional[List[str]] = None,
+        min_score: float = 0,
+        limit: int = 100
+    ) -> AsyncIterator[AInvestRecommendation]:
+        """
+        Stream AI-powered stock recommendations as they are received.
+        
+        Newline-delimited JSON responses are decoded line by line, so callers
+        can stop early without reading the rest of the body; a regular JSON
+        body is decoded once it has arrived. Unlike get_ai_recommendations,
+        results are not cached and HTTP errors propagate to the caller.
+        
+        Args:
+            symbols: Optional list of symbols to filter
+            min_score: Minimum AI score (0-100)
+            limit: Maximum number of recommendations
+            
+        Yields:
+            AInvestRecommendation objects
+        """
+        if not self._connected:
+            await self.connect()
+            
+        if not (self.http_client and self.api_key):
+            for recommendation in self._generate_mock_recommendations(symbols, limit):
+                yield recommendation
+            return
+            
+        params = {"limit": limit}
+        if symbols:
+            params["symbols"] = ",".join(symbols)
+        if min_score > 0:
+            params["min_score"] = min_score
+            
+        async with self.http_client.stream(
+            "GET",
+            self._URL_RECOMMENDATIONS,
+            params=params,
+            headers={"Accept": "application/x-ndjson, application/json"},
+        ) as response:
+            response.raise_for_status()
+            if response.headers.get("content-type", "").startswith("application/x-ndjson"):
+                async for line in response.aiter_lines():
+                    if line:
+                        item = orjson.loads(line)
+                        yield _build_recommendation(item, datetime.fromisoformat(item["analysis_date"]))
+                return
+            await response.aread()
+            
+        items = self._json(response).get("recommendations", [])
+        for item, analysis_date in zip(items, _parse_iso_column(items, "analysis_date")):
+            yield _build_recommendation(item, analysis_date)
+            
     async def get_sentiment(self, symbol: str) -> Optional[AInvestSentiment]:
         """
         Get sentiment analysis for a stock.
@@ -197,16 +421,23 @@ class AInvestDataSource(BaseDataSource):
         Returns:
             AInvestSentiment object or None
         """
-        if not self.connected:
+        if not self._connected:
             await self.connect()
             
         try:
             if self.http_client and self.api_key:
+                cache_key = (*self._cache_scope, symbol)
+                sentiment = self._sentiment_cache.get(cache_key)
+                if sentiment is not None:
+                    return sentiment
+                    
                 response = await self.http_client.get(f"/sentiment/{symbol}")
-                response.raise_for_status()
-                data = response.json()
+                if response.status_code != 200:
+                    logger.error(f"AInvest sentiment request for {symbol} failed: HTTP {response.status_code}")
+                    return self._generate_mock_sentiment(symbol)
+                data = self._json(response)
                 
-                return AInvestSentiment(
+                sentiment = AInvestSentiment(
                     symbol=symbol,
                     overall_sentiment=data["overall_sentiment"],
                     news_sentiment=data["news_sentiment"],
@@ -215,14 +446,32 @@ class AInvestDataSource(BaseDataSource):
                     volume_sentiment=data.get("volume_sentiment", 0),
                     last_updated=datetime.fromisoformat(data["last_updated"])
                 )
+                self._sentiment_cache[cache_key] = sentiment
+                return sentiment
             else:
                 # Return mock data
                 return self._generate_mock_sentiment(symbol)
                 
-        except Exception as e:
+        except _RESPONSE_ERRORS as e:
             logger.error(f"Error fetching AInvest sentiment for {symbol}: {e}")
             return self._generate_mock_sentiment(symbol)
             
+    async def get_sentiments(self, symbols: List[str]) -> Dict[str, AInvestSentiment]:
+        """
+        Get sentiment analysis for several stocks concurrently.
+        
+        Args:
+            symbols: Stock ticker symbols
+            
+        Returns:
+            Dict of symbol to AInvestSentiment (symbols that failed are omitted)
+        """
+        if not self._connected:
+            await self.connect()
+            
+        results = await self._gather_per_symbol(self.get_sentiment, symbols)
+        return {s: r for s, r in zip(symbols, results) if isinstance(r, AInvestSentiment)}
+            
     async def get_news(
         self, 
         symbols: Optional[List[str]] = None, 
@@ -238,7 +487,7 @@ class AInvestDataSource(BaseDataSource):
         Returns:
             List of NewsArticle objects
         """
-        if not self.connected:
+        if not self._connected:
             await self.connect()
             
         try:
@@ -247,27 +496,31 @@ class AInvestDataSource(BaseDataSource):
                 if symbols:
                     params["symbols"] = ",".join(symbols)
                     
-                response = await self.http_client.get("/news", params=params)
-                response.raise_for_status()
-                data = response.json()
+                response = await self.http_client.get(self._URL_NEWS, params=params)
+                if response.status_code != 200:
+                    logger.error(f"AInvest news request failed: HTTP {response.status_code}")
+                    return self._generate_mock_news(symbols, limit)
+                data = self._json(response)
+                items = data.get("articles", [])
                 
                 return [
+                    # Positional arguments, in NewsArticle field order
                     NewsArticle(
-                        title=item["title"],
-                        url=item["url"],
-                        source="AInvest",
-                        published=datetime.fromisoformat(item["published_at"]),
-                        sentiment=item.get("sentiment"),
-                        symbols=item.get("symbols", []),
-                        content=item.get("content")
+                        item["title"],
+                        item.get("content") or "",  # summary
+                        "AInvest",
+                        item["url"],
+                        published,
+                        item.get("symbols", []),
+                        item.get("sentiment") or 0.0,
                     )
-                    for item in data.get("articles", [])
+                    for item, published in zip(items, _parse_iso_column(items, "published_at"))
                 ]
             else:
                 # Return mock data
                 return self._generate_mock_news(symbols, limit)
                 
-        except Exception as e:
+        except _RESPONSE_ERRORS as e:
             logger.error(f"Error fetching AInvest news: {e}")
             return self._generate_mock_news(symbols, limit)
             
@@ -286,7 +539,7 @@ class AInvestDataSource(BaseDataSource):
         Returns:
             List of TradingSignal objects
         """
-        if not self.connected:
+        if not self._connected:
             await self.connect()
             
         try:
@@ -295,31 +548,35 @@ class AInvestDataSource(BaseDataSource):
                 if signal_type:
                     params["type"] = signal_type
                     
-                response = await self.http_client.get("/signals", params=params)
-                response.raise_for_status()
-                data = response.json()
+                response = await self.http_client.get(self._URL_SIGNALS, params=params)
+                if response.status_code != 200:
+                    logger.error(f"AInvest trading signals request failed: HTTP {response.status_code}")
+                    return self._generate_mock_signals(limit)
+                data = self._json(response)
+                items = data.get("signals", [])
                 
                 return [
+                    # Positional arguments, in TradingSignal field order
                     TradingSignal(
-                        source="AInvest",
-                        signal_type=item["signal_type"],
-                        symbol=item["symbol"],
-                        strength=item.get("strength", 0.7),
-                        price=item.get("price", 0.0),
-                        target_price=item.get("target_price"),
-                        stop_loss=item.get("stop_loss"),
-                        timestamp=datetime.fromisoformat(item["timestamp"]),
-                        confidence=item.get("confidence", 0.7),
-                        timeframe=item.get("timeframe", "1d"),
-                        reasoning=item.get("reasoning", "")
+                        item["symbol"],
+                        item["signal_type"],
+                        item.get("strength", 0.7),
+                        "AInvest",
+                        item.get("price", 0.0),
+                        item.get("target_price"),
+                        item.get("stop_loss"),
+                        timestamp,
+                        item.get("confidence", 0.7),
+                        item.get("timeframe", "1d"),
+                        item.get("reasoning", ""),
                     )
-                    for item in data.get("signals", [])
+                    for item, timestamp in zip(items, _parse_iso_column(items, "timestamp"))
                 ]
             else:
                 # Return mock data
                 return self._generate_mock_signals(limit)
                 
-        except Exception as e:
+        except _RESPONSE_ERRORS as e:
             logger.error(f"Error fetching AInvest trading signals: {e}")
             return self._generate_mock_signals(limit)
             
@@ -333,33 +590,43 @@ class AInvestDataSource(BaseDataSource):
         Returns:
             List of InsiderTrade objects
         """
-        if not self.connected:
+        if not self._connected:
             await self.connect()
             
         try:
             if self.http_client and self.api_key:
-                response = await self.http_client.get("/insider-trades", params={"limit": limit})
-                response.raise_for_status()
-                data = response.json()
+                response = await self.http_client.get(self._URL_INSIDER_TRADES, params={"limit": limit})
+                if response.status_code != 200:
+                    logger.error(f"AInvest insider trades request failed: HTTP {response.status_code}")
+                    return self._generate_mock_insider_trades(limit)
+                data = self._json(response)
+                items = data.get("trades", [])
                 
                 return [
+                    # Positional arguments, in InsiderTrade field order
                     InsiderTrade(
-                        ticker=item["ticker"],
-                        insider_name=item["insider_name"],
-                        relation=item["relation"],
-                        trade_type=item["trade_type"],
-                        value=item["value"],
-                        shares=item["shares"],
-                        trade_date=datetime.fromisoformat(item["trade_date"]),
-                        filing_date=datetime.fromisoformat(item["filing_date"])
+                        item["ticker"],
+                        item["insider_name"],
+                        item["relation"],  # title
+                        item["trade_type"],
+                        item["shares"],
+                        item.get("price", 0.0),
+                        item["value"],
+                        item.get("shares_owned_after", 0),
+                        filing_date,
+                        trade_date,
+                    )
+                    for item, trade_date, filing_date in zip(
+                        items,
+                        _parse_iso_column(items, "trade_date"),
+                        _parse_iso_column(items, "filing_date"),
                     )
-                    for item in data.get("trades", [])
                 ]
             else:
                 # Return mock data
                 return self._generate_mock_insider_trades(limit)
                 
-        except Exception as e:
+        except _RESPONSE_ERRORS as e:
             logger.error(f"Error fetching AInvest insider trades: {e}")
             return self._generate_mock_insider_trades(limit)
             
@@ -380,7 +647,7 @@ class AInvestDataSource(BaseDataSource):
         Returns:
             List of earnings report dictionaries
         """
-        if not self.connected:
+        if not self._connected:
             await self.connect()
             
         if start_date is None:
@@ -390,18 +657,27 @@ class AInvestDataSource(BaseDataSource):
             
         try:
             if self.http_client and self.api_key:
+                cache_key = (*self._cache_scope, start_date.date(), end_date.date(), limit)
+                cached = self._earnings_cache.get(cache_key)
+                if cached is not None:
+                    return list(cached)
+                    
                 params = {
                     "start": start_date.isoformat(),
                     "end": end_date.isoformat(),
                     "limit": limit
                 }
-                response = await self.http_client.get("/earnings", params=params)
-                response.raise_for_status()
-                return response.json().get("earnings", [])
+                response = await self.http_client.get(self._URL_EARNINGS, params=params)
+                if response.status_code != 200:
+                    logger.error(f"AInvest earnings calendar request failed: HTTP {response.status_code}")
+                    return self._generate_mock_earnings(limit)
+                earnings = self._json(response).get("earnings", [])
+                self._earnings_cache[cache_key] = earnings
+                return list(earnings)
             else:
                 return self._generate_mock_earnings(limit)
                 
-        except Exception as e:
+        except _RESPONSE_ERRORS as e:
             logger.error(f"Error fetching AInvest earnings calendar: {e}")
             return self._generate_mock_earnings(limit)
             
@@ -415,68 +691,69 @@ class AInvestDataSource(BaseDataSource):
         limit: int
     ) -> List[AInvestRecommendation]:
         """Generate mock AI recommendations."""
-        import random
+        all_symbols = symbols or self._MOCK_SYMBOLS
+        recommendations = self._MOCK_RECOMMENDATIONS
+        signal_types = self._MOCK_RECOMMENDATION_SIGNALS
         
-        all_symbols = symbols or [
-            "NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD", 
-            "PLTR", "SMCI", "CRM", "ORCL", "NFLX", "ADBE", "INTC", "MU",
-            "AVGO", "QCOM", "AMAT", "LRCX", "KLAC", "MRVL", "ON", "MCHP"
-        ]
+        n = min(limit, len(all_symbols) * 4)
+        if n <= 0:
+            return []
+        rng = self._rng
         
-        recommendations = ["Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"]
-        signal_types = [
-            "Momentum Surge", "Value Play", "Breakout Imminent", "Oversold Bounce",
-            "Earnings Catalyst", "Insider Buying", "Institutional Accumulation",
-            "Technical Breakout", "RSI Divergence", "MACD Crossover",
-            "Volume Spike", "Price Gap Fill", "Support Bounce", "Channel Breakout"
-        ]
+        # Draw every column in one vectorized call per field
+        current_prices = rng.uniform(50, 500, n)
+        # Rounded before bucketing so the reported score matches its bucket
+        ai_scores = rng.uniform(55, 95, n).round(1)
+        coin = rng.random(n) < 0.5
         
-        results = []
-        for i in range(min(limit, len(all_symbols) * 4)):
-            symbol = all_symbols[i % len(all_symbols)]
-            current_price = random.uniform(50, 500)
-            ai_score = random.uniform(55, 95)
-            
-            # Bias recommendation based on AI score
-            if ai_score >= 80:
-                rec = random.choice(["Strong Buy", "Buy"])
-            elif ai_score >= 65:
-                rec = random.choice(["Buy", "Hold"])
-            elif ai_score >= 50:
-                rec = "Hold"
-            else:
-                rec = random.choice(["Hold", "Sell"])
-                
-            upside = random.uniform(-10, 40) if rec in ["Strong Buy", "Buy"] else random.uniform(-20, 15)
-            target = current_price * (1 + upside / 100)
-            
-            results.append(AInvestRecommendation(
-                symbol=symbol,
-                company=f"{symbol} Corporation",
-                ai_score=round(ai_score, 1),
-                recommendation=rec,
-                target_price=round(target, 2),
-                current_price=round(current_price, 2),
-                upside_pct=round(upside, 1),
-                signals=random.sample(signal_types, random.randint(1, 4)),
-                confidence=round(random.uniform(65, 95), 0),
-                analysis_date=datetime.now() - timedelta(hours=random.randint(0, 48))
-            ))
-            
-        return results[:limit]
+        # Bias recommendation based on AI score (indexes into recommendations):
+        # >= 80 Strong Buy or Buy, >= 65 Buy or Hold, otherwise Hold
+        rec_codes = np.where(
+            ai_scores >= 80,
+            np.where(coin, 0, 1),
+            np.where((ai_scores >= 65) & coin, 1, 2),
+        )
+        bullish = rec_codes <= 1
+        upsides = np.where(bullish, rng.uniform(-10, 40, n), rng.uniform(-20, 15, n))
+        targets = current_prices * (1 + upsides / 100)
+        
+        # 1-4 distinct signals per recommendation: rank random keys per row
+        signal_counts = rng.integers(1, 5, n)
+        signal_order = rng.random((n, len(signal_types))).argsort(axis=1)[:, :4]
+        confidences = rng.uniform(65, 95, n).round(0)
+        hours_ago = rng.integers(0, 49, n)
+        
+        now = datetime.now()
+        return [
+            AInvestRecommendation(
+                symbol=all_symbols[i % len(all_symbols)],
+                company=f"{all_symbols[i % len(all_symbols)]} Corporation",
+                ai_score=float(ai_scores[i]),
+                recommendation=recommendations[rec_codes[i]],
+                target_price=round(float(targets[i]), 2),
+                current_price=round(float(current_prices[i]), 2),
+                upside_pct=round(float(upsides[i]), 1),
+                signals=[signal_types[j] for j in signal_order[i, :signal_counts[i]]],
+                confidence=float(confidences[i]),
+                analysis_date=now - timedelta(hours=int(hours_ago[i])),
+            )
+            for i in range(n)
+        ]
         
     def _generate_mock_sentiment(self, symbol: str) -> AInvestSentiment:
         """Generate mock sentiment data."""
-        import random
-        
-        overall = random.uniform(-0.5, 0.8)
+        overall = float(self._rng.uniform(-0.5, 0.8))
+        # news, social and analyst jitter around overall; volume is independent
+        news, social, analyst, volume = self._rng.uniform(
+            (-0.2, -0.3, -0.1, -0.5), (0.2, 0.3, 0.1, 0.5)
+        ).tolist()
         return AInvestSentiment(
             symbol=symbol,
             overall_sentiment=round(overall, 2),
-            news_sentiment=round(overall + random.uniform(-0.2, 0.2), 2),
-            social_sentiment=round(overall + random.uniform(-0.3, 0.3), 2),
-            analyst_sentiment=round(overall + random.uniform(-0.1, 0.1), 2),
-            volume_sentiment=round(random.uniform(-0.5, 0.5), 2),
+            news_sentiment=round(overall + news, 2),
+            social_sentiment=round(overall + social, 2),
+            analyst_sentiment=round(overall + analyst, 2),
+            volume_sentiment=round(volume, 2),
             last_updated=datetime.now()
         )
         
@@ -486,121 +763,146 @@ class AInvestDataSource(BaseDataSource):
         limit: int
     ) -> List[NewsArticle]:
         """Generate mock news articles."""
-        import random
-        
-        tickers = symbols or ["NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD"]
-        headlines = [
-            "{ticker} Beats Earnings Expectations",
-            "{ticker} Announces New Product Launch",
-            "Analysts Upgrade {ticker} Rating",
-            "{ticker} Expands Into New Markets",
-            "{ticker} Partners with Major Tech Company",
-            "{ticker} Stock Rises on Strong Guidance",
-            "Institutional Investors Increase {ticker} Holdings",
-            "{ticker} CEO Discusses Growth Strategy"
-        ]
+        tickers = symbols or self._MOCK_NEWS_TICKERS
+        headlines = self._MOCK_HEADLINES
+        
+        if limit <= 0:
+            return []
+        rng = self._rng
+        
+        picked = [tickers[t] for t in rng.integers(0, len(tickers), limit).tolist()]
+        headline_idx = rng.integers(0, len(headlines), limit).tolist()
+        hours_ago = rng.integers(0, 73, limit).tolist()
+        sentiments = rng.uniform(-0.5, 0.8, limit).tolist()
+        relevances = rng.uniform(0.6, 0.95, limit).tolist()
         
-        results = []
-        for i in range(limit):
-            ticker = random.choice(tickers)
-            headline = random.choice(headlines).replace("{ticker}", ticker)
-            results.append(NewsArticle(
-                title=headline,
+        now = datetime.now()
+        return [
+            NewsArticle(
+                title=headlines[h] % ticker,
                 summary=f"AI-powered analysis of {ticker}'s market activity and performance.",
                 url=f"https://ainvest.com/news/{ticker.lower()}-{i}",
                 source="AInvest",
-                published=datetime.now() - timedelta(hours=random.randint(0, 72)),
-                sentiment=random.uniform(-0.5, 0.8),
+                published=now - timedelta(hours=hours_ago[i]),
+                sentiment=sentiments[i],
                 symbols=[ticker],
-                relevance=random.uniform(0.6, 0.95),
-            ))
-            
-        return results
+                relevance=relevances[i],
+            )
+            for i, (ticker, h) in enumerate(zip(picked, headline_idx))
+        ]
         
     def _generate_mock_signals(self, limit: int) -> List[TradingSignal]:
         """Generate mock trading signals."""
-        import random
+        tickers = self._MOCK_SIGNAL_TICKERS
+        signal_types = self._MOCK_SIGNAL_TYPES
+        reasons = self._MOCK_SIGNAL_REASONS
         
-        tickers = ["NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD", "SPY", "QQQ"]
-        signal_types = [
-            "AI Buy Signal", "Momentum Alert", "Breakout Detected", 
-            "Unusual Volume", "RSI Oversold", "MACD Bullish Cross"
-        ]
+        if limit <= 0:
+            return []
+        rng = self._rng
+        
+        ticker_idx = rng.integers(0, len(tickers), limit).tolist()
+        type_idx = rng.integers(0, len(signal_types), limit).tolist()
+        reason_idx = rng.integers(0, len(signal_types), limit).tolist()
+        prices = rng.uniform(100, 600, limit).round(2)
+        targets = (prices * 1.15).round(2).tolist()
+        stops = (prices * 0.95).round(2).tolist()
+        prices = prices.tolist()
+        strengths = rng.uniform(0.6, 0.95, limit).tolist()
+        hours_ago = rng.integers(0, 25, limit).tolist()
+        confidences = rng.uniform(0.7, 0.95, limit).tolist()
         
-        results = []
-        for i in range(limit):
-            ticker = random.choice(tickers)
-            price = round(random.uniform(100, 600), 2)
-            results.append(TradingSignal(
+        now = datetime.now()
+        return [
+            TradingSignal(
                 source="AInvest AI",
-                signal_type=random.choice(signal_types),
-                symbol=ticker,
-                strength=random.uniform(0.6, 0.95),
-                price=price,
-                target_price=round(price * 1.15, 2),
-                stop_loss=round(price * 0.95, 2),
-                timestamp=datetime.now() - timedelta(hours=random.randint(0, 24)),
-                confidence=random.uniform(0.7, 0.95),
+                signal_type=signal_types[type_idx[i]],
+                symbol=tickers[ticker_idx[i]],
+                strength=strengths[i],
+                price=prices[i],
+                target_price=targets[i],
+                stop_loss=stops[i],
+                timestamp=now - timedelta(hours=hours_ago[i]),
+                confidence=confidences[i],
                 timeframe="1d",
-                reasoning=f"AI detected {random.choice(signal_types).lower()} pattern"
-            ))
-            
-        return results
+                reasoning=reasons[reason_idx[i]]
+            )
+            for i in range(limit)
+        ]
         
     def _generate_mock_insider_trades(self, limit: int) -> List[InsiderTrade]:
         """Generate mock insider trades."""
-        import random
+        tickers = self._MOCK_INSIDER_TICKERS
+        names = self._MOCK_INSIDER_TITLES
+        first_names = self._MOCK_FIRST_NAMES
+        last_names = self._MOCK_LAST_NAMES
         
-        tickers = ["NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD"]
-        names = ["CEO", "CFO", "Director", "VP Sales", "COO", "CTO", "Board Member"]
+        if limit <= 0:
+            return []
+        rng = self._rng
         
-        results = []
-        for i in range(limit):
-            ticker = random.choice(tickers)
-            transaction_type = "buy" if random.random() > 0.35 else "sell"
-            shares = random.randint(10000, 500000)
-            price = round(random.uniform(100, 500), 2)
-            
-            results.append(InsiderTrade(
-                symbol=ticker,
-                insider_name=f"{random.choice(['John', 'Jane', 'Robert', 'Sarah'])} {random.choice(['Smith', 'Johnson', 'Williams', 'Brown'])}",
-                title=random.choice(names),
-                transaction_type=transaction_type,
-                shares=shares,
-                price=price,
-                value=round(shares * price, 2),
-                shares_owned_after=random.randint(100000, 5000000),
-                transaction_date=datetime.now() - timedelta(days=random.randint(1, 30)),
-                filing_date=datetime.now() - timedelta(days=random.randint(0, 29)),
+        ticker_idx = rng.integers(0, len(tickers), limit).tolist()
+        title_idx = rng.integers(0, len(names), limit).tolist()
+        first_idx = rng.integers(0, len(first_names), limit).tolist()
+        last_idx = rng.integers(0, len(last_names), limit).tolist()
+        is_buy = (rng.random(limit) > 0.35).tolist()
+        shares = rng.integers(10000, 500001, limit)
+        prices = rng.uniform(100, 500, limit).round(2)
+        values = (shares * prices).round(2).tolist()
+        shares = shares.tolist()
+        prices = prices.tolist()
+        owned_after = rng.integers(100000, 5000001, limit).tolist()
+        transaction_days = rng.integers(1, 31, limit).tolist()
+        filing_days = rng.integers(0, 30, limit).tolist()
+        
+        now = datetime.now()
+        return [
+            InsiderTrade(
+                symbol=tickers[ticker_idx[i]],
+                insider_name=f"{first_names[first_idx[i]]} {last_names[last_idx[i]]}",
+                title=names[title_idx[i]],
+                transaction_type="buy" if is_buy[i] else "sell",
+                shares=shares[i],
+                price=prices[i],
+                value=values[i],
+                shares_owned_after=owned_after[i],
+                transaction_date=now - timedelta(days=transaction_days[i]),
+                filing_date=now - timedelta(days=filing_days[i]),
                 source="SEC"
-            ))
-            
-        return results
+            )
+            for i in range(limit)
+        ]
         
     def _generate_mock_earnings(self, limit: int) -> List[Dict[str, Any]]:
         """Generate mock earnings calendar."""
-        import random
+        tickers = self._MOCK_EARNINGS_TICKERS
+        report_times = self._MOCK_REPORT_TIMES
         
-        tickers = ["NVDA", "AAPL", "MSFT", "GOOGL", "META", "TSLA", "AMZN", "AMD", "CRM", "ORCL"]
+        if limit <= 0:
+            return []
+        rng = self._rng
         
-        results = []
-        for i in range(limit):
-            ticker = tickers[i % len(tickers)]
-            report_date = datetime.now() + timedelta(days=random.randint(1, 45))
-            
-            results.append({
-                "ticker": ticker,
-                "company": f"{ticker} Corporation",
-                "report_date": report_date.isoformat(),
-                "report_time": random.choice(["BMO", "AMC"]),
-                "eps_estimate": round(random.uniform(1, 10), 2),
-                "revenue_estimate": f"${random.randint(10, 100)}B",
-                "surprise_history": round(random.uniform(-5, 15), 1),
-                "options_iv": random.randint(30, 120)
-            })
-            
-        return results
-
+        days_ahead = rng.integers(1, 46, limit).tolist()
+        time_idx = rng.integers(0, len(report_times), limit).tolist()
+        eps = rng.uniform(1, 10, limit).round(2).tolist()
+        revenue = rng.integers(10, 101, limit).tolist()
+        surprise = rng.uniform(-5, 15, limit).round(1).tolist()
+        options_iv = rng.integers(30, 121, limit).tolist()
+        
+        now = datetime.now()
+        return [
+            {
+                "ticker": tickers[i % len(tickers)],
+                "company": f"{tickers[i % len(tickers)]} Corporation",
+                "report_date": (now + timedelta(days=days_ahead[i])).isoformat(),
+                "report_time": report_times[time_idx[i]],
+                "eps_estimate": eps[i],
+                "revenue_estimate": f"${revenue[i]}B",
+                "surprise_history": surprise[i],
+                "options_iv": options_iv[i]
+            }
+            for i in range(limit)
+        ]
 
 # Note: Registration happens via get_data_source_registry() singleton
 # The registry instance should call:
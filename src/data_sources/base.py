@@ -2,11 +2,14 @@
 Base data source interface for multi-source market data.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Awaitable, Callable
+
+from loguru import logger
 
 
 class DataSourceType(str, Enum):
@@ -21,9 +24,10 @@ class DataSourceType(str, Enum):
     TRADINGVIEW = "tradingview"
     QUANDL = "quandl"
     FRED = "fred"  # Federal Reserve Economic Data
+    AINVEST = "ainvest"
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     """Real-time quote data."""
     symbol: str
@@ -53,9 +57,31 @@ class Quote:
         if self.mid == 0:
             return 0
         return (self.spread / self.mid) * 100
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "symbol": self.symbol,
+            "bid": self.bid,
+            "ask": self.ask,
+            "bid_size": self.bid_size,
+            "ask_size": self.ask_size,
+            "last": self.last,
+            "last_size": self.last_size,
+            "volume": self.volume,
+            "timestamp": self.timestamp.isoformat(),
+            "source": self.source.value,
+        }
+    
+    def to_tuple(self) -> tuple:
+        """Field values in declaration order, for compact storage."""
+        return (
+            self.symbol, self.bid, self.ask, self.bid_size, self.ask_size,
+            self.last, self.last_size, self.volume, self.timestamp, self.source,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Bar:
     """OHLCV bar data."""
     symbol: str
@@ -83,9 +109,31 @@ class Bar:
     def is_bullish(self) -> bool:
         """Check if bullish candle."""
         return self.close > self.open
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "symbol": self.symbol,
+            "timestamp": self.timestamp.isoformat(),
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+            "vwap": self.vwap,
+            "trades": self.trades,
+            "source": self.source.value,
+        }
+    
+    def to_tuple(self) -> tuple:
+        """Field values in declaration order, for compact storage."""
+        return (
+            self.symbol, self.timestamp, self.open, self.high, self.low,
+            self.close, self.volume, self.vwap, self.trades, self.source,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """News article data."""
     title: str
@@ -99,8 +147,23 @@ class NewsArticle:
     author: str = ""
     image_url: str = ""
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "title": self.title,
+            "summary": self.summary,
+            "source": self.source,
+            "url": self.url,
+            "published": self.published.isoformat(),
+            "symbols": list(self.symbols),
+            "sentiment": self.sentiment,
+            "relevance": self.relevance,
+            "author": self.author,
+            "image_url": self.image_url,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
     """Trading signal from analysis."""
     symbol: str
@@ -114,9 +177,25 @@ class TradingSignal:
     confidence: float = 0.5
     timeframe: str = "1d"
     reasoning: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "symbol": self.symbol,
+            "signal_type": self.signal_type,
+            "strength": self.strength,
+            "source": self.source,
+            "price": self.price,
+            "target_price": self.target_price,
+            "stop_loss": self.stop_loss,
+            "timestamp": self.timestamp.isoformat(),
+            "confidence": self.confidence,
+            "timeframe": self.timeframe,
+            "reasoning": self.reasoning,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class InsiderTrade:
     """Insider trading activity."""
     symbol: str
@@ -130,6 +209,22 @@ class InsiderTrade:
     filing_date: datetime
     transaction_date: datetime
     source: str = "SEC"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "symbol": self.symbol,
+            "insider_name": self.insider_name,
+            "title": self.title,
+            "transaction_type": self.transaction_type,
+            "shares": self.shares,
+            "price": self.price,
+            "value": self.value,
+            "shares_owned_after": self.shares_owned_after,
+            "filing_date": self.filing_date.isoformat(),
+            "transaction_date": self.transaction_date.isoformat(),
+            "source": self.source,
+        }
 
 
 class BaseDataSource(ABC):
@@ -137,6 +232,9 @@ class BaseDataSource(ABC):
     Abstract base class for market data sources.
     """
     
+    # Upper bound on in-flight requests for per-symbol fan-out
+    MAX_CONCURRENT_REQUESTS = 20
+    
     def __init__(self, source_type: DataSourceType):
         self.source_type = source_type
         self._connected = False
@@ -176,14 +274,35 @@ class BaseDataSource(ABC):
         """Get historical bars for a symbol."""
         pass
     
+    async def _gather_per_symbol(
+        self,
+        fetch: Callable[[str], Awaitable[Any]],
+        symbols: List[str]
+    ) -> List[Any]:
+        """Run fetch(symbol) concurrently, at most MAX_CONCURRENT_REQUESTS at a time.
+        
+        Results are in symbol order; failed calls yield their exception,
+        which is logged here so callers can simply filter it out.
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        async def bounded(symbol: str) -> Any:
+            async with semaphore:
+                return await fetch(symbol)
+        
+        results = await asyncio.gather(*(bounded(s) for s in symbols), return_exceptions=True)
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    f"{self.source_type.value}: {getattr(fetch, '__name__', 'fetch')} "
+                    f"failed for {symbol}: {result!r}"
+                )
+        return results
+    
     async def get_quotes(self, symbols: List[str]) -> Dict[str, Quote]:
-        """Get quotes for multiple symbols."""
-        quotes = {}
-        for symbol in symbols:
-            quote = await self.get_quote(symbol)
-            if quote:
-                quotes[symbol] = quote
-        return quotes
+        """Get quotes for multiple symbols concurrently."""
+        results = await self._gather_per_symbol(self.get_quote, symbols)
+        return {s: q for s, q in zip(symbols, results) if isinstance(q, Quote)}
     
     async def search_symbols(self, query: str) -> List[Dict[str, Any]]:
         """Search for symbols. Override if supported."""
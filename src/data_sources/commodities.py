@@ -4,13 +4,28 @@ Provides real-time commodity prices, news, and market data.
 """
 
 import asyncio
+import time
+from itertools import islice
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional
 from enum import Enum
 
 import httpx
+import numpy as np
 from loguru import logger
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+try:
+    import yfinance as yf
+except ImportError:  # prices fall back to demo data
+    yf = None
+
+# Defined by yfinance >= 0.2.52 only; older releases are fetched without retries
+_YF_RATE_LIMIT_ERROR: Optional[type[Exception]] = getattr(
+    getattr(yf, "exceptions", None), "YFRateLimitError", None
+)
 
 
 class CommodityCategory(str, Enum):
@@ -23,7 +38,7 @@ class CommodityCategory(str, Enum):
     NUCLEAR = "nuclear"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommodityPrice:
     """Current commodity price data."""
     symbol: str
@@ -37,9 +52,42 @@ class CommodityPrice:
     volume: float
     timestamp: datetime
     source: str = "yfinance"
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            "symbol": self.symbol,
+            "name": self.name,
+            "category": self.category.value,
+            "price": self.price,
+            "change": self.change,
+            "change_pct": self.change_pct,
+            "high_24h": self.high_24h,
+            "low_24h": self.low_24h,
+            "volume": self.volume,
+            "timestamp": self.timestamp.isoformat(),
+            "source": self.source,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "CommodityPrice":
+        """Rebuild a price from to_dict output."""
+        return cls(
+            data["symbol"],
+            data["name"],
+            CommodityCategory(data["category"]),
+            data["price"],
+            data["change"],
+            data["change_pct"],
+            data["high_24h"],
+            data["low_24h"],
+            data["volume"],
+            datetime.fromisoformat(data["timestamp"]),
+            data["source"],
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommodityNews:
     """Commodity-related news article."""
     title: str
@@ -120,6 +168,105 @@ COMMODITY_ETFS = {
     "PDBC": {"name": "Invesco Optimum Yield Diversified", "category": CommodityCategory.ENERGY, "commodity": "broad"},
 }
 
+# Columns read from each downloaded price frame, in array column order
+_PRICE_FIELDS = ["Close", "High", "Low", "Volume"]
+
+# Redis key prefix for fetched prices shared across restarts
+_REDIS_KEY_PREFIX = "commodities:prices:"
+
+# Flat lookups over both tables, built once
+ALL_COMMODITIES = {**COMMODITY_FUTURES, **COMMODITY_ETFS}
+_ALL_SYMBOLS: tuple[str, ...] = tuple(ALL_COMMODITIES)
+COMMODITIES_BY_CATEGORY: dict[CommodityCategory, tuple[str, ...]] = {
+    category: tuple(s for s, meta in ALL_COMMODITIES.items() if meta["category"] == category)
+    for category in CommodityCategory
+}
+
+# Served as-is by get_supported_commodities; read-only so callers can't mutate the tables
+_SUPPORTED: Mapping[str, object] = MappingProxyType({
+    "futures": MappingProxyType(COMMODITY_FUTURES),
+    "etfs": MappingProxyType(COMMODITY_ETFS),
+    "categories": tuple(c.value for c in CommodityCategory),
+})
+
+
+# Demo data used when live prices are unavailable: (symbol, name, category, base price)
+_MOCK_PRICE_DATA: tuple[tuple[str, str, CommodityCategory, float], ...] = (
+    # Precious Metals
+    ("GLD", "SPDR Gold Trust", CommodityCategory.PRECIOUS_METALS, 185.50),
+    ("SLV", "iShares Silver Trust", CommodityCategory.PRECIOUS_METALS, 21.30),
+    ("PPLT", "Aberdeen Platinum ETF", CommodityCategory.PRECIOUS_METALS, 89.40),
+    ("GDX", "VanEck Gold Miners", CommodityCategory.PRECIOUS_METALS, 28.90),
+    
+    # Energy
+    ("USO", "United States Oil Fund", CommodityCategory.ENERGY, 72.50),
+    ("UNG", "United States Natural Gas", CommodityCategory.ENERGY, 12.80),
+    ("XLE", "Energy Select Sector SPDR", CommodityCategory.ENERGY, 89.30),
+    
+    # Industrial Metals
+    ("CPER", "United States Copper Fund", CommodityCategory.INDUSTRIAL_METALS, 24.10),
+    ("LIT", "Global X Lithium & Battery", CommodityCategory.INDUSTRIAL_METALS, 45.20),
+    
+    # Nuclear
+    ("URA", "Global X Uranium ETF", CommodityCategory.NUCLEAR, 28.50),
+    
+    # Rare Earth
+    ("REMX", "VanEck Rare Earth/Strategic", CommodityCategory.RARE_EARTH, 42.30),
+    
+    # Agriculture
+    ("CORN", "Teucrium Corn Fund", CommodityCategory.AGRICULTURE, 20.15),
+    ("WEAT", "Teucrium Wheat Fund", CommodityCategory.AGRICULTURE, 5.80),
+    ("DBA", "Invesco DB Agriculture", CommodityCategory.AGRICULTURE, 21.40),
+)
+_MOCK_PRICES_BY_CATEGORY: dict[CommodityCategory, tuple[tuple[str, str, CommodityCategory, float], ...]] = {
+    category: tuple(row for row in _MOCK_PRICE_DATA if row[2] == category)
+    for category in CommodityCategory
+}
+
+# Demo news: (title, commodity, base sentiment)
+_NEWS_TEMPLATES: tuple[tuple[str, str, float], ...] = (
+    ("Gold prices surge as Fed signals rate pause", "precious_metals", 0.7),
+    ("Oil jumps on OPEC+ production cut announcement", "energy", 0.6),
+    ("Copper hits 6-month high on China demand outlook", "industrial_metals", 0.5),
+    ("Natural gas falls on warmer weather forecast", "energy", -0.4),
+    ("Silver rallies alongside gold amid dollar weakness", "precious_metals", 0.5),
+    ("Uranium stocks surge on nuclear energy push", "nuclear", 0.8),
+    ("Lithium prices stabilize after EV demand concerns", "lithium", 0.2),
+    ("Wheat futures drop on improved crop outlook", "agriculture", -0.3),
+    ("Rare earth supply concerns boost mining stocks", "rare_earth", 0.6),
+    ("Platinum gains on automotive demand recovery", "precious_metals", 0.4),
+    ("Oil inventory data shows larger than expected draw", "energy", 0.5),
+    ("Gold miners report strong quarterly earnings", "precious_metals", 0.6),
+    ("Energy sector leads market gains on oil rally", "energy", 0.5),
+    ("Copper demand expected to surge for green energy", "industrial_metals", 0.7),
+    ("Natural gas exports hit record high", "energy", 0.4),
+)
+_NEWS_SOURCES = ("Reuters", "Bloomberg", "CNBC", "MarketWatch")
+
+
+class _TokenBucket:
+    """Async token bucket: refills at ``rate`` tokens per second up to ``capacity``."""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until ``tokens`` (capped at capacity) are available and take them."""
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
 
 class CommodityDataSource:
     """
@@ -127,17 +274,47 @@ class CommodityDataSource:
     Uses Yahoo Finance for real-time prices.
     """
     
-    def __init__(self):
+    # Upper bound on yfinance batch downloads in flight at once
+    MAX_CONCURRENT_BATCHES = 8
+    # Client-side pacing of Yahoo requests (yf.download makes one per symbol)
+    YAHOO_REQUESTS_PER_SECOND = 5
+    YAHOO_REQUEST_BURST = 50
+    # Attempts per batch when Yahoo reports rate limiting
+    RATE_LIMIT_ATTEMPTS = 3
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Optional seed for the mock data generator (reproducible mocks)
+        """
         self._client: Optional[httpx.AsyncClient] = None
-        self._cache: dict[str, CommodityPrice] = {}
+        # (category, symbols) -> (monotonic fetch time, prices)
+        self._cache: dict[tuple, tuple[float, list[CommodityPrice]]] = {}
+        # symbol -> (monotonic fetch time, price), written through on every fetch
+        self._symbol_cache: dict[str, tuple[float, CommodityPrice]] = {}
         self._cache_ttl = 60  # seconds
+        # Wall-clock invalidation times, so stale copies in Redis aren't reloaded
+        self._invalidated_at: dict[tuple, float] = {}
+        self._all_invalidated_at = 0.0
+        # Background refresh runs inside the TTL so readers never see it lapse
+        self._refresh_interval = 50  # seconds
+        self._refresh_task: Optional[asyncio.Task] = None
         self._last_update: Optional[datetime] = None
+        self._batch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+        self._rate_limiter = _TokenBucket(self.YAHOO_REQUESTS_PER_SECOND, self.YAHOO_REQUEST_BURST)
+        self._rng = np.random.default_rng(seed)
         
     async def connect(self) -> bool:
-        """Initialize the data source."""
+        """Initialize the data source and start the background price refresh.
+        
+        Safe to call repeatedly; an existing client and refresh task are reused.
+        """
         try:
-            self._client = httpx.AsyncClient(timeout=30.0)
-            logger.info("Commodity data source connected")
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=30.0)
+                logger.info("Commodity data source connected")
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_loop())
             return True
         except Exception as e:
             logger.error(f"Failed to connect commodity data source: {e}")
@@ -145,14 +322,32 @@ class CommodityDataSource:
     
     async def disconnect(self) -> None:
         """Close the data source."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
         if self._client:
             await self._client.aclose()
             self._client = None
     
+    async def _refresh_loop(self) -> None:
+        """Re-fetch every commodity price each refresh interval to keep the cache warm."""
+        while True:
+            try:
+                await self.get_commodity_prices(refresh=True)
+            except Exception as e:
+                logger.error(f"Commodity price refresh failed: {e}")
+            await asyncio.sleep(self._refresh_interval)
+    
     async def get_commodity_prices(
         self, 
         category: Optional[CommodityCategory] = None,
-        symbols: Optional[list[str]] = None
+        symbols: Optional[list[str]] = None,
+        refresh: bool = False,
+        allow_unknown: bool = False
     ) -> list[CommodityPrice]:
         """
         Get current commodity prices.
@@ -160,119 +355,232 @@ class CommodityDataSource:
         Args:
             category: Filter by category (precious_metals, energy, etc.)
             symbols: Specific symbols to fetch
+            refresh: Skip the cache and fetch from the source
+            allow_unknown: Pass symbols outside the known tables through to Yahoo
             
         Returns:
             List of CommodityPrice objects
         """
-        try:
-            import yfinance as yf
-            
-            # Build symbol list
-            if symbols:
+        # Build symbol list
+        if symbols:
+            if allow_unknown:
                 target_symbols = symbols
             else:
-                target_symbols = list(COMMODITY_FUTURES.keys()) + list(COMMODITY_ETFS.keys())
-                
-                if category:
-                    # Filter by category
-                    target_symbols = [
-                        s for s in target_symbols
-                        if (s in COMMODITY_FUTURES and COMMODITY_FUTURES[s]["category"] == category) or
-                           (s in COMMODITY_ETFS and COMMODITY_ETFS[s]["category"] == category)
-                    ]
+                # Unknown tickers cost a Yahoo request that returns nothing
+                target_symbols = [s for s in symbols if s in ALL_COMMODITIES]
+                if len(target_symbols) < len(symbols):
+                    rejected = [s for s in symbols if s not in ALL_COMMODITIES]
+                    logger.warning(f"Ignoring unknown commodity symbols: {', '.join(rejected)}")
+                if not target_symbols:
+                    return []
+        elif category:
+            target_symbols = COMMODITIES_BY_CATEGORY[category]
+        else:
+            target_symbols = _ALL_SYMBOLS
+        
+        key = (category, tuple(symbols) if symbols else None)
+        if not refresh:
+            now = time.monotonic()
+            hit = self._cache.get(key)
+            if hit and now - hit[0] < self._cache_ttl:
+                return list(hit[1])
+            # Serve from recent fetches (e.g. the background refresh) when all are warm
+            entries = [self._symbol_cache.get(s) for s in target_symbols]
+            if entries and all(e and now - e[0] < self._cache_ttl for e in entries):
+                return [e[1] for e in entries]
+            # Then the copy shared through Redis, which survives restarts
+            persisted = await self._load_persisted(key)
+            if persisted:
+                fetched_at, prices = persisted
+                self._remember(key, fetched_at, prices)
+                return list(prices)
+        
+        if yf is None:
+            logger.error("yfinance not installed")
+            return self._get_mock_prices(category)
+        
+        try:
+            # Fetch batches concurrently; yfinance blocks, so each runs in a thread
+            batch_size = 20
+            results = await asyncio.gather(
+                *(
+                    self._fetch_batch(list(target_symbols[i:i + batch_size]))
+                    for i in range(0, len(target_symbols), batch_size)
+                ),
+                return_exceptions=True,
+            )
             
             prices = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(f"Batch fetch error: {result}")
+                else:
+                    prices.extend(result)
             
-            # Fetch data in batches
-            batch_size = 20
-            for i in range(0, len(target_symbols), batch_size):
-                batch = target_symbols[i:i + batch_size]
-                
-                try:
-                    tickers = yf.Tickers(" ".join(batch))
-                    
-                    for symbol in batch:
-                        try:
-                            ticker = tickers.tickers.get(symbol)
-                            if ticker:
-                                info = ticker.info
-                                hist = ticker.history(period="2d")
-                                
-                                if len(hist) >= 1:
-                                    current_price = hist["Close"].iloc[-1]
-                                    prev_price = hist["Close"].iloc[-2] if len(hist) >= 2 else current_price
-                                    
-                                    change = current_price - prev_price
-                                    change_pct = (change / prev_price) * 100 if prev_price else 0
-                                    
-                                    # Get metadata
-                                    meta = COMMODITY_FUTURES.get(symbol) or COMMODITY_ETFS.get(symbol, {})
-                                    
-                                    prices.append(CommodityPrice(
-                                        symbol=symbol,
-                                        name=meta.get("name", info.get("shortName", symbol)),
-                                        category=meta.get("category", CommodityCategory.ENERGY),
-                                        price=current_price,
-                                        change=change,
-                                        change_pct=change_pct,
-                                        high_24h=hist["High"].iloc[-1],
-                                        low_24h=hist["Low"].iloc[-1],
-                                        volume=hist["Volume"].iloc[-1] if "Volume" in hist else 0,
-                                        timestamp=datetime.utcnow(),
-                                    ))
-                        except Exception as e:
-                            logger.warning(f"Error fetching {symbol}: {e}")
-                            
-                except Exception as e:
-                    logger.error(f"Batch fetch error: {e}")
-            
-            return prices
+            if prices:
+                self._remember(key, time.monotonic(), prices)
+                self._last_update = datetime.now(timezone.utc)
+                await self._persist(key, prices)
+            return list(prices)
             
-        except ImportError:
-            logger.error("yfinance not installed")
-            return self._get_mock_prices(category)
         except Exception as e:
             logger.error(f"Error fetching commodity prices: {e}")
             return self._get_mock_prices(category)
     
-    def _get_mock_prices(self, category: Optional[CommodityCategory] = None) -> list[CommodityPrice]:
-        """Get mock commodity prices for demo."""
-        import random
-        
-        mock_data = [
-            # Precious Metals
-            ("GLD", "SPDR Gold Trust", CommodityCategory.PRECIOUS_METALS, 185.50),
-            ("SLV", "iShares Silver Trust", CommodityCategory.PRECIOUS_METALS, 21.30),
-            ("PPLT", "Aberdeen Platinum ETF", CommodityCategory.PRECIOUS_METALS, 89.40),
-            ("GDX", "VanEck Gold Miners", CommodityCategory.PRECIOUS_METALS, 28.90),
-            
-            # Energy
-            ("USO", "United States Oil Fund", CommodityCategory.ENERGY, 72.50),
-            ("UNG", "United States Natural Gas", CommodityCategory.ENERGY, 12.80),
-            ("XLE", "Energy Select Sector SPDR", CommodityCategory.ENERGY, 89.30),
-            
-            # Industrial Metals
-            ("CPER", "United States Copper Fund", CommodityCategory.INDUSTRIAL_METALS, 24.10),
-            ("LIT", "Global X Lithium & Battery", CommodityCategory.INDUSTRIAL_METALS, 45.20),
-            
-            # Nuclear
-            ("URA", "Global X Uranium ETF", CommodityCategory.NUCLEAR, 28.50),
+    def _remember(self, key: tuple, fetched_at: float, prices: list[CommodityPrice]) -> None:
+        """Store a result in the in-memory caches."""
+        self._cache[key] = (fetched_at, prices)
+        for price in prices:
+            self._symbol_cache[price.symbol] = (fetched_at, price)
+    
+    @staticmethod
+    def _redis_key(key: tuple) -> str:
+        category, symbols = key
+        return f"{_REDIS_KEY_PREFIX}{category.value if category else ''}:{','.join(symbols or ())}"
+    
+    async def _persist(self, key: tuple, prices: list[CommodityPrice]) -> None:
+        """Write a fetched result through to Redis, expiring with the cache TTL."""
+        try:
+            from src.data.redis_cache import get_redis_cache
             
-            # Rare Earth
-            ("REMX", "VanEck Rare Earth/Strategic", CommodityCategory.RARE_EARTH, 42.30),
+            await get_redis_cache().set_json(
+                self._redis_key(key),
+                {"fetched_at": time.time(), "prices": [p.to_dict() for p in prices]},
+                expire_seconds=self._cache_ttl,
+            )
+        except Exception as e:
+            logger.debug(f"Could not persist commodity prices: {e}")
+    
+    async def _load_persisted(self, key: tuple) -> Optional[tuple[float, list[CommodityPrice]]]:
+        """Read a result from Redis as (monotonic fetch time, prices), or None."""
+        try:
+            from src.data.redis_cache import get_redis_cache
             
-            # Agriculture
-            ("CORN", "Teucrium Corn Fund", CommodityCategory.AGRICULTURE, 20.15),
-            ("WEAT", "Teucrium Wheat Fund", CommodityCategory.AGRICULTURE, 5.80),
-            ("DBA", "Invesco DB Agriculture", CommodityCategory.AGRICULTURE, 21.40),
-        ]
+            data = await get_redis_cache().get_json(self._redis_key(key))
+            if not data:
+                return None
+            # Ignore copies fetched before this source last invalidated the key
+            invalidated_at = max(self._all_invalidated_at, self._invalidated_at.get(key, 0.0))
+            if data["fetched_at"] <= invalidated_at:
+                return None
+            age = time.time() - data["fetched_at"]
+            if age >= self._cache_ttl:
+                return None
+            prices = [CommodityPrice.from_dict(p) for p in data["prices"]]
+        except Exception as e:
+            logger.debug(f"Could not load persisted commodity prices: {e}")
+            return None
+        return time.monotonic() - age, prices
+    
+    def invalidate(
+        self,
+        category: Optional[CommodityCategory] = None,
+        symbols: Optional[list[str]] = None
+    ) -> None:
+        """Drop the cached result for one get_commodity_prices() call and its symbols."""
+        key = (category, tuple(symbols) if symbols else None)
+        self._cache.pop(key, None)
+        self._invalidated_at[key] = time.time()
+        # Category reads can be served per symbol from any earlier fetch (e.g.
+        # the background refresh), so clear every symbol the call covers
+        if symbols:
+            stale = symbols
+        elif category:
+            stale = COMMODITIES_BY_CATEGORY[category]
+        else:
+            stale = _ALL_SYMBOLS
+        for symbol in stale:
+            self._symbol_cache.pop(symbol, None)
+    
+    def invalidate_all(self) -> None:
+        """Drop every cached price."""
+        self._cache.clear()
+        self._symbol_cache.clear()
+        self._invalidated_at.clear()
+        self._all_invalidated_at = time.time()
+    
+    async def _fetch_batch(self, batch: list[str]) -> list[CommodityPrice]:
+        """Fetch one batch in a worker thread, bounded by MAX_CONCURRENT_BATCHES.
+        
+        Each attempt is paced by the rate limiter; a YFRateLimitError is
+        retried with exponential backoff (where yfinance defines one).
+        """
+        async with self._batch_semaphore:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type(_YF_RATE_LIMIT_ERROR or ()),
+                wait=wait_exponential(multiplier=1, max=30),
+                stop=stop_after_attempt(self.RATE_LIMIT_ATTEMPTS),
+                reraise=True,
+            ):
+                with attempt:
+                    await self._rate_limiter.acquire(len(batch))
+                    return await asyncio.to_thread(self._fetch_batch_sync, batch)
+    
+    def _fetch_batch_sync(self, batch: list[str]) -> list[CommodityPrice]:
+        """Download a batch of symbols and build their CommodityPrice objects."""
+        # One download per batch; columns are (symbol, field)...
+        data = yf.download(
+            batch,
+            period="2d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+        if data is None or data.empty:
+            return []
+        if data.columns.nlevels == 1:
+            # ...except yfinance < 0.2.48 returns a lone ticker's fields flat
+            frames = {batch[0]: data}
+        else:
+            frames = {symbol: data[symbol] for symbol in set(data.columns.get_level_values(0))}
         
+        now = datetime.now(timezone.utc)
         prices = []
-        for symbol, name, cat, base_price in mock_data:
-            if category and cat != category:
-                continue
+        for symbol in batch:
+            try:
+                frame = frames.get(symbol)
+                if frame is None:
+                    continue
+                # Missing columns (e.g. no Volume) come back as NaN
+                rows = frame.reindex(columns=_PRICE_FIELDS).to_numpy(dtype=float)
+                rows = rows[~np.isnan(rows[:, 0])]
                 
-            change_pct = random.uniform(-3, 3)
+                if len(rows) >= 1:
+                    current_price, high, low, volume = rows[-1].tolist()
+                    prev_price = float(rows[-2, 0]) if len(rows) >= 2 else current_price
+                    
+                    change = current_price - prev_price
+                    change_pct = (change / prev_price) * 100 if prev_price else 0
+                    
+                    # Get metadata
+                    meta = ALL_COMMODITIES.get(symbol, {})
+                    
+                    prices.append(CommodityPrice(
+                        symbol=symbol,
+                        name=meta.get("name", symbol),
+                        category=meta.get("category", CommodityCategory.ENERGY),
+                        price=current_price,
+                        change=change,
+                        change_pct=change_pct,
+                        high_24h=high,
+                        low_24h=low,
+                        volume=0 if np.isnan(volume) else volume,
+                        timestamp=now,
+                    ))
+            except Exception as e:
+                logger.warning(f"Error fetching {symbol}: {e}")
+        
+        return prices
+    
+    def _get_mock_prices(self, category: Optional[CommodityCategory] = None) -> list[CommodityPrice]:
+        """Get mock commodity prices for demo."""
+        now = datetime.now(timezone.utc)
+        rows = _MOCK_PRICES_BY_CATEGORY[category] if category else _MOCK_PRICE_DATA
+        change_pcts = self._rng.uniform(-3, 3, len(rows)).tolist()
+        volumes = self._rng.integers(1000000, 50000000, len(rows), endpoint=True).tolist()
+        
+        prices = []
+        for (symbol, name, cat, base_price), change_pct, volume in zip(rows, change_pcts, volumes):
             change = base_price * (change_pct / 100)
             
             prices.append(CommodityPrice(
@@ -284,8 +592,8 @@ class CommodityDataSource:
                 change_pct=change_pct,
                 high_24h=base_price * 1.02,
                 low_24h=base_price * 0.98,
-                volume=random.randint(1000000, 50000000),
-                timestamp=datetime.utcnow(),
+                volume=volume,
+                timestamp=now,
             ))
         
         return prices
@@ -295,52 +603,36 @@ class CommodityDataSource:
         commodities: Optional[list[str]] = None,
         limit: int = 20
     ) -> list[CommodityNews]:
-        """Get commodity-related news."""
+        """Get commodity-related news (up to ``limit`` matching items)."""
         # Mock news for demonstration
-        import random
-        
-        news_templates = [
-            ("Gold prices surge as Fed signals rate pause", "precious_metals", 0.7),
-            ("Oil jumps on OPEC+ production cut announcement", "energy", 0.6),
-            ("Copper hits 6-month high on China demand outlook", "industrial_metals", 0.5),
-            ("Natural gas falls on warmer weather forecast", "energy", -0.4),
-            ("Silver rallies alongside gold amid dollar weakness", "precious_metals", 0.5),
-            ("Uranium stocks surge on nuclear energy push", "nuclear", 0.8),
-            ("Lithium prices stabilize after EV demand concerns", "lithium", 0.2),
-            ("Wheat futures drop on improved crop outlook", "agriculture", -0.3),
-            ("Rare earth supply concerns boost mining stocks", "rare_earth", 0.6),
-            ("Platinum gains on automotive demand recovery", "precious_metals", 0.4),
-            ("Oil inventory data shows larger than expected draw", "energy", 0.5),
-            ("Gold miners report strong quarterly earnings", "precious_metals", 0.6),
-            ("Energy sector leads market gains on oil rally", "energy", 0.5),
-            ("Copper demand expected to surge for green energy", "industrial_metals", 0.7),
-            ("Natural gas exports hit record high", "energy", 0.4),
-        ]
+        return list(islice(self._iter_news(commodities), max(limit, 0)))
+    
+    def _iter_news(self, commodities: Optional[list[str]] = None) -> Iterator[CommodityNews]:
+        """Yield mock news items matching ``commodities``, in template order."""
+        now = datetime.now(timezone.utc)
+        n = len(_NEWS_TEMPLATES)
+        rng = self._rng
+        sources = rng.choice(len(_NEWS_SOURCES), n).tolist()
+        hours_ago = rng.integers(1, 24, n, endpoint=True).tolist()
+        jitters = rng.uniform(-0.1, 0.1, n).tolist()
         
-        news = []
-        for i, (title, commodity, sentiment) in enumerate(news_templates[:limit]):
+        for i, (title, commodity, sentiment) in enumerate(_NEWS_TEMPLATES):
             if commodities and commodity not in commodities:
                 continue
                 
-            news.append(CommodityNews(
+            yield CommodityNews(
                 title=title,
                 summary=f"Breaking: {title}. Market analysts react to latest developments...",
-                source=random.choice(["Reuters", "Bloomberg", "CNBC", "MarketWatch"]),
+                source=_NEWS_SOURCES[sources[i]],
                 url=f"https://example.com/news/{i}",
-                published=datetime.utcnow() - timedelta(hours=random.randint(1, 24)),
+                published=now - timedelta(hours=hours_ago[i]),
                 commodities=[commodity],
-                sentiment=sentiment + random.uniform(-0.1, 0.1),
-            ))
-        
-        return news
+                sentiment=sentiment + jitters[i],
+            )
     
-    def get_supported_commodities(self) -> dict:
-        """Get all supported commodities and their symbols."""
-        return {
-            "futures": COMMODITY_FUTURES,
-            "etfs": COMMODITY_ETFS,
-            "categories": [c.value for c in CommodityCategory],
-        }
+    def get_supported_commodities(self) -> Mapping:
+        """Get all supported commodities and their symbols (read-only)."""
+        return _SUPPORTED
 
 
 # Singleton instance
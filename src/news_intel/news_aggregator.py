@@ -204,8 +204,8 @@ class NewsAggregator:
             
             article_id = NewsArticle.generate_id(source, headline)
             
-            # Check if already seen
-            if await self.cache.is_article_seen(article_id):
+            # Claim the article; skip it if it was already seen
+            if not await self.cache.try_mark_article_seen(article_id):
                 return None
             
             # Parse timestamp
@@ -226,9 +226,6 @@ class NewsAggregator:
                 timestamp=timestamp,
             )
             
-            # Mark as seen
-            await self.cache.mark_article_seen(article_id)
-            
             # Notify callbacks
             for callback in self._callbacks:
                 try:
@@ -273,7 +270,7 @@ class NewsAggregator:
             for item in data[:20]:
                 article_id = NewsArticle.generate_id("finnhub", item.get("headline", ""))
                 
-                if await self.cache.is_article_seen(article_id):
+                if not await self.cache.try_mark_article_seen(article_id):
                     continue
                 
                 article = NewsArticle(
@@ -288,7 +285,6 @@ class NewsAggregator:
                 if symbol:
                     article.tickers = [symbol]
                 
-                await self.cache.mark_article_seen(article_id)
                 articles.append(article)
             
             return articles
@@ -321,7 +317,7 @@ class NewsAggregator:
                 headline = item.get("title", "")
                 article_id = NewsArticle.generate_id("newsapi", headline)
                 
-                if await self.cache.is_article_seen(article_id):
+                if not await self.cache.try_mark_article_seen(article_id):
                     continue
                 
                 article = NewsArticle(
@@ -332,7 +328,6 @@ class NewsAggregator:
                     url=item.get("url", ""),
                 )
                 
-                await self.cache.mark_article_seen(article_id)
                 articles.append(article)
             
             return articles
@@ -365,7 +360,7 @@ class NewsAggregator:
                 headline = item.get("title", "")
                 article_id = NewsArticle.generate_id("polygon", headline)
                 
-                if await self.cache.is_article_seen(article_id):
+                if not await self.cache.try_mark_article_seen(article_id):
                     continue
                 
                 article = NewsArticle(
@@ -377,7 +372,6 @@ class NewsAggregator:
                     tickers=item.get("tickers", []),
                 )
                 
-                await self.cache.mark_article_seen(article_id)
                 articles.append(article)
             
             return articles
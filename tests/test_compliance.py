@@ -0,0 +1,420 @@
+"""Tests for the trading compliance manager."""
+
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from src.compliance import AccountType, ComplianceManager, ComplianceAction
+from src.compliance.compliance_manager import Side
+
+
+def _last_weekday(days_back: int = 0) -> datetime:
+    """A weekday at 10:00, at least ``days_back`` days ago."""
+    ts = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+    ts -= timedelta(days=days_back)
+    while ts.weekday() >= 5:
+        ts -= timedelta(days=1)
+    return ts
+
+
+def _day_trade(cm: ComplianceManager, symbol: str, when: datetime, price: float = 100.0) -> None:
+    cm.record_trade(symbol, "buy", 10, price, timestamp=when)
+    cm.record_trade(symbol, "sell", 10, price + 1, timestamp=when + timedelta(minutes=5))
+
+
+class TestDayTradeTracking:
+    """Tests for PDT day-trade counting."""
+    
+    @pytest.fixture
+    def compliance(self):
+        return ComplianceManager(account_type="margin", equity=10000)
+    
+    def test_day_trade_counted(self, compliance):
+        _day_trade(compliance, "AAPL", _last_weekday())
+        
+        assert compliance._count_recent_day_trades(date.today()) == 1
+        assert compliance.get_day_trades()[0]["symbol"] == "AAPL"
+    
+    def test_old_day_trades_leave_window(self, compliance):
+        _day_trade(compliance, "AAPL", _last_weekday(14))
+        _day_trade(compliance, "MSFT", _last_weekday())
+        
+        assert compliance._count_recent_day_trades(date.today()) == 1
+        assert [t["symbol"] for t in compliance.get_day_trades()] == ["MSFT"]
+    
+    def test_pdt_threshold_blocks_next_day_trade(self, compliance):
+        now = datetime.now()
+        for symbol in ("A", "B", "C", "D"):
+            _day_trade(compliance, symbol, now)
+        
+        compliance.reset_daily()
+        compliance.record_trade("E", "buy", 10, 100.0)
+        result = compliance.check_order("E", "sell", 10, 101.0)
+        
+        assert result.action == ComplianceAction.BLOCK
+        assert not result.allowed
+    
+    def test_paper_account_always_allowed(self):
+        compliance = ComplianceManager(account_type="paper")
+        result = compliance.check_order("AAPL", "buy", 100, 150.0)
+        
+        assert result.allowed
+        assert result.action == ComplianceAction.ALLOW
+
+
+class TestDayTradeExport:
+    """Tests for DataFrame export of day trades."""
+    
+    @pytest.fixture
+    def compliance(self):
+        return ComplianceManager(account_type="margin", equity=50000)
+    
+    def test_day_trades_df_matches_dicts(self, compliance):
+        _day_trade(compliance, "AAPL", _last_weekday(0), 100.0)
+        _day_trade(compliance, "MSFT", _last_weekday(0), 200.0)
+        
+        df = compliance.get_day_trades_df()
+        records = compliance.get_day_trades()
+        assert list(df["symbol"]) == [r["symbol"] for r in records]
+        assert list(df["pnl"]) == [r["pnl"] for r in records]
+        assert [d.date().isoformat() for d in df["trade_date"]] == [r["trade_date"] for r in records]
+    
+    def test_empty_day_trades_df(self, compliance):
+        df = compliance.get_day_trades_df()
+        assert df.empty
+        assert "pnl" in df.columns
+
+
+class TestCashAccount:
+    """Tests for cash-account settlement rules."""
+    
+    @pytest.fixture
+    def compliance(self):
+        return ComplianceManager(account_type="cash", equity=10000, buying_power=10000)
+    
+    def test_unsettled_proceeds_tracked(self, compliance):
+        compliance.record_trade("AAPL", "sell", 10, 100.0)
+        
+        assert compliance._calculate_unsettled_proceeds(date.today()) == pytest.approx(1000.0)
+    
+    def test_settled_proceeds_expire(self, compliance):
+        compliance.record_trade("AAPL", "sell", 10, 100.0, timestamp=_last_weekday(10))
+        
+        assert compliance._calculate_unsettled_proceeds(date.today()) == 0.0
+    
+    def test_buy_with_unsettled_proceeds_requires_confirmation(self, compliance):
+        compliance.record_trade("AAPL", "sell", 10, 100.0)
+        result = compliance.check_order("MSFT", "buy", 95, 100.0)
+        
+        assert result.action == ComplianceAction.CONFIRM
+        assert result.requires_confirmation
+
+
+class TestWashSale:
+    """Tests for wash sale detection."""
+    
+    @pytest.fixture
+    def compliance(self):
+        return ComplianceManager(account_type="margin", equity=50000)
+    
+    def test_loss_sale_after_recent_buy_warns(self, compliance):
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=_last_weekday(3))
+        violations = compliance.record_trade("AAPL", "sell", 10, 90.0)
+        
+        assert [v.type.value for v in violations] == ["wash_sale"]
+        assert violations[0].details["avg_buy_price"] == pytest.approx(100.0)
+    
+    def test_buys_outside_window_ignored(self, compliance):
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=_last_weekday(45))
+        
+        assert compliance.record_trade("AAPL", "sell", 10, 90.0) == []
+    
+    def test_profitable_sale_not_flagged(self, compliance):
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=_last_weekday(3))
+        compliance.record_trade("AAPL", "buy", 30, 80.0, timestamp=_last_weekday(2))
+        
+        # Average buy is 85, so selling at 90 is not a loss
+        assert compliance.record_trade("AAPL", "sell", 10, 90.0) == []
+    
+    def test_rebuy_after_recent_sale_warns(self, compliance):
+        compliance.record_trade("AAPL", "sell", 10, 90.0)
+        result = compliance.check_order("AAPL", "buy", 10, 91.0)
+        
+        assert len(result.warnings) == 1
+    
+    def test_back_dated_buy_included_in_average(self, compliance):
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=_last_weekday(2))
+        compliance.record_trade("AAPL", "buy", 10, 80.0, timestamp=_last_weekday(5))
+        violations = compliance.record_trade("AAPL", "sell", 10, 85.0)
+        
+        assert violations[0].details["avg_buy_price"] == pytest.approx(90.0)
+
+
+class TestCheckSpecialization:
+    """Tests for per-account selection of pre-trade checks."""
+    
+    def test_equity_update_enables_pdt_check(self):
+        compliance = ComplianceManager(account_type="margin", equity=50000)
+        now = datetime.now()
+        for symbol in ("A", "B", "C"):
+            _day_trade(compliance, symbol, now)
+        compliance.record_trade("D", "buy", 10, 100.0)
+        
+        assert compliance.check_order("D", "sell", 10, 101.0).action == ComplianceAction.ALLOW
+        
+        compliance.update_account(equity=10000)
+        result = compliance.check_order("D", "sell", 10, 101.0)
+        
+        assert result.action == ComplianceAction.CONFIRM
+    
+    def test_direct_account_writes_respecialize(self):
+        compliance = ComplianceManager(account_type="margin", equity=100000)
+        assert compliance._order_checks[Side.SELL] == []
+        
+        compliance.equity = 10000
+        assert compliance._check_pdt_preorder in compliance._order_checks[Side.SELL]
+        
+        compliance.is_pattern_day_trader = True
+        compliance.day_trading_buying_power = 50000
+        assert compliance._check_day_trading_buying_power in compliance._order_checks[Side.BUY]
+        assert compliance.get_status()["equity"] == 10000
+    
+    def test_account_type_change_respecializes(self):
+        compliance = ComplianceManager(account_type="margin", equity=10000, buying_power=10000)
+        compliance.account_type = AccountType.CASH
+        compliance.record_trade("AAPL", "sell", 10, 100.0)
+        
+        result = compliance.check_order("MSFT", "buy", 95, 100.0)
+        
+        assert result.action == ComplianceAction.CONFIRM
+
+
+class TestBulkRecord:
+    """Tests for bulk trade replay."""
+    
+    def test_bulk_matches_sequential_replay(self):
+        start = _last_weekday()
+        trades = [
+            ("AAPL", "buy", 10, 100.0, start),
+            ("MSFT", "buy", 5, 300.0, start + timedelta(minutes=1)),
+            ("AAPL", "sell", 10, 90.0, start + timedelta(minutes=2)),
+            ("MSFT", "sell", 5, 310.0, start + timedelta(minutes=3)),
+        ]
+        sequential = ComplianceManager(account_type="cash", equity=10000)
+        for symbol, side, qty, price, ts in trades:
+            sequential.record_trade(symbol, side, qty, price, timestamp=ts)
+        
+        bulk = ComplianceManager(account_type="cash", equity=10000)
+        # Shuffled input is replayed in timestamp order
+        violations = bulk.record_trades_bulk(*zip(*reversed(trades)))
+        
+        assert [v.type for v in violations] == [v.type for v in sequential._violations]
+        assert bulk.get_day_trades() == sequential.get_day_trades()
+        assert bulk._unsettled_sale_heap == sequential._unsettled_sale_heap
+        assert {
+            symbol: [p.settlement_date for p in positions]
+            for symbol, positions in bulk._unsettled_by_symbol.items()
+        } == {
+            symbol: [p.settlement_date for p in positions]
+            for symbol, positions in sequential._unsettled_by_symbol.items()
+        }
+    
+    def test_bulk_rejects_ragged_columns(self):
+        compliance = ComplianceManager()
+        
+        with pytest.raises(ValueError):
+            compliance.record_trades_bulk(["AAPL"], ["buy"], [1, 2], [100.0], [datetime.now()])
+
+
+class TestBusinessDays:
+    """Tests for business-day arithmetic."""
+    
+    def test_settlement_skips_weekend(self):
+        compliance = ComplianceManager()
+        
+        # Friday -> Monday
+        assert compliance._calculate_settlement_date(date(2025, 6, 6)) == date(2025, 6, 9)
+    
+    def test_settlement_skips_market_holidays(self):
+        class HolidayCompliance(ComplianceManager):
+            MARKET_HOLIDAYS = (date(2025, 7, 4),)
+        
+        compliance = HolidayCompliance()
+        
+        # Thursday before Independence Day -> Monday
+        assert compliance._calculate_settlement_date(date(2025, 7, 3)) == date(2025, 7, 7)
+    
+    def test_pdt_window_spans_five_business_days(self):
+        compliance = ComplianceManager()
+        
+        assert compliance._pdt_window_start(date(2025, 6, 10)) == date(2025, 6, 4)
+        assert compliance._pdt_window_start(date(2025, 6, 14)) == date(2025, 6, 9)
+
+
+class TestPaperAccount:
+    """Tests for paper accounts, which carry no compliance state."""
+    
+    def test_record_trade_is_noop(self):
+        compliance = ComplianceManager(account_type="paper")
+        _day_trade(compliance, "AAPL", datetime.now())
+        
+        assert compliance.get_day_trades() == []
+        assert not compliance._buys_by_symbol
+
+
+class TestDayTradingBuyingPower:
+    """Tests for DTBP tracking on pattern day trader accounts."""
+    
+    def test_used_dtbp_summed_per_day(self):
+        compliance = ComplianceManager(
+            account_type="margin",
+            equity=30000,
+            day_trading_buying_power=5000,
+            is_pattern_day_trader=True,
+        )
+        now = datetime.now()
+        _day_trade(compliance, "AAPL", now, price=100.0)
+        _day_trade(compliance, "MSFT", now, price=200.0)
+        _day_trade(compliance, "TSLA", _last_weekday(14), price=300.0)
+        
+        assert compliance._calculate_used_dtbp(now.date()) == pytest.approx(3000.0)
+        
+        result = compliance.check_order("NVDA", "buy", 25, 100.0)
+        assert result.action == ComplianceAction.BLOCK
+
+
+class TestResetDaily:
+    """Tests for the market-open reset."""
+    
+    def test_expired_history_dropped(self):
+        compliance = ComplianceManager(account_type="margin", equity=50000)
+        compliance.record_trade("OLD", "buy", 10, 100.0, timestamp=datetime.now() - timedelta(days=90))
+        compliance.record_trade("NEW", "buy", 10, 100.0)
+        
+        compliance.reset_daily()
+        
+        assert set(compliance._buys_by_symbol) == {"NEW"}
+
+
+class TestGoodFaith:
+    """Tests for good faith violation detection."""
+    
+    @pytest.fixture
+    def compliance(self):
+        return ComplianceManager(account_type="cash", equity=10000, buying_power=10000)
+    
+    def test_selling_unsettled_shares_requires_confirmation(self, compliance):
+        compliance.record_trade("AAPL", "buy", 10, 100.0)
+        compliance.record_trade("MSFT", "buy", 10, 100.0)
+        
+        result = compliance.check_order("AAPL", "sell", 10, 101.0)
+        
+        assert result.action == ComplianceAction.CONFIRM
+        assert result.violations[0].details["unsettled_quantity"] == 10
+    
+    def test_settled_shares_sell_freely(self, compliance):
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=_last_weekday(10))
+        
+        assert compliance.check_order("AAPL", "sell", 10, 101.0).action == ComplianceAction.ALLOW
+
+
+class TestViolationHistory:
+    """Tests for bounded violation history."""
+    
+    def test_history_bounded(self):
+        class SmallHistory(ComplianceManager):
+            MAX_VIOLATION_HISTORY = 5
+        
+        compliance = SmallHistory(account_type="margin", equity=50000)
+        buy_time = _last_weekday(3)
+        for i in range(20):
+            compliance.record_trade(f"S{i}", "buy", 10, 100.0, timestamp=buy_time)
+            compliance.record_trade(f"S{i}", "sell", 10, 90.0)
+        
+        assert compliance.violation_count == 20
+        assert len(compliance._violations) == compliance.MAX_VIOLATION_HISTORY
+        assert len(compliance.get_status()["recent_violations"]) == 10
+        
+        latest = compliance.get_violations(limit=3)
+        assert [v["details"]["symbol"] for v in latest] == ["S17", "S18", "S19"]
+    
+    def test_violation_dicts_are_independent(self):
+        compliance = ComplianceManager(account_type="margin", equity=50000)
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=_last_weekday(3))
+        compliance.record_trade("AAPL", "sell", 10, 90.0)
+        
+        first = compliance.get_violations()[0]
+        first["title"] = "changed"
+        first["details"]["symbol"] = "MSFT"
+        
+        again = compliance.get_violations()[0]
+        assert again["title"] != "changed"
+        assert again["details"]["symbol"] == "AAPL"
+
+
+class TestUnsettledPositions:
+    """Tests for unsettled position expiry."""
+    
+    def test_settled_positions_expire(self):
+        compliance = ComplianceManager(account_type="cash", equity=10000)
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=_last_weekday(10))
+        compliance.record_trade("AAPL", "buy", 5, 100.0)
+        compliance.record_trade("MSFT", "buy", 5, 100.0, timestamp=_last_weekday(10))
+        
+        status = compliance.get_status()
+        assert status["settlement"]["unsettled_positions"] == 1
+        assert list(compliance._unsettled_by_symbol) == ["AAPL"]
+        assert [p.quantity for p in compliance._unsettled_by_symbol["AAPL"]] == [5]
+
+
+class TestStatus:
+    """Tests for get_status."""
+    
+    def test_status_tracks_account_changes(self):
+        compliance = ComplianceManager(account_type="margin", equity=10000)
+        status = compliance.get_status()
+        assert status["account_type"] == "margin"
+        assert status["pdt_status"]["remaining_day_trades"] == 3
+        
+        compliance.account_type = AccountType.CASH
+        compliance.update_account(equity=30000)
+        status = compliance.get_status()
+        assert status["account_type"] == "cash"
+        assert status["equity"] == 30000
+        assert status["pdt_status"]["meets_equity_requirement"] is True
+        assert status["pdt_status"]["remaining_day_trades"] is None
+    
+    def test_status_follows_replaced_clock(self):
+        compliance = ComplianceManager(account_type="margin", equity=10000)
+        today = datetime.now().date()
+        compliance._restricted_until = today + timedelta(days=1)
+        assert compliance.get_status()["restrictions"]["restricted"] is True
+        
+        later = datetime.now() + timedelta(days=2)
+        compliance._now = lambda: later
+        assert compliance.get_status()["restrictions"]["restricted"] is False
+    
+    def test_status_json_matches_status(self):
+        compliance = ComplianceManager(account_type="margin", equity=10000)
+        buy_time = _last_weekday(3)
+        compliance.record_trade("AAPL", "buy", 10, 100.0, timestamp=buy_time)
+        compliance.record_trade("AAPL", "sell", 10, 90.0)
+        
+        assert json.loads(compliance.get_status_json()) == json.loads(
+            json.dumps(compliance.get_status())
+        )
+
+
+class TestSingleton:
+    """Tests for the module-level compliance manager."""
+    
+    def test_reset_replaces_instance(self):
+        from src.compliance import get_compliance_manager, reset_compliance_manager
+        
+        manager = get_compliance_manager()
+        assert get_compliance_manager() is manager
+        
+        reset_compliance_manager()
+        assert get_compliance_manager() is not manager
+        assert isinstance(get_compliance_manager(), ComplianceManager)
@@ -218,3 +218,784 @@ class TestDataSourceRegistry:
         except AttributeError:
             # May use different method name
             pass
+
+
+class TestAInvestMockData:
+    """Tests for AInvest mock data generation (no API key)."""
+
+    @pytest.fixture
+    def ainvest(self):
+        from src.data_sources.ainvest import AInvestDataSource
+        source = AInvestDataSource(seed=42)
+        source.api_key = ""
+        return source
+
+    def test_mock_recommendations(self, ainvest):
+        recs = ainvest._generate_mock_recommendations(["AAPL", "NVDA"], 20)
+
+        assert len(recs) == 8  # at most 4 per symbol
+        assert [r.symbol for r in recs[:3]] == ["AAPL", "NVDA", "AAPL"]
+        for r in recs:
+            assert 55 <= r.ai_score <= 95
+            assert 1 <= len(r.signals) <= 4
+            assert len(set(r.signals)) == len(r.signals)
+            if r.ai_score >= 80:
+                assert r.recommendation in ("Strong Buy", "Buy")
+            elif r.ai_score >= 65:
+                assert r.recommendation in ("Buy", "Hold")
+            else:
+                assert r.recommendation == "Hold"
+
+    def test_mock_recommendations_limit(self, ainvest):
+        assert len(ainvest._generate_mock_recommendations(None, 5)) == 5
+        assert ainvest._generate_mock_recommendations(None, 0) == []
+
+    def test_recommendation_is_immutable(self, ainvest):
+        import dataclasses
+
+        rec = ainvest._generate_mock_recommendations(None, 1)[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rec.ai_score = 0
+
+    @pytest.mark.asyncio
+    async def test_connect_tracks_base_state(self, ainvest):
+        from src.data_sources.base import DataSourceType
+
+        assert ainvest.source_type is DataSourceType.AINVEST
+        assert await ainvest.connect() is True
+        assert ainvest.is_connected and ainvest.connected
+        await ainvest.disconnect()
+        assert not ainvest.is_connected
+
+    def test_parse_iso_column(self):
+        from src.data_sources.ainvest import _parse_iso_column
+
+        items = [
+            {"ts": "2024-01-02T09:30:00"},
+            {"ts": "2024-01-02T09:30:00+00:00"},
+            {"ts": "2024-01-02T09:30:00"},
+        ]
+        parsed = _parse_iso_column(items, "ts")
+
+        assert parsed[0] == datetime(2024, 1, 2, 9, 30)
+        assert parsed[1].tzinfo is not None
+        assert parsed[2] is parsed[0]
+
+    def test_json_decodes_response_bytes(self, ainvest):
+        import httpx
+
+        response = httpx.Response(200, content=b'{"earnings": [{"ticker": "AAPL"}]}')
+        assert ainvest._json(response) == {"earnings": [{"ticker": "AAPL"}]}
+
+    @pytest.mark.asyncio
+    async def test_http_client_shared_per_key(self):
+        from src.data_sources import ainvest as module
+
+        first = module._get_http_client("https://example.test", "key-a")
+        assert module._get_http_client("https://example.test", "key-a") is first
+        assert module._get_http_client("https://example.test", "key-b") is not first
+
+        await module.close_http_clients()
+        assert first.is_closed
+        assert module._get_http_client("https://example.test", "key-a") is not first
+        await module.close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_get_sentiments(self, ainvest):
+        sentiments = await ainvest.get_sentiments(["AAPL", "NVDA", "AAPL"])
+
+        assert set(sentiments) == {"AAPL", "NVDA"}
+        assert sentiments["NVDA"].symbol == "NVDA"
+
+
+class TestBaseDataSourceQuotes:
+    """Tests for BaseDataSource.get_quotes fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_get_quotes_concurrent_and_skips_failures(self):
+        import asyncio
+        from src.data_sources.base import BaseDataSource, DataSourceType, Quote
+
+        class FakeSource(BaseDataSource):
+            MAX_CONCURRENT_REQUESTS = 2
+
+            def __init__(self):
+                super().__init__(DataSourceType.POLYGON)
+                self.in_flight = 0
+                self.peak = 0
+
+            async def connect(self):
+                return True
+
+            async def disconnect(self):
+                pass
+
+            async def get_bars(self, symbol, timeframe="1d", start=None, end=None, limit=100):
+                return []
+
+            async def get_quote(self, symbol):
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                if symbol == "BAD":
+                    raise RuntimeError("boom")
+                if symbol == "NONE":
+                    return None
+                return Quote(symbol=symbol, bid=1.0, ask=1.1)
+
+        from loguru import logger
+
+        source = FakeSource()
+        warnings = []
+        handler = logger.add(warnings.append, level="WARNING")
+        try:
+            quotes = await source.get_quotes(["AAPL", "BAD", "NONE", "MSFT"])
+        finally:
+            logger.remove(handler)
+
+        assert list(quotes) == ["AAPL", "MSFT"]
+        assert source.peak == 2
+        assert len(warnings) == 1 and "BAD" in warnings[0] and "boom" in warnings[0]
+
+
+class TestAInvestResponseCache:
+    """Tests for the AInvest TTL caches in front of the API."""
+
+    @pytest.fixture
+    def ainvest(self):
+        import httpx
+        import orjson
+        from src.data_sources.ainvest import AInvestDataSource
+
+        for cache in (
+            AInvestDataSource._sentiment_cache,
+            AInvestDataSource._recommendation_cache,
+            AInvestDataSource._earnings_cache,
+        ):
+            cache.clear()
+
+        payload = {
+            "overall_sentiment": 0.4,
+            "news_sentiment": 0.3,
+            "social_sentiment": 0.5,
+            "analyst_sentiment": 0.2,
+            "last_updated": "2024-01-02T09:30:00",
+            "earnings": [{"ticker": "AAPL"}],
+        }
+        source = AInvestDataSource()
+        source.api_key = "test-key"
+        source._connected = True
+        source.http_client = MagicMock()
+        source.http_client.get = AsyncMock(side_effect=lambda path, **kw: httpx.Response(
+            200,
+            content=orjson.dumps(payload),
+            request=httpx.Request("GET", "https://example.test" + str(path)),
+        ))
+        yield source
+        AInvestDataSource._sentiment_cache.clear()
+        AInvestDataSource._earnings_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_sentiment_cached_per_symbol(self, ainvest):
+        first = await ainvest.get_sentiment("AAPL")
+        assert await ainvest.get_sentiment("AAPL") is first
+        await ainvest.get_sentiment("MSFT")
+
+        assert first.overall_sentiment == 0.4
+        assert ainvest.http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_scoped_to_credentials(self, ainvest):
+        from src.data_sources.ainvest import AInvestDataSource
+
+        await ainvest.get_sentiment("AAPL")
+        other = AInvestDataSource()
+        other.api_key = "other-key"
+        other._connected = True
+        other.http_client = ainvest.http_client
+        await other.get_sentiment("AAPL")
+
+        assert ainvest.http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_earnings_cached_by_day(self, ainvest):
+        start = datetime(2024, 1, 2, 9, 30)
+        first = await ainvest.get_earnings_calendar(start_date=start)
+        again = await ainvest.get_earnings_calendar(start_date=start + timedelta(hours=1))
+
+        assert first == again == [{"ticker": "AAPL"}]
+        again.clear()
+        assert await ainvest.get_earnings_calendar(start_date=start) == first
+        assert ainvest.http_client.get.await_count == 1
+
+
+class TestAInvestMockGenerators:
+    """Tests for the vectorized AInvest mock generators."""
+
+    @pytest.fixture
+    def ainvest(self):
+        from src.data_sources.ainvest import AInvestDataSource
+        return AInvestDataSource()
+
+    def test_mock_news(self, ainvest):
+        news = ainvest._generate_mock_news(["AAPL"], 5)
+
+        assert len(news) == 5
+        assert all(a.symbols == ["AAPL"] and "AAPL" in a.title for a in news)
+        assert news[3].url == "https://ainvest.com/news/aapl-3"
+
+    def test_mock_signals(self, ainvest):
+        signals = ainvest._generate_mock_signals(10)
+
+        assert len(signals) == 10
+        for s in signals:
+            assert 100 <= s.price <= 600
+            assert s.target_price == pytest.approx(s.price * 1.15, abs=0.01)
+            assert s.stop_loss == pytest.approx(s.price * 0.95, abs=0.01)
+
+    def test_mock_insider_trades(self, ainvest):
+        trades = ainvest._generate_mock_insider_trades(10)
+
+        assert len(trades) == 10
+        for t in trades:
+            assert isinstance(t.shares, int)
+            assert t.transaction_type in ("buy", "sell")
+            assert t.value == pytest.approx(t.shares * t.price, abs=0.01)
+
+    def test_mock_earnings_json_ready(self, ainvest):
+        import json
+
+        earnings = ainvest._generate_mock_earnings(12)
+
+        assert [e["ticker"] for e in earnings[:2]] == ["NVDA", "AAPL"]
+        assert earnings[10]["ticker"] == "NVDA"
+        json.dumps(earnings)
+
+    def test_seeded_mocks_reproducible(self):
+        from src.data_sources.ainvest import AInvestDataSource
+
+        def draw(source):
+            recs = source._generate_mock_recommendations(None, 10)
+            sentiment = source._generate_mock_sentiment("AAPL")
+            return [(r.ai_score, r.signals) for r in recs], sentiment.overall_sentiment
+
+        assert draw(AInvestDataSource(seed=7)) == draw(AInvestDataSource(seed=7))
+        assert draw(AInvestDataSource(seed=7)) != draw(AInvestDataSource(seed=8))
+
+
+class TestRecordSerialization:
+    """Tests for the hand-written to_dict/to_tuple methods."""
+
+    def test_to_dict_matches_asdict(self):
+        import dataclasses
+        from src.data_sources.base import Quote, Bar, TradingSignal
+        from src.data_sources.ainvest import AInvestDataSource
+
+        ts = datetime(2024, 1, 2, 9, 30)
+        source = AInvestDataSource()
+        records = [
+            Quote(symbol="AAPL", bid=1.0, ask=1.1, timestamp=ts),
+            Bar(symbol="AAPL", timestamp=ts, open=1, high=2, low=0.5, close=1.5, volume=10),
+            TradingSignal(symbol="AAPL", signal_type="buy", strength=0.8, source="x", price=1.0, timestamp=ts),
+            *source._generate_mock_insider_trades(1),
+            *source._generate_mock_news(["AAPL"], 1),
+            *source._generate_mock_recommendations(["AAPL"], 1),
+            source._generate_mock_sentiment("AAPL"),
+        ]
+        for record in records:
+            expected = dataclasses.asdict(record)
+            for key, value in expected.items():
+                if isinstance(value, datetime):
+                    expected[key] = value.isoformat()
+                elif hasattr(value, "value"):
+                    expected[key] = value.value
+            assert record.to_dict() == expected
+
+    def test_to_tuple(self):
+        import dataclasses
+        from src.data_sources.base import Quote, Bar
+
+        ts = datetime(2024, 1, 2, 9, 30)
+        quote = Quote(symbol="AAPL", bid=1.0, ask=1.1, timestamp=ts)
+        bar = Bar(symbol="AAPL", timestamp=ts, open=1, high=2, low=0.5, close=1.5, volume=10)
+
+        assert quote.to_tuple() == dataclasses.astuple(quote)
+        assert bar.to_tuple() == dataclasses.astuple(bar)
+
+
+class TestAInvestResponseParsing:
+    """Tests for building records from AInvest API payloads."""
+
+    @pytest.fixture
+    def make_source(self):
+        import httpx
+        import orjson
+        from src.data_sources.ainvest import AInvestDataSource
+
+        def make(payload):
+            source = AInvestDataSource()
+            source.api_key = "test-key"
+            source._connected = True
+            source.http_client = MagicMock()
+            source.http_client.get = AsyncMock(return_value=httpx.Response(
+                200,
+                content=orjson.dumps(payload),
+                request=httpx.Request("GET", "https://example.test"),
+            ))
+            return source
+        return make
+
+    @pytest.mark.asyncio
+    async def test_news(self, make_source):
+        source = make_source({"articles": [{
+            "title": "Headline", "url": "https://x", "published_at": "2024-01-02T09:30:00",
+            "sentiment": 0.4, "symbols": ["AAPL"], "content": "Body",
+        }]})
+        [article] = await source.get_news(limit=1)
+
+        assert (article.title, article.summary, article.source) == ("Headline", "Body", "AInvest")
+        assert article.published == datetime(2024, 1, 2, 9, 30)
+        assert article.symbols == ["AAPL"] and article.sentiment == 0.4
+
+    @pytest.mark.asyncio
+    async def test_insider_trades(self, make_source):
+        source = make_source({"trades": [{
+            "ticker": "AAPL", "insider_name": "Jane Doe", "relation": "CFO", "trade_type": "buy",
+            "value": 1000.0, "shares": 10, "trade_date": "2024-01-02", "filing_date": "2024-01-04",
+        }]})
+        [trade] = await source.get_insider_trades(limit=1)
+
+        assert (trade.symbol, trade.title, trade.transaction_type) == ("AAPL", "CFO", "buy")
+        assert trade.shares == 10 and trade.value == 1000.0
+        assert trade.transaction_date == datetime(2024, 1, 2)
+        assert trade.filing_date == datetime(2024, 1, 4)
+        assert trade.source == "SEC"
+
+    @pytest.mark.asyncio
+    async def test_signals(self, make_source):
+        source = make_source({"signals": [{
+            "symbol": "AAPL", "signal_type": "buy", "price": 10.0, "timestamp": "2024-01-02T09:30:00",
+        }]})
+        [signal] = await source.get_trading_signals(limit=1)
+
+        assert (signal.symbol, signal.signal_type, signal.source) == ("AAPL", "buy", "AInvest")
+        assert signal.price == 10.0 and signal.strength == 0.7 and signal.timeframe == "1d"
+
+    @pytest.mark.asyncio
+    async def test_http_error_falls_back_to_mock(self):
+        import httpx
+        from src.data_sources.ainvest import AInvestDataSource
+
+        source = AInvestDataSource()
+        source.api_key = "test-key"
+        source._connected = True
+        source.http_client = httpx.AsyncClient(
+            base_url="https://example.test",
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        )
+        signals = await source.get_trading_signals(limit=3)
+        news = await source.get_news(limit=2)
+        await source.http_client.aclose()
+
+        assert len(signals) == 3 and signals[0].source == "AInvest AI"
+        assert len(news) == 2
+
+    @pytest.mark.asyncio
+    async def test_malformed_body_falls_back_to_mock(self, make_source):
+        source = make_source([1, 2, 3])
+
+        assert len(await source.get_insider_trades(limit=2)) == 2
+
+
+class TestAInvestRecommendationStream:
+    """Tests for AInvestDataSource.iter_ai_recommendations."""
+
+    ITEM = {
+        "symbol": "AAPL", "company": "Apple", "ai_score": 80, "recommendation": "Buy",
+        "target_price": 200.0, "current_price": 180.0, "upside_pct": 11.1,
+        "analysis_date": "2024-01-02T09:30:00",
+    }
+
+    def make_source(self, response):
+        import httpx
+        from src.data_sources.ainvest import AInvestDataSource
+
+        source = AInvestDataSource()
+        source.api_key = "test-key"
+        source._connected = True
+        source.http_client = httpx.AsyncClient(
+            base_url="https://example.test",
+            transport=httpx.MockTransport(lambda request: response),
+        )
+        return source
+
+    @pytest.mark.asyncio
+    async def test_ndjson(self):
+        import httpx
+        import orjson
+
+        lines = b"\n".join(orjson.dumps({**self.ITEM, "symbol": s}) for s in ("AAPL", "MSFT")) + b"\n"
+        source = self.make_source(httpx.Response(
+            200, content=lines, headers={"content-type": "application/x-ndjson"},
+        ))
+        recs = [r async for r in source.iter_ai_recommendations()]
+        await source.http_client.aclose()
+
+        assert [r.symbol for r in recs] == ["AAPL", "MSFT"]
+        assert recs[0].analysis_date == datetime(2024, 1, 2, 9, 30)
+
+    @pytest.mark.asyncio
+    async def test_json_body(self):
+        import httpx
+
+        source = self.make_source(httpx.Response(200, json={"recommendations": [self.ITEM]}))
+        recs = [r async for r in source.iter_ai_recommendations()]
+        await source.http_client.aclose()
+
+        assert [(r.symbol, r.confidence) for r in recs] == [("AAPL", 75)]
+
+    @pytest.mark.asyncio
+    async def test_mock_without_key(self):
+        from src.data_sources.ainvest import AInvestDataSource
+
+        source = AInvestDataSource()
+        source.api_key = ""
+        recs = [r async for r in source.iter_ai_recommendations(["AAPL"], limit=3)]
+
+        assert [r.symbol for r in recs] == ["AAPL"] * 3
+
+
+def _yf_frame(closes):
+    """Build a yf.download(group_by="ticker") style frame from {symbol: [close, ...]}."""
+    import pandas as pd
+
+    index = pd.date_range("2024-01-02", periods=max(len(c) for c in closes.values()))
+    columns = {}
+    for symbol, values in closes.items():
+        values = list(values) + [float("nan")] * (len(index) - len(values))
+        for field in ("Open", "High", "Low", "Close", "Volume"):
+            scale = {"High": 1.01, "Low": 0.99, "Volume": 1000}.get(field, 1)
+            columns[(symbol, field)] = [v * scale for v in values]
+    return pd.DataFrame(columns, index=index)
+
+
+class TestCommodityDataSource:
+    """Tests for CommodityDataSource price fetching (yfinance patched)."""
+
+    @pytest.fixture
+    def source(self):
+        from src.data_sources.commodities import CommodityDataSource
+        return CommodityDataSource()
+
+    @pytest.fixture
+    def download(self, monkeypatch):
+        import yfinance as yf
+
+        calls = []
+
+        def fake_download(tickers, **kwargs):
+            calls.append(list(tickers))
+            return _yf_frame({s: [100.0, 102.0] for s in tickers if s != "MISSING"})
+
+        monkeypatch.setattr(yf, "download", fake_download)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_prices_from_batch_download(self, source, download):
+        prices = await source.get_commodity_prices(
+            symbols=["GLD", "CL=F", "MISSING"], allow_unknown=True
+        )
+
+        assert download == [["GLD", "CL=F", "MISSING"]]
+        assert [p.symbol for p in prices] == ["GLD", "CL=F"]
+        gld = prices[0]
+        assert gld.name == "SPDR Gold Trust"
+        assert gld.price == 102.0 and gld.change == pytest.approx(2.0)
+        assert gld.change_pct == pytest.approx(2.0)
+        assert gld.high_24h == pytest.approx(102.0 * 1.01)
+
+    @pytest.mark.asyncio
+    async def test_single_symbol_download(self, source, download, monkeypatch):
+        import yfinance as yf
+
+        prices = await source.get_commodity_prices(symbols=["GLD"])
+        assert [p.symbol for p in prices] == ["GLD"]
+
+        # yfinance < 0.2.48 returns flat columns when one ticker is requested
+        flat = _yf_frame({"SLV": [20.0, 21.0]})["SLV"]
+        monkeypatch.setattr(yf, "download", lambda tickers, **kwargs: flat)
+        prices = await source.get_commodity_prices(symbols=["SLV"])
+        assert [p.symbol for p in prices] == ["SLV"]
+        assert prices[0].price == 21.0
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbols_not_requested(self, source, download):
+        prices = await source.get_commodity_prices(symbols=["GLD", "NOPE"])
+
+        assert download == [["GLD"]]
+        assert [p.symbol for p in prices] == ["GLD"]
+        assert await source.get_commodity_prices(symbols=["NOPE"]) == []
+        assert len(download) == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_fetched_concurrently(self, source, monkeypatch):
+        import threading
+        import time
+        import yfinance as yf
+        from src.data_sources.commodities import COMMODITY_FUTURES, COMMODITY_ETFS
+
+        threads = set()
+
+        def fake_download(tickers, **kwargs):
+            threads.add(threading.get_ident())
+            time.sleep(0.05)
+            if "GC=F" in tickers:
+                raise RuntimeError("rate limited")
+            return _yf_frame({s: [10.0] for s in tickers})
+
+        monkeypatch.setattr(yf, "download", fake_download)
+        prices = await source.get_commodity_prices()
+
+        total = len(COMMODITY_FUTURES) + len(COMMODITY_ETFS)
+        assert len(prices) == total - 20  # the failed first batch is skipped
+        assert len(threads) == 3
+
+    @pytest.mark.asyncio
+    async def test_prices_cached_until_invalidated(self, source, download):
+        from src.data_sources.commodities import CommodityCategory
+
+        metals = await source.get_commodity_prices(category=CommodityCategory.PRECIOUS_METALS)
+        again = await source.get_commodity_prices(category=CommodityCategory.PRECIOUS_METALS)
+        subset = await source.get_commodity_prices(symbols=["GLD", "SLV"])
+
+        assert len(download) == 1
+        assert [p.symbol for p in again] == [p.symbol for p in metals]
+        assert [p.symbol for p in subset] == ["GLD", "SLV"]
+
+        source.invalidate(category=CommodityCategory.PRECIOUS_METALS)
+        await source.get_commodity_prices(symbols=["GLD"])
+        assert download[-1] == ["GLD"]
+
+        source.invalidate_all()
+        await source.get_commodity_prices(category=CommodityCategory.PRECIOUS_METALS)
+        assert len(download) == 3
+
+    @pytest.mark.asyncio
+    async def test_prices_persisted_across_instances(self, source, download, monkeypatch):
+        from src.data_sources.commodities import CommodityDataSource
+
+        class FakeRedisCache:
+            def __init__(self):
+                self.store = {}
+
+            async def get_json(self, key):
+                return self.store.get(key)
+
+            async def set_json(self, key, value, expire_seconds=None):
+                self.store[key] = value
+                return True
+
+        fake = FakeRedisCache()
+        monkeypatch.setattr("src.data.redis_cache.get_redis_cache", lambda: fake)
+
+        prices = await source.get_commodity_prices(symbols=["GLD", "CL=F"])
+        restarted = CommodityDataSource()
+        warm = await restarted.get_commodity_prices(symbols=["GLD", "CL=F"])
+
+        assert len(download) == 1
+        assert warm == prices
+
+        restarted.invalidate(symbols=["GLD", "CL=F"])
+        await restarted.get_commodity_prices(symbols=["GLD", "CL=F"])
+        assert len(download) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_expires(self, source, download):
+        await source.get_commodity_prices(symbols=["GLD"])
+        source._cache_ttl = 0
+        await source.get_commodity_prices(symbols=["GLD"])
+
+        assert len(download) == 2
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_warms_cache(self, source, download):
+        import asyncio
+        from src.data_sources.commodities import CommodityCategory
+
+        assert await source.connect() is True
+        task = source._refresh_task
+        await source.connect()
+        assert source._refresh_task is task
+
+        for _ in range(100):
+            if source._last_update is not None:
+                break
+            await asyncio.sleep(0.01)
+        energy = await source.get_commodity_prices(category=CommodityCategory.ENERGY)
+        await source.disconnect()
+
+        assert len(download) == 3  # the full refresh only, in three batches
+        assert energy and all(p.category == CommodityCategory.ENERGY for p in energy)
+        assert task.cancelled() and source._refresh_task is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_category_after_full_refresh(self, source, download):
+        from src.data_sources.commodities import COMMODITIES_BY_CATEGORY, CommodityCategory
+
+        await source.get_commodity_prices(refresh=True)
+        fetches = len(download)
+        source.invalidate(category=CommodityCategory.ENERGY)
+        await source.get_commodity_prices(category=CommodityCategory.ENERGY)
+
+        assert download[fetches:] == [list(COMMODITIES_BY_CATEGORY[CommodityCategory.ENERGY])]
+
+        source.invalidate()
+        await source.get_commodity_prices(category=CommodityCategory.NUCLEAR)
+        assert len(download) == fetches + 2
+
+    @pytest.mark.asyncio
+    async def test_missing_volume_and_trailing_gap(self, source, monkeypatch):
+        import yfinance as yf
+
+        def fake_download(tickers, **kwargs):
+            # GLD has no bar on the last row; URA has no Volume column
+            frame = _yf_frame({"GLD": [100.0, 101.0], "URA": [20.0, 21.0, 22.0]})
+            return frame.drop(columns=[("URA", "Volume")])
+
+        monkeypatch.setattr(yf, "download", fake_download)
+        prices = {p.symbol: p for p in await source.get_commodity_prices(symbols=["GLD", "URA"])}
+
+        assert prices["GLD"].price == 101.0 and prices["GLD"].change == pytest.approx(1.0)
+        assert prices["GLD"].volume == pytest.approx(101000.0)
+        assert prices["URA"].price == 22.0 and prices["URA"].volume == 0
+        assert type(prices["URA"].change) is float
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_batch_retried(self, source, monkeypatch):
+        import yfinance as yf
+        from tenacity import wait_none
+
+        attempts = []
+
+        def fake_download(tickers, **kwargs):
+            attempts.append(list(tickers))
+            if len(attempts) == 1:
+                raise yf.exceptions.YFRateLimitError()
+            return _yf_frame({s: [10.0] for s in tickers})
+
+        monkeypatch.setattr(yf, "download", fake_download)
+        monkeypatch.setattr("src.data_sources.commodities.wait_exponential", lambda **kw: wait_none())
+        prices = await source.get_commodity_prices(symbols=["GLD"])
+
+        assert len(attempts) == 2
+        assert [p.symbol for p in prices] == ["GLD"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_without_rate_limit_error_class(self, source, monkeypatch):
+        import yfinance as yf
+
+        attempts = []
+
+        def fake_download(tickers, **kwargs):
+            attempts.append(list(tickers))
+            raise RuntimeError("boom")
+
+        # yfinance < 0.2.52 has no YFRateLimitError: fetch normally, no retries
+        monkeypatch.setattr("src.data_sources.commodities._YF_RATE_LIMIT_ERROR", None)
+        monkeypatch.setattr(yf, "download", fake_download)
+        assert await source.get_commodity_prices(symbols=["GLD"]) == []
+        assert len(attempts) == 1
+
+        monkeypatch.setattr(yf, "download", lambda tickers, **kwargs: _yf_frame({"GLD": [10.0]}))
+        prices = await source.get_commodity_prices(symbols=["GLD"])
+        assert [p.symbol for p in prices] == ["GLD"]
+
+
+class TestTokenBucket:
+    """Tests for the commodity source's request pacing."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        import time
+        from src.data_sources.commodities import _TokenBucket
+
+        bucket = _TokenBucket(rate=100, capacity=5)
+        start = time.monotonic()
+        await bucket.acquire(5)
+        await bucket.acquire(50)  # capped at capacity
+        await bucket.acquire(2)
+        elapsed = time.monotonic() - start
+
+        assert 0.06 <= elapsed < 0.5
+
+
+class TestCommodityMockData:
+    """Tests for the commodity demo fallbacks."""
+
+    @pytest.fixture
+    def source(self):
+        from src.data_sources.commodities import CommodityDataSource
+        return CommodityDataSource()
+
+    def test_mock_prices_by_category(self, source):
+        from src.data_sources.commodities import CommodityCategory
+
+        energy = source._get_mock_prices(CommodityCategory.ENERGY)
+
+        assert [p.symbol for p in energy] == ["USO", "UNG", "XLE"]
+        assert len(source._get_mock_prices()) == 14
+        for p in energy:
+            assert abs(p.change_pct) <= 3
+
+    @pytest.mark.asyncio
+    async def test_seeded_mocks_are_reproducible(self):
+        from src.data_sources.commodities import CommodityDataSource
+
+        a, b = CommodityDataSource(seed=7), CommodityDataSource(seed=7)
+
+        assert [p.price for p in a._get_mock_prices()] == [p.price for p in b._get_mock_prices()]
+        news_a = await a.get_commodity_news(limit=5)
+        news_b = await b.get_commodity_news(limit=5)
+        assert [(n.source, n.sentiment) for n in news_a] == [(n.source, n.sentiment) for n in news_b]
+        assert all(isinstance(p.volume, int) for p in a._get_mock_prices())
+
+    @pytest.mark.asyncio
+    async def test_news_filtered_by_commodity(self, source):
+        news = await source.get_commodity_news(commodities=["energy"], limit=20)
+
+        assert len(news) == 5
+        assert all(n.commodities == ["energy"] for n in news)
+
+    @pytest.mark.asyncio
+    async def test_news_limit_counts_matches(self, source):
+        news = await source.get_commodity_news(commodities=["energy"], limit=2)
+
+        assert len(news) == 2
+        assert all(n.commodities == ["energy"] for n in news)
+        assert await source.get_commodity_news(limit=0) == []
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_yfinance(self, source, monkeypatch):
+        from src.data_sources.commodities import CommodityCategory
+
+        monkeypatch.setattr("src.data_sources.commodities.yf", None)
+        prices = await source.get_commodity_prices(category=CommodityCategory.NUCLEAR)
+
+        assert [p.symbol for p in prices] == ["URA"]
+
+    def test_supported_commodities_is_shared_and_read_only(self, source):
+        supported = source.get_supported_commodities()
+
+        assert supported is source.get_supported_commodities()
+        assert "GC=F" in supported["futures"]
+        assert "nuclear" in supported["categories"]
+        with pytest.raises(TypeError):
+            supported["futures"]["XX=F"] = {}
+
+    def test_cached_prices_are_immutable(self, source):
+        import dataclasses
+
+        price = source._get_mock_prices()[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            price.price = 0.0
@@ -0,0 +1,101 @@
+"""Tests for the global exchange configuration."""
+
+import dataclasses
+
+import pytest
+
+from src.config.exchanges import (
+    ALL_EXCHANGES,
+    Currency,
+    Exchange,
+    LSE,
+    NYSE,
+    TOKYO,
+    TAIWAN,
+    ExchangeRegion,
+    detect_exchange_from_symbol,
+    detect_exchanges_batch,
+    get_all_supported_exchanges,
+    get_exchanges_by_region,
+)
+
+
+class TestExchange:
+    """Tests for the Exchange record."""
+    
+    def test_exchange_is_immutable(self):
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            LSE.suffix = ".X"
+    
+    def test_exchange_is_hashable(self):
+        by_exchange = {ex: code for code, ex in ALL_EXCHANGES.items()}
+        
+        assert by_exchange[LSE] == "LSE"
+    
+    def test_region_and_currency_canonicalized(self):
+        exchange = Exchange(
+            code="TEST",
+            name="Test Exchange",
+            country="Nowhere",
+            region="europe",
+            currency="EUR",
+            timezone="UTC",
+        )
+        assert exchange.region is ExchangeRegion.EUROPE
+        assert exchange.currency is Currency.EUR
+
+
+class TestDetectExchange:
+    """Tests for suffix-based exchange detection."""
+    
+    @pytest.mark.parametrize("symbol,expected", [
+        ("VOD.L", LSE),
+        ("vod.l", LSE),
+        ("7203.T", TOKYO),
+        ("2330.TW", TAIWAN),
+        ("AAPL", NYSE),
+    ])
+    def test_detect(self, symbol, expected):
+        assert detect_exchange_from_symbol(symbol) is expected
+    
+    def test_detect_batch_matches_single(self):
+        symbols = ["VOD.L", "vod.l", "7203.T", "2330.TW", "AAPL", "X"]
+        
+        assert detect_exchanges_batch(symbols) == [
+            detect_exchange_from_symbol(symbol) for symbol in symbols
+        ]
+        assert detect_exchanges_batch([]) == []
+
+
+class TestRegistryQueries:
+    """Tests for precomputed registry lookups."""
+    
+    def test_exchanges_by_region(self):
+        europe = get_exchanges_by_region(ExchangeRegion.EUROPE)
+        
+        assert LSE in europe
+        assert all(ex.region is ExchangeRegion.EUROPE for ex in europe)
+    
+    def test_all_supported_exchanges(self):
+        supported = get_all_supported_exchanges()
+        
+        assert supported == tuple(ex for ex in ALL_EXCHANGES.values() if ex.is_supported)
+        assert len(supported) < len(ALL_EXCHANGES)
+
+
+class TestFormatSymbol:
+    """Tests for exchange symbol formatting."""
+    
+    def test_adds_suffix(self):
+        assert LSE.format_symbol("VOD") == "VOD.L"
+    
+    def test_existing_suffix_any_case_kept(self):
+        assert LSE.format_symbol("VOD.L") == "VOD.L"
+        assert LSE.format_symbol("vod.l") == "vod.l"
+    
+    def test_no_suffix_exchange(self):
+        assert NYSE.format_symbol("AAPL") == "AAPL"
+    
+    def test_format_symbols_batch(self):
+        assert LSE.format_symbols(["VOD", "BP.L", "hsba"]) == ["VOD.L", "BP.L", "hsba.L"]
+        assert NYSE.format_symbols(("AAPL",)) == ["AAPL"]
@@ -0,0 +1,94 @@
+"""Tests for the Redis cache record encodings."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import orjson
+import pandas as pd
+import pytest
+
+from src.data.redis_cache import _pack_columns, _pack_price, _unpack_columns, _unpack_price
+
+
+class TestPriceRecord:
+    """Tests for the packed market price record."""
+    
+    def test_round_trip(self):
+        raw = _pack_price(101.5, None, 101.6, None, 12.0)
+        
+        assert _unpack_price(raw) == {
+            "price": 101.5,
+            "bid": None,
+            "ask": 101.6,
+            "volume": None,
+            "timestamp": 12.0,
+        }
+    
+    def test_legacy_json_value_is_a_miss(self):
+        legacy = orjson.dumps({"price": 101.5, "bid": None, "ask": None, "volume": None})
+        
+        assert _unpack_price(legacy) is None
+        assert _unpack_price(None) is None
+
+
+class TestColumnRecord:
+    """Tests for the compressed column-wise OHLCV encoding."""
+    
+    def test_round_trip(self):
+        rows = [{"close": 1.0, "volume": 10}, {"close": 2.0, "volume": 20}]
+        
+        assert _unpack_columns(_pack_columns(rows)) == {"close": [1.0, 2.0], "volume": [10, 20]}
+    
+    def test_legacy_row_json_is_a_miss(self):
+        legacy = orjson.dumps([{"close": 1.0, "volume": 10}])
+        
+        assert _unpack_columns(legacy) is None
+        assert _unpack_columns(None) is None
+
+
+class TestHistoricalBarsCache:
+    """Tests for historical bars served from the OHLCV cache."""
+    
+    @pytest.mark.asyncio
+    async def test_cached_bars_match_fresh_bars(self):
+        from src.data.market_data import MarketDataManager
+        from src.data.redis_cache import RedisCache
+        
+        class FakeBinaryClient:
+            def __init__(self):
+                self.store = {}
+            
+            async def get(self, key):
+                return self.store.get(key)
+            
+            async def set(self, key, value, ex=None):
+                self.store[key] = value
+        
+        class FakeIBKR:
+            def create_stock_contract(self, symbol):
+                return symbol
+            
+            async def qualify_contract(self, contract):
+                return contract
+            
+            async def get_historical_data(self, contract, duration, bar_size):
+                return [
+                    SimpleNamespace(date=datetime(2024, 1, day), open=1.0, high=2.0,
+                                    low=0.5, close=1.5, volume=100)
+                    for day in (2, 3)
+                ]
+        
+        class FakeDB:
+            async def insert_ohlcv_bar(self, **kwargs):
+                pass
+        
+        cache = RedisCache()
+        cache._binary_client = FakeBinaryClient()
+        manager = MarketDataManager(FakeIBKR(), cache, FakeDB())
+        
+        fresh = await manager.get_historical_bars("AAPL")
+        cached = await manager.get_historical_bars("AAPL")
+        
+        assert cache._binary_client.store
+        pd.testing.assert_frame_equal(cached, fresh)
+        assert isinstance(cached.index, pd.DatetimeIndex)